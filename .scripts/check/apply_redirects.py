@@ -3,13 +3,17 @@
 根据 check_redirect_result.json 的重定向结果，自动替换文档中的旧链接。
 
 将 redirected: true 且 status_code: 200 的 original_url 替换为 url_path。
+本地规则解析但未验证最终页面的结果（verified: false）不会被应用。
+
+所有 original_url 编译为一个正则，每个文件只扫描一遍；
+一个 URL 是另一个的前缀时，取最长的匹配（如 /article/12 不会被 /article/1 的规则替换）。
 """
 
 import json
 import re
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Pattern, Tuple
 
 
 def load_redirect_results(result_file: str) -> List[Dict]:
@@ -25,9 +29,13 @@ def load_redirect_results(result_file: str) -> List[Dict]:
     with open(result_file, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    # 过滤：redirected=true 且 status_code=200
+    # 过滤：redirected=true 且 status_code=200，跳过未验证的本地解析结果
     replacements = []
+    unverified = 0
     for item in data.get("urls", []):
+        if item.get("verified") is False:
+            unverified += 1
+            continue
         if item.get("redirected") and item.get("status_code") == 200:
             replacements.append({
                 "original_url": item["original_url"],
@@ -35,6 +43,8 @@ def load_redirect_results(result_file: str) -> List[Dict]:
                 "count": item.get("count", 0)
             })
 
+    if unverified:
+        print(f"跳过 {unverified} 个未验证的本地解析结果（check_redirects.py --offline 生成）")
     return replacements
 
 
@@ -51,10 +61,56 @@ def find_mdx_files(root_dir: Path) -> List[Path]:
     return list(root_dir.rglob("*.mdx"))
 
 
+def build_url_pattern(urls: List[str]) -> Pattern:
+    """
+    将一组 URL 编译为一个正则（按字符构建前缀树，公共前缀只匹配一次）。
+
+    同一位置上可选分支按"更长优先"匹配，因此总是命中最长的 URL。
+    """
+    trie: Dict = {}
+    for url in urls:
+        node = trie
+        for ch in url:
+            node = node.setdefault(ch, {})
+        node[None] = True
+
+    def build(node: Dict) -> str:
+        # 只有一个子节点的链在循环中展开，只在分支点递归：递归深度是路径上分支点的个数，而不是 URL 长度
+        parts = []
+        while True:
+            children = [ch for ch in node if ch is not None]
+            is_end = None in node
+            if len(children) == 1 and not is_end:
+                parts.append(re.escape(children[0]))
+                node = node[children[0]]
+                continue
+            if children:
+                branches = "|".join(re.escape(ch) + build(node[ch]) for ch in sorted(children))
+                parts.append(f"(?:{branches})?" if is_end else f"(?:{branches})")
+            return "".join(parts)
+
+    return re.compile(build(trie))
+
+
+def compile_replacements(replacements: List[Dict]) -> Tuple[Optional[Pattern], Dict[str, str]]:
+    """
+    编译替换规则，返回 (匹配所有 original_url 的正则, {original_url: url_path})。
+
+    同一 original_url 出现多次时以第一条为准；没有规则时正则为 None。
+    """
+    targets: Dict[str, str] = {}
+    for item in replacements:
+        if item["original_url"]:
+            targets.setdefault(item["original_url"], item["url_path"])
+    pattern = build_url_pattern(list(targets)) if targets else None
+    return pattern, targets
+
+
 def replace_urls_in_file(
     file_path: Path,
     replacements: List[Dict],
-    dry_run: bool = False
+    dry_run: bool = False,
+    compiled: Tuple[Optional[Pattern], Dict[str, str]] = None
 ) -> Dict[str, int]:
     """
     在单个文件中替换 URL。
@@ -63,31 +119,31 @@ def replace_urls_in_file(
         file_path: 文件路径
         replacements: 替换规则列表
         dry_run: 是否只预览不实际修改
+        compiled: compile_replacements 的结果（批量处理时传入，避免每个文件重复编译）
 
     Returns:
         替换统计信息
     """
+    pattern, targets = compiled or compile_replacements(replacements)
+    stats = {"total_replaced": 0, "by_url": {}}
+    if pattern is None:
+        return stats
+
     with open(file_path, "r", encoding="utf-8") as f:
         content = f.read()
 
-    original_content = content
-    stats = {"total_replaced": 0, "by_url": {}}
-
-    for item in replacements:
-        original_url = item["original_url"]
-        url_path = item["url_path"]
+    counts: Dict[str, int] = {}
 
-        # 统计原始 URL 出现次数
-        count = content.count(original_url)
-        if count > 0:
-            # 直接字符串替换（完全匹配）
-            new_content = content.replace(original_url, url_path)
+    def replace(match):
+        url = match.group(0)
+        counts[url] = counts.get(url, 0) + 1
+        return targets[url]
 
-            if new_content != content:
-                actual_replaced = content.count(original_url)
-                stats["total_replaced"] += actual_replaced
-                stats["by_url"][original_url] = actual_replaced
-                content = new_content
+    content = pattern.sub(replace, content)
+    if counts:
+        # 按规则顺序输出各 URL 的替换次数
+        stats["by_url"] = {url: counts[url] for url in targets if url in counts}
+        stats["total_replaced"] = sum(counts.values())
 
     # 如果有替换且不是 dry_run，写回文件
     if stats["total_replaced"] > 0 and not dry_run:
@@ -150,8 +206,9 @@ def apply_replacements(
     }
 
     # 处理每个文件
+    compiled = compile_replacements(replacements)
     for file_path in mdx_files:
-        stats = replace_urls_in_file(file_path, replacements, dry_run)
+        stats = replace_urls_in_file(file_path, replacements, dry_run, compiled)
 
         if stats["total_replaced"] > 0:
             total_stats["files_modified"] += 1
@@ -184,7 +241,7 @@ def apply_replacements(
         print("各 URL 替换次数:")
         for url, count in sorted(total_stats["by_url"].items(), key=lambda x: -x[1]):
             # 找到对应的替换目标
-            target = next((r["url_path"] for r in replacements if r["original_url"] == url), "?")
+            target = compiled[1].get(url, "?")
             print(f"  {url} → {target}")
             print(f"    替换: {count} 处")
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+extract_links_from_file 基准测试
+
+默认选取仓库中体积最大的 api-reference 文件，多次运行链接提取并统计耗时；
+指定 --baseline-rev 时会从该 git 版本加载 check_links.py 作为对照，
+同时校验两者在这些文件及 EDGE_CASES 上的提取结果完全一致。
+
+使用方法：
+python3 .scripts/check/bench_extract_links.py                          # 最大的 20 个 api-reference 文件
+python3 .scripts/check/bench_extract_links.py --top 50 --repeat 5
+python3 .scripts/check/bench_extract_links.py --baseline-rev HEAD~1    # 与指定版本对比
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 以项目根目录为基准（本脚本位于 .scripts/check/ 下，因此向上两级）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(ROOT_DIR))
+
+sys.path.insert(0, ROOT_DIR)
+import check_links  # noqa: E402
+
+# 链接形式相互重叠的行：markdown 链接与 a 标签可以互相包含，纯文本 URL 可以延伸进二者内部
+EDGE_CASES = [
+    'http://a.com/[x](y)',
+    '[<a href="/p">t</a>](/q)',
+    'https://a.com/x<a href="/y">z</a>',
+    '[https://a.com/x](https://a.com/y) https://a.com/z.',
+    '<a href="https://a.com/[x](y)">t</a> http://b.com',
+]
+
+
+def find_largest_files(top, pattern):
+    files = glob.glob(os.path.join(PROJECT_ROOT, '**', pattern), recursive=True)
+    files = [f for f in files if '/node_modules/' not in f]
+    files.sort(key=os.path.getsize, reverse=True)
+    return files[:top]
+
+
+def load_module_from_rev(rev):
+    """从指定 git 版本加载 check_links.py 作为对照实现"""
+    source = subprocess.run(
+        ['git', 'show', f'{rev}:.scripts/check/check_links.py'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    tmp = tempfile.NamedTemporaryFile('w', suffix='.py', delete=False, encoding='utf-8')
+    with tmp:
+        tmp.write(source)
+    try:
+        spec = importlib.util.spec_from_file_location('check_links_baseline', tmp.name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.unlink(tmp.name)
+    return module
+
+
+def time_extract(extract, files, repeat):
+    """返回多次运行中最快的一次耗时（秒）以及最后一次的提取结果"""
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [extract(f) for f in files]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def compare_edge_cases(baseline):
+    """在 EDGE_CASES 上比较两种实现，返回结果不一致的输入"""
+    mismatched = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i, line in enumerate(EDGE_CASES):
+            path = os.path.join(tmp_dir, f'case{i}.mdx')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(line + '\n')
+            if baseline.extract_links_from_file(path) != check_links.extract_links_from_file(path):
+                mismatched.append(line)
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description='extract_links_from_file 基准测试')
+    parser.add_argument('--top', type=int, default=20, help='选取体积最大的文件数（默认 20）')
+    parser.add_argument('--pattern', default='api-reference/*.mdx', help='文件匹配模式（默认 api-reference/*.mdx）')
+    parser.add_argument('--repeat', type=int, default=3, help='重复次数，取最快一次（默认 3）')
+    parser.add_argument('--baseline-rev', help='对照的 git 版本（如 HEAD~1），会同时校验提取结果一致')
+    args = parser.parse_args()
+
+    files = find_largest_files(args.top, args.pattern)
+    if not files:
+        print('未找到匹配的文件')
+        return 1
+    total_bytes = sum(os.path.getsize(f) for f in files)
+    print(f'文件数: {len(files)}，总大小: {total_bytes / 1024 / 1024:.1f} MB，重复 {args.repeat} 次取最快')
+
+    current_time, current_results = time_extract(check_links.extract_links_from_file, files, args.repeat)
+    link_count = sum(len(r) for r in current_results)
+    print(f'当前实现: {current_time:.3f}s  ({total_bytes / 1024 / 1024 / current_time:.1f} MB/s, {link_count} 个链接)')
+
+    if args.baseline_rev:
+        baseline = load_module_from_rev(args.baseline_rev)
+        baseline_time, baseline_results = time_extract(baseline.extract_links_from_file, files, args.repeat)
+        print(f'{args.baseline_rev}: {baseline_time:.3f}s  ({total_bytes / 1024 / 1024 / baseline_time:.1f} MB/s)')
+        print(f'加速比: {baseline_time / current_time:.2f}x')
+        mismatched = [f for f, a, b in zip(files, baseline_results, current_results) if a != b]
+        if mismatched:
+            print(f'提取结果不一致的文件 ({len(mismatched)}):')
+            for f in mismatched:
+                print(f'  {os.path.relpath(f, PROJECT_ROOT)}')
+            return 1
+        mismatched_cases = compare_edge_cases(baseline)
+        if mismatched_cases:
+            print(f'提取结果不一致的边界用例 ({len(mismatched_cases)}):')
+            for line in mismatched_cases:
+                print(f'  {line}')
+            return 1
+        print('提取结果一致')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+extract_html_tags 基准测试与回归对照
+
+测试语料分两部分：
+- 仓库中的 MDX 文件（默认全部，可用 --top 只取体积最大的若干个）
+- 内置的边界用例（代码块围栏、内联代码、跨行标签、泛型语法、长单行表格、
+  大段 ParamField 等），其中长单行/大段用例用于暴露平方级退化
+
+指定 --baseline-rev 时会从该 git 版本加载 check_html_tags.py 作为对照，
+逐文件校验提取到的标签（名称、行号、列号、类型）完全一致。
+
+使用方法：
+python3 .scripts/check/bench_html_tags.py                          # 全部 MDX 文件 + 内置用例
+python3 .scripts/check/bench_html_tags.py --top 200 --repeat 5
+python3 .scripts/check/bench_html_tags.py --baseline-rev HEAD~1    # 与指定版本对比并校验结果
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 以项目根目录为基准（本脚本位于 .scripts/check/ 下，因此向上两级）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(ROOT_DIR))
+
+sys.path.insert(0, ROOT_DIR)
+import check_html_tags  # noqa: E402
+
+
+def build_edge_cases():
+    """内置的回归用例：(名称, 内容)"""
+    table_row = '| <span>a</span> | `List<T>` | <br> | <Note>x</Note> | Map<String, Object> | (<b>c</b>) |'
+    param_field = '\n'.join([
+        '<ParamField',
+        '  path="param"',
+        '  type="string"',
+        '  required',
+        '>',
+        '  描述 <code>int</code> 与 `<div>` 以及 <br>',
+        '</ParamField>',
+    ])
+    return [
+        ('fence', '```html\n<div>\n```\n<div>\n</div>\n  ```\n<span>\n  ```\n</p>'),
+        ('fence_unclosed', 'text\n```js\nconst a = <div>;\n'),
+        ('inline_code', 'a `<div>` b <span>`</span>` c <p>\n`x` <b>y</b> ``<i>``'),
+        ('multiline_tag', '<FaqFilters\n  a="1"\n  b="2"\n/>\n<Card\n  title="t"\n>\nbody\n</Card>\n<div'),
+        ('multiline_unterminated', 'x\n<Tabs\n  a\n  b\n'),
+        ('merged_numbering', '<A\nb>\n<B\nc>\n</B>\n</A>\n<br>\n</br>'),
+        ('generic', 'List<Item> and Map<Key, Value> and foo(<Bar>) and <T> and <Promise>x'),
+        ('generic_context', '<Foo>  \n<Foo> >\n<Foo> > x\n<Foo>>\n  (  <Foo>  )\n<Foo>\t>'),
+        ('self_closing', '<br/><br><img src="a"><img src="a"/><hr></hr><input>'),
+        ('nesting', '<div><span></div></span>\n<ul>\n<li>\n</ul>'),
+        ('wide_table', '\n'.join([table_row * 400] * 20)),
+        ('param_fields', '\n'.join([param_field] * 2000)),
+        ('many_lt', '<' * 5000 + 'a' * 10 + ' <b>' + ' x <y' * 3000 + '>'),
+        ('long_multiline', '<Card\n' + '\n'.join(f'  attr{i}="v"' for i in range(20000)) + '\n>\n</Card>'),
+    ]
+
+
+def find_files(top, pattern):
+    files = glob.glob(os.path.join(PROJECT_ROOT, '**', pattern), recursive=True)
+    files = [f for f in files if '/node_modules/' not in f]
+    files.sort(key=os.path.getsize, reverse=True)
+    return files[:top] if top else files
+
+
+def read_file(file_path):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+
+def load_module_from_rev(rev):
+    """从指定 git 版本加载 check_html_tags.py 作为对照实现"""
+    source = subprocess.run(
+        ['git', 'show', f'{rev}:.scripts/check/check_html_tags.py'],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    tmp = tempfile.NamedTemporaryFile('w', suffix='.py', delete=False, encoding='utf-8')
+    with tmp:
+        tmp.write(source)
+    try:
+        spec = importlib.util.spec_from_file_location('check_html_tags_baseline', tmp.name)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        os.unlink(tmp.name)
+    return module
+
+
+def tag_tuples(tags):
+    return [(t.name, t.line_num, t.col_num, t.is_opening, t.is_self_closing) for t in tags]
+
+
+def time_extract(extract, corpus, repeat):
+    """返回多次运行中最快的一次耗时（秒）以及最后一次的提取结果"""
+    best = None
+    results = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [tag_tuples(extract(content)) for _, content in corpus]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, results
+
+
+def report_timing(label, extract, corpus, repeat):
+    elapsed, results = time_extract(extract, corpus, repeat)
+    tag_count = sum(len(r) for r in results)
+    print(f'  {label}: {elapsed:.3f}s  ({tag_count} 个标签)')
+    return elapsed, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='extract_html_tags 基准测试与回归对照')
+    parser.add_argument('--top', type=int, default=0, help='只选取体积最大的若干个文件（默认全部）')
+    parser.add_argument('--pattern', default='*.mdx', help='文件匹配模式（默认 *.mdx）')
+    parser.add_argument('--repeat', type=int, default=3, help='重复次数，取最快一次（默认 3）')
+    parser.add_argument('--baseline-rev', help='对照的 git 版本（如 HEAD~1），会同时校验提取结果一致')
+    args = parser.parse_args()
+
+    files = find_files(args.top, args.pattern)
+    repo_corpus = []
+    for f in files:
+        content = read_file(f)
+        if content is not None:
+            repo_corpus.append((os.path.relpath(f, PROJECT_ROOT), content))
+    edge_corpus = [(f'<edge:{name}>', content) for name, content in build_edge_cases()]
+    total_bytes = sum(len(c.encode('utf-8')) for _, c in repo_corpus)
+    print(f'仓库文件数: {len(repo_corpus)}，总大小: {total_bytes / 1024 / 1024:.1f} MB；'
+          f'内置用例: {len(edge_corpus)} 个；重复 {args.repeat} 次取最快')
+
+    baseline = load_module_from_rev(args.baseline_rev) if args.baseline_rev else None
+    mismatched = []
+    for title, corpus in (('仓库文件', repo_corpus), ('内置用例', edge_corpus)):
+        print(f'{title}:')
+        current_time, current_results = report_timing('当前实现', check_html_tags.extract_html_tags, corpus, args.repeat)
+        if baseline is None:
+            continue
+        baseline_time, baseline_results = report_timing(args.baseline_rev, baseline.extract_html_tags, corpus, args.repeat)
+        print(f'  加速比: {baseline_time / current_time:.2f}x')
+        mismatched.extend(name for (name, _), a, b in zip(corpus, baseline_results, current_results) if a != b)
+
+    if baseline is not None:
+        if mismatched:
+            print(f'提取结果不一致 ({len(mismatched)}):')
+            for name in mismatched:
+                print(f'  {name}')
+            return 1
+        print('提取结果一致')
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+.scripts/check 检查脚本的基准测试
+
+在临时目录生成一份与真实文档结构相似的合成文档树：
+- docuo.config.zh.json / docuo.config.en.json（含 instances 与 themeConfig.instanceGroups）
+- 每个实例的 sidebars.json（包含少量无效 id）
+- 普通文档页：标题、相对链接、锚点链接、站内根路径链接、外链、<a> 标签、代码块、片段导入
+- 大量 ParamField 的 api-reference 页面
+- 被多个页面导入的 snippets 片段
+
+然后分阶段计时，记录每个阶段的耗时、文件吞吐量（files/sec）和截至该阶段结束时的累计峰值内存（RSS）：
+- discovery    查找实例下的 mdx 文件
+- extraction   提取链接
+- anchor       页内锚点链接（#xxx）
+- local        相对路径链接
+- root         站内根路径链接（/routeBasePath/...）
+- import       MDX 片段导入
+- remote       外链检查（请求发往本地启动的 HTTP 桩服务，不访问外网）
+- check_links  check_instance_links 端到端（不含外链）
+- html_tags    check_html_tags 的标签闭合检查
+- sidebars     check_sidebars 的侧边栏 id 校验
+
+除 check_links 外，每个阶段开始前都会清空 check_links 的模块级缓存，单独统计该阶段的冷启动开销。
+
+使用方法：
+python3 .scripts/check/benchmark.py                                   # 默认规模，结果写入 benchmark_result.json
+python3 .scripts/check/benchmark.py --instances 20 --pages 200 --repeat 3
+python3 .scripts/check/benchmark.py --output base.json                # 保存基线
+python3 .scripts/check/benchmark.py --compare base.json               # 与基线对比，超过阈值的变慢阶段返回非 0
+
+计时受机器负载影响，对比前建议使用 --repeat 取多次运行中的最快值。
+
+单独对比真实 api-reference 文件上的链接提取性能可使用 bench_extract_links.py。
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows 没有 resource 模块
+    resource = None
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 以项目根目录为基准（本脚本位于 .scripts/check/ 下，因此向上两级）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(ROOT_DIR))
+DEFAULT_RESULT_PATH = os.path.join(ROOT_DIR, 'benchmark_result.json')
+
+sys.path.insert(0, ROOT_DIR)
+import check_html_tags  # noqa: E402
+import check_links  # noqa: E402
+import check_sidebars  # noqa: E402
+
+LANGUAGES = ('zh', 'en')
+SECTIONS = ('01-introduction', '02-quick-start', '03-basic-features', '04-advanced-features', '05-best-practice')
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """外链桩服务：/ok/ 开头的路径返回 200，其余返回 404"""
+
+    def _respond(self):
+        self.send_response(200 if self.path.startswith('/ok/') else 404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._respond()
+
+    def do_GET(self):
+        self._respond()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_servers(count):
+    """启动 count 个本地桩服务（端口不同即视为不同域名，各自受单域名并发与限速约束）"""
+    servers = []
+    for _ in range(count):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+    return servers
+
+
+def _heading_anchor(section, i):
+    return f'{section}-step-{i}'
+
+
+def _page_content(rng, inst, lang, section, page, args, instances_by_lang, hosts):
+    """生成一篇普通文档页"""
+    lines = [
+        '---',
+        f'title: Page {page}',
+        '---',
+        '',
+        f"import Shared from '/{inst['path']}/snippets/shared-{page % args.snippets}.mdx'",
+        '',
+        f'# {section} page {page}',
+        '',
+        '<Shared />',
+        '',
+    ]
+    for h in range(args.headings):
+        lines.append(f'## {_heading_anchor(section, h)}')
+        lines.append('')
+        target_page = rng.randrange(args.pages)
+        target_heading = rng.randrange(args.headings)
+        lines.append(
+            f'See [the next step](#{_heading_anchor(section, (h + 1) % args.headings)}) '
+            f'and [another page](./page-{target_page}.mdx#{_heading_anchor(section, target_heading)}).'
+        )
+        other_section = rng.choice(SECTIONS)
+        lines.append(f'Related: [{other_section}](../{other_section}/page-{rng.randrange(args.pages)}.mdx).')
+        other = rng.choice(instances_by_lang[lang])
+        lines.append(
+            f'Cross instance: [link](/{other["routeBasePath"]}/{other_section}/page-{rng.randrange(args.pages)}'
+            f'#{_heading_anchor(other_section, rng.randrange(args.headings))}).'
+        )
+        host = rng.choice(hosts)
+        status = 'ok' if rng.random() < 0.9 else 'missing'
+        lines.append(f'External docs: http://{host}/{status}/{rng.randrange(args.remote_urls)} for details.')
+        lines.append(f'<div className="note">Read <a href="./page-{target_page}.mdx">this page</a> first.</div>')
+        if rng.random() < 0.1:
+            # 少量无效链接，覆盖问题收集路径
+            lines.append(f'Broken: [missing](./not-exist-{h}.mdx) and [bad anchor](#no-such-anchor-{h}).')
+        if h % 3 == 0:
+            lines.extend([
+                '',
+                '```js',
+                f'const url = "https://example.com/code/{h}"; // [not a link](./ignored)',
+                'function demo<T>(value: T) { return <div>{value}</div>; }',
+                '```',
+            ])
+        lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+def _api_content(rng, args):
+    """生成 ParamField 密集的 api-reference 页面"""
+    lines = ['---', 'title: Class', '---', '']
+    for c in range(args.api_classes):
+        class_name = f'ZegoBenchClass{c}'
+        lines.append(f'## {class_name}')
+        lines.append('')
+        for m in range(args.api_methods):
+            other = f'ZegoBenchClass{rng.randrange(args.api_classes)}'
+            lines.extend([
+                '<ParamField',
+                f'  name="method{m}:"',
+                f'  prototype="- (void)method{m}:([{other}](#{other.lower()}) *)value callback:(id<Callback>)cb;"',
+                f'  desc="Calls method {m}. See [{other}](#{other.lower()})."',
+                '  parent_file="Declared in `ZegoExpressDefines.h`"',
+                f'  parent_name="{class_name}"',
+                '  parent_type="class">',
+                f'Details of method {m}, refer to [{other}](#{other.lower()}).',
+                '</ParamField>',
+            ])
+        lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+def _sidebars_content(inst, args):
+    items = []
+    for section in SECTIONS:
+        docs = [{'type': 'doc', 'label': f'Page {p}', 'id': f'{section[3:]}/page-{p}'} for p in range(args.pages)]
+        # 每个分类放一个无效 id
+        docs.append({'type': 'doc', 'label': 'Missing', 'id': f'{section[3:]}/missing-page'})
+        items.append({'type': 'category', 'label': section[3:], 'items': docs})
+    return {'mySidebar': items, 'clientApi': [{'type': 'doc', 'label': 'Class', 'id': 'client-sdk/api-reference/class'}]}
+
+
+def generate_tree(root, args, hosts):
+    """在 root 下生成合成文档树，返回 {语言: 配置}"""
+    rng = random.Random(args.seed)
+    instances_by_lang = {}
+    configs = {}
+    for lang in LANGUAGES:
+        instances = []
+        for k in range(args.instances):
+            inst_id = f'bench_product_{k}_{lang}'
+            route = f'bench-product-{k}' if lang == 'zh' else f'en/bench-product-{k}'
+            instances.append({
+                'id': inst_id,
+                'label': f'Bench Product {k}',
+                'path': f'core_products/bench-product-{k}/{lang}/web',
+                'clientApiPath': 'client-sdk/api-reference',
+                'routeBasePath': route,
+                'locale': lang,
+            })
+        instances_by_lang[lang] = instances
+        configs[lang] = {
+            'title': 'Bench',
+            'themeConfig': {
+                'instanceGroups': [{
+                    'id': f'bench_{lang}',
+                    'name': 'Bench',
+                    'instances': [{'id': inst['id'], 'platform': 'Web'} for inst in instances],
+                }],
+            },
+            'instances': instances,
+        }
+
+    for lang in LANGUAGES:
+        with open(os.path.join(root, f'docuo.config.{lang}.json'), 'w', encoding='utf-8') as f:
+            json.dump(configs[lang], f, ensure_ascii=False, indent=2)
+        for inst in instances_by_lang[lang]:
+            inst_dir = os.path.join(root, inst['path'])
+            for section in SECTIONS:
+                section_dir = os.path.join(inst_dir, section)
+                os.makedirs(section_dir, exist_ok=True)
+                for page in range(args.pages):
+                    content = _page_content(rng, inst, lang, section, page, args, instances_by_lang, hosts)
+                    with open(os.path.join(section_dir, f'page-{page}.mdx'), 'w', encoding='utf-8') as f:
+                        f.write(content)
+            snippets_dir = os.path.join(inst_dir, 'snippets')
+            os.makedirs(snippets_dir, exist_ok=True)
+            for s in range(args.snippets):
+                with open(os.path.join(snippets_dir, f'shared-{s}.mdx'), 'w', encoding='utf-8') as f:
+                    f.write(f'## Shared heading {s}\n\nShared content with a [link](#shared-heading-{s}).\n')
+            api_dir = os.path.join(inst_dir, 'client-sdk', 'api-reference')
+            os.makedirs(api_dir, exist_ok=True)
+            with open(os.path.join(api_dir, 'class.mdx'), 'w', encoding='utf-8') as f:
+                f.write(_api_content(rng, args))
+            with open(os.path.join(inst_dir, 'sidebars.json'), 'w', encoding='utf-8') as f:
+                json.dump(_sidebars_content(inst, args), f, ensure_ascii=False, indent=2)
+    return configs
+
+
+def cumulative_peak_rss_mb():
+    """当前进程（含已结束子进程）自启动以来的峰值常驻内存，单位 MB
+
+    ru_maxrss 是整个进程的最高水位，只增不减：某阶段的值不低于之前所有阶段，
+    反映的是截至该阶段结束时的累计峰值，而不是该阶段自身的内存占用。
+    Windows 上没有 resource 模块，返回 None 表示无法统计。
+    """
+    if resource is None:
+        return None
+    unit = 1024 * 1024 if sys.platform == 'darwin' else 1024  # macOS 为字节，Linux 为 KB
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return round(max(own, children) / unit, 1)
+
+
+def _format_rss(value):
+    """格式化峰值 RSS，无法统计时显示为 -"""
+    return '-' if value is None else f'{value:.1f}'
+
+
+def reset_caches():
+    """清空 check_links 的模块级缓存，使各阶段单独计时"""
+    check_links._anchor_cache.clear()
+    check_links._heading_imports_cache.clear()
+    check_links._own_headings_cache.clear()
+    check_links._closure_headings_cache.clear()
+    check_links._closure_files_cache.clear()
+    check_links._doc_id_index_cache.clear()
+    check_links._remote_result_cache.clear()
+
+
+def run_phases(configs, repo_root, args):
+    """依次执行各阶段，返回 {阶段: 指标}"""
+    phases = {}
+
+    def record(name, seconds, files, items):
+        phases[name] = {
+            'seconds': round(seconds, 4),
+            'files': files,
+            'items': items,
+            'files_per_sec': round(files / seconds, 1) if seconds > 0 else None,
+            'cumulative_peak_rss_mb': cumulative_peak_rss_mb(),
+        }
+
+    instances = [(lang, inst) for lang in LANGUAGES for inst in configs[lang]['instances']]
+
+    # discovery
+    reset_caches()
+    start = time.perf_counter()
+    files_by_instance = []
+    for lang, inst in instances:
+        files_by_instance.append((lang, inst, check_links.find_mdx_files(os.path.join(repo_root, inst['path']))))
+    all_files = [f for _, _, files in files_by_instance for f in files]
+    record('discovery', time.perf_counter() - start, len(all_files), len(all_files))
+
+    # extraction
+    reset_caches()
+    start = time.perf_counter()
+    links_by_file = {f: check_links.extract_links_from_file(f) for f in all_files}
+    record('extraction', time.perf_counter() - start, len(all_files), sum(len(v) for v in links_by_file.values()))
+
+    # 按链接类型分组，供后续各阶段使用
+    groups = {'anchor': [], 'local': [], 'root': [], 'import': [], 'remote': []}
+    file_lang = {f: lang for lang, _, files in files_by_instance for f in files}
+    for file_path, links in links_by_file.items():
+        for link_info in links:
+            url = link_info['url']
+            if link_info['type'] == 'mdx_import':
+                groups['import'].append((file_path, url))
+            elif url.startswith('#'):
+                groups['anchor'].append((file_path, url))
+            elif url.startswith(('http://', 'https://')):
+                groups['remote'].append((file_path, url))
+            elif url.startswith('/'):
+                groups['root'].append((file_path, url))
+            else:
+                groups['local'].append((file_path, url))
+
+    def timed_group(name, check):
+        reset_caches()
+        items = groups[name]
+        start = time.perf_counter()
+        for file_path, url in items:
+            check(file_path, url)
+        record(name, time.perf_counter() - start, len({f for f, _ in items}), len(items))
+
+    timed_group('anchor', lambda f, url: check_links.check_anchor_link(url, f))
+    timed_group('local', lambda f, url: check_links.check_local_link(url, f))
+    timed_group('root', lambda f, url: check_links.check_root_link(url, configs[file_lang[f]], None, repo_root))
+    timed_group('import', lambda f, url: check_links.check_mdx_import(url, f, repo_root))
+
+    # remote：请求全部发往本地桩服务
+    reset_caches()
+    remote_urls = [url for _, url in groups['remote']]
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        check_links.check_remote_links(remote_urls, max_workers=args.remote_workers)
+    record('remote', time.perf_counter() - start, len({f for f, _ in groups['remote']}), len(set(remote_urls)))
+
+    # check_links 端到端（不含外链）
+    reset_caches()
+    start = time.perf_counter()
+    problem_count = 0
+    for lang, inst, files in files_by_instance:
+        problems, _ = check_links.check_instance_links(files, configs[lang], inst, repo_root, jobs=args.jobs)
+        problem_count += sum(len(v) for v in problems.values())
+    record('check_links', time.perf_counter() - start, len(all_files), problem_count)
+
+    # html_tags
+    start = time.perf_counter()
+    problem_count = sum(len(check_html_tags.check_file_html_tags(f)) for f in all_files)
+    record('html_tags', time.perf_counter() - start, len(all_files), problem_count)
+
+    # sidebars
+    start = time.perf_counter()
+    invalid_count = 0
+    for _, inst, _ in files_by_instance:
+        inst_dir = Path(repo_root) / inst['path']
+        valid_ids = check_sidebars.collect_valid_doc_ids(inst_dir)
+        _, sidebars_root = check_sidebars.load_sidebars(inst_dir)
+        for node, _ in check_sidebars.iter_doc_nodes(sidebars_root or []):
+            if node.get('id') not in valid_ids:
+                invalid_count += 1
+    record('sidebars', time.perf_counter() - start, len(all_files), invalid_count)
+
+    return phases
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def compare_results(baseline, current, threshold, min_delta):
+    """打印与基线的对比，返回变慢超过阈值的阶段列表
+
+    耗时增加不足 min_delta 秒的阶段不计为变慢，避免极短阶段的计时抖动造成误报。
+    """
+    regressions = []
+    print(f'\n与基线对比（基线 {baseline.get("meta", {}).get("git_rev")}，阈值 {threshold:.0%}）:')
+    print(f'{"阶段":<14}{"基线(s)":>10}{"当前(s)":>10}{"变化":>10}{"files/sec":>12}')
+    for name, metrics in current['phases'].items():
+        base = baseline.get('phases', {}).get(name)
+        if not base or not base.get('seconds'):
+            print(f'{name:<14}{"-":>10}{metrics["seconds"]:>10.3f}{"-":>10}{metrics["files_per_sec"] or 0:>12.1f}')
+            continue
+        change = metrics['seconds'] / base['seconds'] - 1
+        mark = ''
+        if change > threshold and metrics['seconds'] - base['seconds'] >= min_delta:
+            regressions.append(name)
+            mark = '  <-- 变慢'
+        print(f'{name:<14}{base["seconds"]:>10.3f}{metrics["seconds"]:>10.3f}{change:>+10.1%}'
+              f'{metrics["files_per_sec"] or 0:>12.1f}{mark}')
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='.scripts/check 检查脚本基准测试（合成文档树）')
+    parser.add_argument('--instances', type=int, default=6, help='每种语言的实例数（默认 6）')
+    parser.add_argument('--pages', type=int, default=40, help='每个分类下的文档页数（默认 40）')
+    parser.add_argument('--headings', type=int, default=8, help='每篇文档的二级标题数（默认 8）')
+    parser.add_argument('--snippets', type=int, default=5, help='每个实例的片段文件数（默认 5）')
+    parser.add_argument('--api-classes', type=int, default=40, help='api-reference 页面中的类数量（默认 40）')
+    parser.add_argument('--api-methods', type=int, default=15, help='每个类的 ParamField 数量（默认 15）')
+    parser.add_argument('--remote-urls', type=int, default=50, help='每个桩域名下的不同外链路径数（默认 50）')
+    parser.add_argument('--remote-hosts', type=int, default=8, help='本地桩服务（域名）数量（默认 8）')
+    parser.add_argument('--remote-workers', type=int, default=None, help='外链检查并发线程数（默认使用 check_links 的默认值）')
+    parser.add_argument('--jobs', '-j', type=int, default=1, help='check_links 端到端阶段的并行进程数（默认 1）')
+    parser.add_argument('--repeat', type=int, default=1, help='重复次数，每个阶段取最快一次（默认 1）')
+    parser.add_argument('--seed', type=int, default=0, help='随机种子（默认 0）')
+    parser.add_argument('--output', default=DEFAULT_RESULT_PATH, help='结果 JSON 输出路径（默认 benchmark_result.json）')
+    parser.add_argument('--compare', help='对比的基线 JSON 文件')
+    parser.add_argument('--threshold', type=float, default=0.1, help='对比时判定为变慢的比例（默认 0.1，即 10%%）')
+    parser.add_argument('--min-delta', type=float, default=0.05, help='对比时判定为变慢的最小耗时增量（秒，默认 0.05）')
+    parser.add_argument('--keep-tree', action='store_true', help='保留生成的合成文档树（打印其路径）')
+    args = parser.parse_args()
+
+    servers = start_stub_servers(args.remote_hosts)
+    hosts = [f'127.0.0.1:{server.server_address[1]}' for server in servers]
+    # 外链结果不读写持久化缓存
+    check_links.configure_remote_cache(enabled=False)
+
+    tree_dir = tempfile.mkdtemp(prefix='docs-bench-')
+    try:
+        start = time.perf_counter()
+        configs = generate_tree(tree_dir, args, hosts)
+        print(f'合成文档树: {tree_dir}（生成耗时 {time.perf_counter() - start:.2f}s）')
+
+        best = None
+        for _ in range(args.repeat):
+            phases = run_phases(configs, tree_dir, args)
+            if best is None:
+                best = phases
+            else:
+                for name, metrics in phases.items():
+                    if metrics['seconds'] < best[name]['seconds']:
+                        best[name] = metrics
+    finally:
+        for server in servers:
+            server.shutdown()
+        if args.keep_tree:
+            print(f'已保留合成文档树: {tree_dir}')
+        else:
+            shutil.rmtree(tree_dir, ignore_errors=True)
+
+    result = {
+        'meta': {
+            'generated_at': datetime.now().isoformat(),
+            'git_rev': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'params': {k: v for k, v in vars(args).items() if k not in ('output', 'compare', 'threshold', 'min_delta', 'keep_tree')},
+        },
+        'phases': best,
+    }
+
+    print(f'\n{"阶段":<14}{"耗时(s)":>10}{"文件数":>8}{"条目数":>8}{"files/sec":>12}{"累计峰值RSS(MB)":>16}')
+    for name, metrics in best.items():
+        print(f'{name:<14}{metrics["seconds"]:>10.3f}{metrics["files"]:>8}{metrics["items"]:>8}'
+              f'{metrics["files_per_sec"] or 0:>12.1f}{_format_rss(metrics["cumulative_peak_rss_mb"]):>16}')
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print(f'\n结果已写入: {args.output}')
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, result, args.threshold, args.min_delta)
+        if regressions:
+            print(f'变慢超过阈值的阶段: {", ".join(regressions)}')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+统一检查入口：遍历一次文档树、每个文件只读取一次，把内容分发给各检查器
+
+检查器（默认全部启用）：
+- links      同 check_links.py --all，结果写入 check_link_result.json
+- html_tags  同 check_html_tags.py --all，输出HTML标签闭合问题报告
+- sidebars   同 check_sidebars.py，结果写入 sidebars_result.json（并在 sidebars.json 中标注无效 id、统计孤立页面）
+- images     同 extract_images.py 的图片链接提取（不下载），结果写入 images_result.json
+
+流程：
+1. 各配置文件只加载一次，对全部实例目录（嵌套的目录只算一次）做一次 os.walk
+2. 文件按连续分片交给进程池，每个文件读取一次，同时完成链接/锚点解析、HTML标签检查与图片提取
+3. 解析结果通过 parse_cache.MemoryParseStore 交给链接检查（锚点、import 解析不再读取文件），
+   文件ID索引与 sidebars 的文档 ID 直接由第 1 步的文件列表构建，孤立页面统计使用第 2 步解析出的 import
+
+使用方法：
+python3 .scripts/check/check_all.py                          # 运行全部检查器
+python3 .scripts/check/check_all.py --jobs 8                 # 8 个进程并行
+python3 .scripts/check/check_all.py --only links,html_tags   # 只运行指定检查器
+python3 .scripts/check/check_all.py --skip images            # 跳过指定检查器
+python3 .scripts/check/check_all.py --remote                 # 链接检查同时检查外链
+python3 .scripts/check/check_all.py --parse-cache            # 复用 parse_cache.sqlite，只解析内容变化的文件
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT_DIR)
+
+import check_html_tags  # noqa: E402
+import check_links  # noqa: E402
+import check_sidebars  # noqa: E402
+import parse_cache  # noqa: E402
+from check_links import Fore, Style  # noqa: E402
+
+VALIDATORS = ('links', 'html_tags', 'sidebars', 'images')
+IMAGES_RESULT_PATH = os.path.join(ROOT_DIR, 'images_result.json')
+# 链接检查需要的解析结果（链接、文件自身的锚点、合并锚点的导入）
+LINK_FIELDS = ('links', 'headings', 'heading_imports')
+PARALLEL_MIN_FILES = 50
+
+
+class TreeListing:
+    """对一组目录做一次 os.walk，之后可按目录前缀取出任意子目录下的文件
+
+    os.walk 为先序遍历，子目录的条目在结果中是连续的，
+    因此取出的文件顺序与直接对该子目录调用 os.walk 一致。
+    """
+
+    def __init__(self, roots):
+        self.entries = []  # [(目录, 文件名列表), ...]，os.walk 顺序
+        self._index = {}   # 目录 -> 在 entries 中的下标
+        top_roots = set()
+        for root in sorted({os.path.normpath(r) for r in roots}):
+            # 已被上层目录覆盖的嵌套实例目录不再重复遍历
+            parent = root
+            while parent not in top_roots:
+                next_parent = os.path.dirname(parent)
+                if next_parent == parent:
+                    break
+                parent = next_parent
+            if parent in top_roots:
+                continue
+            top_roots.add(root)
+            for dirpath, _, filenames in os.walk(root):
+                self._index[dirpath] = len(self.entries)
+                self.entries.append((dirpath, filenames))
+
+    def files(self, root, suffixes):
+        """返回 root 下扩展名（不区分大小写）属于 suffixes 的文件"""
+        root = os.path.normpath(root)
+        start = self._index.get(root)
+        if start is None:
+            return []
+        prefix = root + os.sep
+        result = []
+        for i in range(start, len(self.entries)):
+            dirpath, filenames = self.entries[i]
+            if i > start and not dirpath.startswith(prefix):
+                break
+            for fname in filenames:
+                if fname.lower().endswith(suffixes):
+                    result.append(os.path.join(dirpath, fname))
+        return result
+
+    def mdx_files(self, root):
+        return self.files(root, ('.mdx',))
+
+    def doc_files(self, root):
+        return self.files(root, ('.md', '.mdx'))
+
+
+def instance_dirs(config, repo_root):
+    """返回配置中本地实例的目录（绝对路径，去重并保持顺序），跳过外部链接实例"""
+    dirs = []
+    for instance in config.get('instances', []):
+        instance_path = instance.get('path', '') if isinstance(instance, dict) else ''
+        if not isinstance(instance_path, str) or not instance_path or instance_path.startswith('http'):
+            continue
+        abs_path = os.path.normpath(os.path.join(repo_root, instance_path))
+        if abs_path not in dirs:
+            dirs.append(abs_path)
+    return dirs
+
+
+def scan_file(file_path, wants):
+    """读取一次文件，完成 wants 中各检查器的单文件部分
+
+    返回 {'links': 链接检查需要的解析结果, 'html_tags': HTML标签问题列表, 'images': 图片链接,
+    'sidebars': 文档导入路径}，
+    未启用的检查器对应 None；读取失败时链接检查的解析结果为 None，由链接检查阶段重新读取并报错。
+    """
+    fields = []
+    if 'links' in wants:
+        fields.extend(LINK_FIELDS)
+    if 'html_tags' in wants:
+        fields.append('tags')
+    if 'images' in wants:
+        fields.append('images')
+    if 'sidebars' in wants:
+        fields.append('doc_imports')
+
+    result = {'links': None, 'html_tags': None, 'images': None, 'sidebars': None}
+    content = None
+    cache = parse_cache.get_active()
+    try:
+        if cache is not None:
+            parsed = cache.get_many(file_path, fields)
+        else:
+            content, _ = parse_cache.read_text(file_path)
+            parsed = parse_cache.parse_mdx_content(content, fields)
+    except Exception as e:
+        if 'html_tags' in wants:
+            result['html_tags'] = [{
+                'type': '文件读取错误',
+                'tag': None,
+                'message': f'无法读取文件: {str(e)}',
+                'file': file_path,
+            }]
+        if 'images' in wants:
+            print(f'读取文件失败 {file_path}: {e}', file=sys.stderr)
+            result['images'] = []
+        return result
+
+    if 'links' in wants:
+        result['links'] = {field: parsed[field] for field in LINK_FIELDS}
+    if 'html_tags' in wants:
+        tags = [check_html_tags.HTMLTag(*event) for event in parsed['tags']]
+        problems = check_html_tags.check_html_tags_balance(tags)
+        result['html_tags'] = check_html_tags.add_problem_context(problems, file_path, content)
+    if 'images' in wants:
+        result['images'] = parsed['images']
+    if 'sidebars' in wants:
+        result['sidebars'] = parsed['doc_imports']
+    return result
+
+
+def _scan_chunk(tasks):
+    results = [(file_path, scan_file(file_path, wants)) for file_path, wants in tasks]
+    # 子进程退出前需要把新解析的结果写入解析缓存
+    parse_cache.flush_active()
+    return results
+
+
+def scan_files(tasks, jobs=1):
+    """对 [(文件, 检查器集合), ...] 逐个执行 scan_file，返回 {文件: 结果}
+
+    jobs > 1 且文件较多时按连续分片交给进程池并行处理。
+    """
+    total = len(tasks)
+    results = {}
+
+    def report_progress():
+        print(f'\r读取与解析进度: {len(results)}/{total} ({len(results) / total * 100:.1f}%)', end='', flush=True)
+
+    if jobs and jobs > 1 and total >= PARALLEL_MIN_FILES:
+        chunk_count = min(total, jobs * 4)
+        chunk_size = (total + chunk_count - 1) // chunk_count
+        chunks = [tasks[i:i + chunk_size] for i in range(0, total, chunk_size)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=parse_cache.init_worker,
+                                 initargs=(parse_cache.active_path(),)) as executor:
+            for chunk_result in executor.map(_scan_chunk, chunks):
+                results.update(chunk_result)
+                report_progress()
+    else:
+        for i, (file_path, wants) in enumerate(tasks, 1):
+            results[file_path] = scan_file(file_path, wants)
+            if i % 200 == 0 or i == total:
+                report_progress()
+        parse_cache.flush_active()
+    if total:
+        print()
+    return results
+
+
+def run_html_tags(html_instances, repo_root, listing, scanned):
+    """按 check_html_tags.py --all 的顺序汇总各文件的检查结果并输出报告，返回问题总数"""
+    all_problems = defaultdict(list)
+    total_files = 0
+    total_files_with_problems = 0
+    for instance in html_instances:
+        for file_path in listing.mdx_files(os.path.join(repo_root, instance['path'])):
+            total_files += 1
+            problems = scanned[file_path]['html_tags']
+            if problems:
+                total_files_with_problems += 1
+                for problem in problems:
+                    all_problems[problem['type']].append(problem)
+    print(f'共 {len(html_instances)} 个实例目录，{total_files} 个MDX文件')
+    check_html_tags.print_problems_report(all_problems, total_files_with_problems)
+    return sum(len(problems) for problems in all_problems.values())
+
+
+def run_links(repo_root, configs, listing, scanned, check_remote, remote_workers, jobs):
+    """使用已解析的结果运行 check_links.py --all 的检查，写入 check_link_result.json，返回问题总数"""
+    store = parse_cache.MemoryParseStore(fallback=parse_cache.get_active(), fields=LINK_FIELDS)
+    for file_path, result in scanned.items():
+        if result['links'] is not None:
+            store.add(file_path, result['links'])
+    for _, config in configs:
+        for abs_dir in instance_dirs(config, repo_root):
+            check_links.prime_doc_id_index(abs_dir, listing.mdx_files(abs_dir))
+
+    previous = parse_cache.get_active()
+    parse_cache.activate(store)
+    try:
+        structured_results, aggregated_by_url = check_links.check_all_instances(
+            repo_root, check_remote, remote_workers, jobs, configs=configs, find_files=listing.mdx_files)
+    finally:
+        parse_cache.activate(previous)
+    check_links.write_result_files(mode='all', structured_results=structured_results, language='all',
+                                   check_remote=check_remote, aggregated_by_url=aggregated_by_url)
+    return sum(len(entries)
+               for instance_results in structured_results.values()
+               for files in instance_results.values()
+               for entries in files.values())
+
+
+def run_sidebars(sidebars_config, listing, scanned):
+    """运行 check_sidebars.py 的检查（文档 ID 由文件列表构建、import 取自解析结果），
+    写入 sidebars_result.json，返回无效 id 总数"""
+    def files_for(inst_dir):
+        return (Path(p) for p in listing.doc_files(str(inst_dir)))
+
+    def imports_for(path):
+        result = scanned.get(str(path))
+        if result is None or result['sidebars'] is None:
+            return check_sidebars.read_doc_imports(path)
+        return result['sidebars']
+
+    instances = sidebars_config.get('instances') or []
+    checks = []
+    for inst in instances if isinstance(instances, list) else []:
+        checked = check_sidebars.check_instance(inst, files_for, imports_for)
+        if checked is not None:
+            checks.append(checked)
+    output = check_sidebars.build_output(checks)
+    check_sidebars.write_result(output)
+    summary = output['summary']
+    print(f'共 {summary["totalInstances"]} 个实例，{summary["instancesWithErrors"]} 个实例存在问题，'
+          f'无效 id {summary["totalInvalidIds"]} 个；未被 sidebars 引用的页面 {summary["totalOrphanFiles"]} 个，'
+          f'另有 {summary["totalImportOnlyFiles"]} 个只通过 import 引入')
+    print(f'校验完成，结果已写入: {check_sidebars.RESULT_PATH}')
+    return summary['totalInvalidIds']
+
+
+def run_images(image_files, scanned, repo_root):
+    """汇总图片链接（不下载），写入 images_result.json，返回图片链接总数"""
+    images = []
+    for file_path in image_files:
+        for url in scanned[file_path]['images'] or []:
+            images.append({'url': url, 'file': os.path.relpath(file_path, repo_root)})
+    output = {
+        'generated_at': datetime.now().isoformat(),
+        'total_files': len(image_files),
+        'total_images': len(images),
+        'images': images,
+    }
+    with open(IMAGES_RESULT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f'共 {len(image_files)} 个 md/mdx 文件，提取 {len(images)} 个图片链接')
+    print(f'结果已写入: {IMAGES_RESULT_PATH}')
+    return len(images)
+
+
+def parse_validator_list(value):
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in names if name not in VALIDATORS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f'未知的检查器: {", ".join(unknown)}（可选: {", ".join(VALIDATORS)}）')
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='统一检查入口：遍历一次文档树、每个文件只读取一次，运行全部检查器',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog='''\
+检查器: links（check_link_result.json）、html_tags（输出报告）、
+        sidebars（sidebars_result.json）、images（images_result.json，只提取不下载）
+示例:
+  python check_all.py --jobs 8
+  python check_all.py --only links,html_tags
+  python check_all.py --skip images --remote
+''')
+    parser.add_argument('--only', type=parse_validator_list, metavar='NAMES',
+                        help='只运行指定的检查器（逗号分隔）')
+    parser.add_argument('--skip', type=parse_validator_list, metavar='NAMES', default=[],
+                        help='跳过指定的检查器（逗号分隔）')
+    parser.add_argument('--jobs', '-j', metavar='N', type=int, default=1,
+                        help='并行处理的进程数（默认 1，即串行）')
+    parser.add_argument('--remote', action='store_true', help='链接检查同时检查外链')
+    parser.add_argument('--remote-workers', type=int, default=None, dest='remote_workers',
+                        help=f'外链并发检查线程数（默认 {check_links.REMOTE_MAX_WORKERS}）')
+    parser.add_argument('--parse-cache', action='store_true', dest='parse_cache',
+                        help='启用 MDX 解析缓存（parse_cache.sqlite），只重新解析内容变化的文件')
+    args = parser.parse_args()
+
+    enabled = [name for name in (args.only or VALIDATORS) if name not in args.skip]
+    if not enabled:
+        print(f'{Fore.RED}没有需要运行的检查器{Style.RESET_ALL}')
+        return 1
+    if args.parse_cache:
+        parse_cache.enable()
+
+    repo_root = check_links.get_repo_root()
+    if not repo_root:
+        print(f'{Fore.RED}未找到仓库根目录（包含docuo.config.*.json 的目录）{Style.RESET_ALL}')
+        return 1
+
+    timings = {}
+    start = time.perf_counter()
+
+    # 1. 加载配置并遍历一次文档树
+    configs = check_links.load_language_configs(repo_root)
+    html_instances = check_html_tags.load_all_instances(repo_root)
+    sidebars_config = None
+    if 'sidebars' in enabled:
+        config_path = check_sidebars.resolve_config_path()
+        if config_path is not None:
+            try:
+                sidebars_config = check_sidebars.read_json(config_path)
+            except Exception as e:
+                print(f'读取配置失败: {e}')
+        if sidebars_config is None:
+            enabled.remove('sidebars')
+
+    roots = [d for _, config in configs for d in instance_dirs(config, repo_root)]
+    if sidebars_config is not None:
+        roots.extend(instance_dirs(sidebars_config, repo_root))
+    listing = TreeListing(roots)
+    content_roots = []
+    for _, config in configs:
+        for abs_dir in instance_dirs(config, repo_root):
+            if abs_dir not in content_roots:
+                content_roots.append(abs_dir)
+
+    # 每个文件只读取一次：记录各文件需要哪些检查器处理
+    wants_by_file = {}
+    if 'links' in enabled or 'html_tags' in enabled:
+        for abs_dir in content_roots:
+            for file_path in listing.mdx_files(abs_dir):
+                wants = wants_by_file.setdefault(file_path, set())
+                if 'links' in enabled:
+                    wants.add('links')
+                if 'html_tags' in enabled:
+                    wants.add('html_tags')
+    if 'sidebars' in enabled:
+        for abs_dir in instance_dirs(sidebars_config, repo_root):
+            for file_path in listing.doc_files(abs_dir):
+                wants_by_file.setdefault(file_path, set()).add('sidebars')
+    image_files = []
+    if 'images' in enabled:
+        for abs_dir in content_roots:
+            for file_path in listing.doc_files(abs_dir):
+                wants = wants_by_file.setdefault(file_path, set())
+                if 'images' not in wants:
+                    wants.add('images')
+                    image_files.append(file_path)
+    timings['walk'] = time.perf_counter() - start
+    print(f'共 {len(listing.entries)} 个目录，{len(wants_by_file)} 个文件需要读取')
+
+    # 2. 每个文件读取一次，完成各检查器的单文件部分
+    phase_start = time.perf_counter()
+    scanned = scan_files([(file_path, tuple(sorted(wants))) for file_path, wants in wants_by_file.items()], args.jobs)
+    timings['read_parse'] = time.perf_counter() - phase_start
+
+    # 3. 各检查器汇总结果
+    counts = {}
+    if 'html_tags' in enabled:
+        print(f'\n{Fore.CYAN}=== HTML标签检查 ==={Style.RESET_ALL}')
+        phase_start = time.perf_counter()
+        counts['html_tags'] = run_html_tags(html_instances, repo_root, listing, scanned)
+        timings['html_tags'] = time.perf_counter() - phase_start
+    if 'links' in enabled:
+        print(f'\n{Fore.CYAN}=== 链接检查 ==={Style.RESET_ALL}')
+        phase_start = time.perf_counter()
+        counts['links'] = run_links(repo_root, configs, listing, scanned, args.remote, args.remote_workers, args.jobs)
+        timings['links'] = time.perf_counter() - phase_start
+    if 'sidebars' in enabled:
+        print(f'\n{Fore.CYAN}=== sidebars 检查 ==={Style.RESET_ALL}')
+        phase_start = time.perf_counter()
+        counts['sidebars'] = run_sidebars(sidebars_config, listing, scanned)
+        timings['sidebars'] = time.perf_counter() - phase_start
+    if 'images' in enabled:
+        print(f'\n{Fore.CYAN}=== 图片链接提取 ==={Style.RESET_ALL}')
+        phase_start = time.perf_counter()
+        counts['images'] = run_images(image_files, scanned, repo_root)
+        timings['images'] = time.perf_counter() - phase_start
+
+    print(f'\n{Fore.CYAN}=== 汇总 ==={Style.RESET_ALL}')
+    labels = {
+        'walk': '遍历目录', 'read_parse': '读取与解析', 'html_tags': 'HTML标签检查',
+        'links': '链接检查', 'sidebars': 'sidebars 检查', 'images': '图片链接提取',
+    }
+    count_labels = {'html_tags': '个问题', 'links': '个问题', 'sidebars': '个无效 id', 'images': '个图片链接'}
+    for phase, seconds in timings.items():
+        count_text = f'，{counts[phase]} {count_labels[phase]}' if phase in counts else ''
+        print(f'  {labels[phase]}: {seconds:.2f}s{count_text}')
+    print(f'  总耗时 {time.perf_counter() - start:.2f}s')
+
+    has_problems = any(counts.get(name) for name in ('html_tags', 'links', 'sidebars'))
+    return 1 if has_problems else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,6 +27,13 @@ python3 .scripts/check/check_html_tags.py
 
 然后按提示选择语言、组和实例即可开始检查。
 
+非交互模式：
+python3 .scripts/check/check_html_tags.py a.mdx b.mdx                 # 检查指定文件（pre-commit 钩子使用）
+python3 .scripts/check/check_html_tags.py --zh --instance <实例ID>     # 检查整个实例
+python3 .scripts/check/check_html_tags.py --all --jobs 8              # 检查中英文全部实例（相同目录只检查一次）
+python3 .scripts/check/check_html_tags.py --all --parse-cache        # 复用 parse_cache.sqlite 中的解析结果（与 check_links.py 共享）
+python3 .scripts/check/check_html_tags.py --zh --instance <实例ID> --watch   # 监听模式：文件保存后只检查该文件（不指定实例时监听全部实例）
+
 关闭方法：
 rm .git/hooks/pre-commit
 
@@ -36,7 +43,19 @@ import os
 import re
 import json
 import sys
+import argparse
+import time
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import parse_cache
+from file_watcher import POLL_INTERVAL, create_watcher, watcher_kind
+
+# 直接运行本脚本（或 spawn 启动的进程池子进程）时模块名为 __main__ / __mp_main__，
+# 登记给解析缓存，避免其按名称再导入一份 check_html_tags
+if __name__ in ('__main__', '__mp_main__'):
+    parse_cache.register_extractors('check_html_tags', sys.modules[__name__])
 
 # 终端彩色输出
 try:
@@ -168,53 +187,72 @@ class HTMLTag:
         tag_type = "self-closing" if self.is_self_closing else ("opening" if self.is_opening else "closing")
         return f"<{self.name} {tag_type} at {self.line_num}:{self.col_num}>"
 
+# 常见的HTML标签和MDX组件
+KNOWN_HTML_TAGS = frozenset({
+    'div', 'span', 'p', 'a', 'img', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot',
+    'form', 'input', 'button', 'select', 'option', 'textarea', 'label',
+    'header', 'footer', 'nav', 'section', 'article', 'aside', 'main',
+    'video', 'audio', 'source', 'track', 'canvas', 'svg', 'path',
+    # 常见的MDX组件
+    'note', 'warning', 'tip', 'info', 'danger', 'success',
+    'tabs', 'tab', 'steps', 'step', 'codegroup', 'code',
+    'accordion', 'accordionitem', 'callout', 'card', 'cardgroup',
+    'image', 'video', 'audio', 'embed', 'iframe'
+})
+
+# 常见的编程语言泛型类型
+GENERIC_TYPE_NAMES = frozenset({
+    'any', 'string', 'number', 'boolean', 'object', 'array', 'void', 'null', 'undefined',
+    'int', 'float', 'double', 'char', 'bool', 'long', 'short', 'byte',
+    'list', 'map', 'set', 'vector', 'queue', 'stack', 'pair',
+    'promise', 'future', 'optional', 'result', 'either',
+    # 常见的类名模式
+    't', 'k', 'v', 'e', 'r'
+})
+
+# 匹配HTML标签的正则表达式
+# 支持: <tag>, <tag attr="value">, </tag>, <tag/>, <tag attr="value"/>
+TAG_PATTERN = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*?(/?)>', re.IGNORECASE)
+# 跨行标签起点（< 后跟字母）
+TAG_START_PATTERN = re.compile(r'<(/?)[a-zA-Z]')
+_WHITESPACE_RUN = re.compile(r'\s*')
+_NON_WHITESPACE = re.compile(r'\S')
+
 def is_likely_html_tag(tag_name, line_content, match_start, match_end):
     """判断是否可能是HTML标签而不是代码中的泛型语法"""
     tag_name_lower = tag_name.lower()
 
-    # 常见的HTML标签和MDX组件
-    html_tags = {
-        'div', 'span', 'p', 'a', 'img', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-        'ul', 'ol', 'li', 'table', 'tr', 'td', 'th', 'thead', 'tbody', 'tfoot',
-        'form', 'input', 'button', 'select', 'option', 'textarea', 'label',
-        'header', 'footer', 'nav', 'section', 'article', 'aside', 'main',
-        'video', 'audio', 'source', 'track', 'canvas', 'svg', 'path',
-        # 常见的MDX组件
-        'note', 'warning', 'tip', 'info', 'danger', 'success',
-        'tabs', 'tab', 'steps', 'step', 'codegroup', 'code',
-        'accordion', 'accordionitem', 'callout', 'card', 'cardgroup',
-        'image', 'video', 'audio', 'embed', 'iframe'
-    }
-
     # 如果是已知的HTML标签，很可能是HTML标签
-    if tag_name_lower in html_tags:
+    if tag_name_lower in KNOWN_HTML_TAGS:
         return True
 
-    # 常见的编程语言泛型类型
-    generic_types = {
-        'any', 'string', 'number', 'boolean', 'object', 'array', 'void', 'null', 'undefined',
-        'int', 'float', 'double', 'char', 'bool', 'long', 'short', 'byte',
-        'list', 'map', 'set', 'vector', 'queue', 'stack', 'pair',
-        'promise', 'future', 'optional', 'result', 'either',
-        # 常见的类名模式
-        't', 'k', 'v', 'e', 'r'
-    }
-
     # 如果是常见的泛型类型，很可能不是HTML标签
-    if tag_name_lower in generic_types:
+    if tag_name_lower in GENERIC_TYPE_NAMES:
         return False
 
     # 检查上下文：如果在代码块中，更可能是泛型
     # 简单检查：如果前面有 : 或 < 或者后面紧跟 > 且没有空格，可能是泛型
-    before_tag = line_content[:match_start].strip()
-    after_tag = line_content[match_end:].strip()
+    # 只看标签前后紧邻的几个非空白字符，不复制整行前后缀（长行上逐个标签复制是平方级的）
+    before_end = match_start
+    while before_end > 0 and line_content[before_end - 1].isspace():
+        before_end -= 1
+    before_tail = line_content[max(0, before_end - 5):before_end]
+    after_start = _WHITESPACE_RUN.match(line_content, match_end).end()
+    after_head = line_content[after_start:after_start + 5]
 
     # 检查是否在代码上下文中
     # 注意：需要更精确的检查，避免误判HTML标签
     # 只有在明确的编程上下文中才过滤
-    if (before_tag.endswith('<') or  # 泛型开始，如 List<
-        (after_tag.startswith('>') and not after_tag.startswith('> ')) or  # 泛型结束，如 >，但不是 > 文本
-        ('(' in before_tag[-5:] and ')' in after_tag[:5])):  # 函数调用上下文
+    if after_head.startswith('>'):
+        # 泛型结束，如 >，但不是 > 文本（"> " 后只剩空白时视为紧跟 >）
+        is_generic_end = not (after_head.startswith('> ') and
+                              _NON_WHITESPACE.search(line_content, after_start + 2))
+    else:
+        is_generic_end = False
+    if (before_tail.endswith('<') or  # 泛型开始，如 List<
+        is_generic_end or
+        ('(' in before_tail and ')' in after_head)):  # 函数调用上下文
         return False
 
     # 如果标签名看起来像类名（首字母大写），可能是MDX组件
@@ -224,88 +262,74 @@ def is_likely_html_tag(tag_name, line_content, match_start, match_end):
     # 默认情况下，如果不确定，倾向于认为是HTML标签
     return True
 
-def is_in_inline_code(line, position):
-    """检查指定位置是否在内联代码（反引号）中"""
-    # 计算position之前的反引号数量
-    backticks_before = line[:position].count('`')
-    # 如果反引号数量是奇数，说明在内联代码中
-    return backticks_before % 2 == 1
+def iter_logical_lines(lines):
+    """逐行产出逻辑行，并标记是否为代码块围栏或位于代码块中
 
-def extract_html_tags(content):
-    """从内容中提取所有HTML标签"""
-    tags = []
-    lines = content.split('\n')
+    跨多行的标签（如 <FaqFilters ... > 属性写在多行）会合并成一个逻辑行，
+    使逐行正则能完整匹配到开放标签。只在非代码块区域合并。
+    合并规则：遇到 <tag 开头但本行没有 > 的行，向下合并直到出现 >。
+    产出 (逻辑行, 是否围栏行, 是否在代码块中)；报告的行号即逻辑行序号（与历史行为一致）。
+    """
     in_code_block = False
-    code_block_language = None
-
-    # 预处理：把跨多行的标签（如 <FaqFilters ... > 属性写在多行）合并成逻辑单行，
-    # 使下面的逐行正则能完整匹配到开放标签。只在非代码块区域合并。
-    # 合并规则：遇到 <tag 开头但本行没有 > 的行，向下合并直到出现 >。
-    merged_lines = []
     i = 0
-    while i < len(lines):
+    total = len(lines)
+    while i < total:
         line = lines[i]
-        stripped = line.strip()
-        if stripped.startswith('```'):
+        i += 1
+        if line.lstrip().startswith('```'):
             in_code_block = not in_code_block
-            merged_lines.append(line)
-            i += 1
+            yield line, True, in_code_block
             continue
-        if in_code_block:
-            merged_lines.append(line)
-            i += 1
+        if in_code_block or '>' in line or not TAG_START_PATTERN.search(line):
+            yield line, False, in_code_block
             continue
-        # 非代码块：检测跨行标签起点（< 后跟字母，但本行内无 > 闭合）
-        if re.search(r'<(/?)[a-zA-Z]', line) and '>' not in line:
-            buf = line
-            j = i + 1
-            while j < len(lines) and '>' not in buf:
-                buf += ' ' + lines[j].strip()
-                j += 1
-            merged_lines.append(buf)
-            i = j
-        else:
-            merged_lines.append(line)
+        # 非代码块：跨行标签起点（< 后跟字母，但本行内无 > 闭合）
+        # 只检查新拼入的行是否包含 >，并一次性拼接
+        parts = [line]
+        while i < total:
+            part = lines[i].strip()
+            parts.append(part)
             i += 1
-    lines = merged_lines
-    in_code_block = False  # 重置，下面会重新跟踪
-
-    # 匹配HTML标签的正则表达式
-    # 支持: <tag>, <tag attr="value">, </tag>, <tag/>, <tag attr="value"/>
-    tag_pattern = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*?(/?)>', re.IGNORECASE)
-
-    for line_num, line in enumerate(lines, 1):
-        stripped_line = line.strip()
-
-        # 检查是否在代码块中
-        if stripped_line.startswith('```'):
-            if not in_code_block:
-                # 进入代码块
-                in_code_block = True
-                # 提取代码块语言（如果有的话）
-                code_block_language = stripped_line[3:].strip() or None
-            else:
-                # 退出代码块
-                in_code_block = False
-                code_block_language = None
+            if '>' in part:
+                break
+        yield ' '.join(parts), False, False
+
+def extract_html_tags(content):
+    """从内容中提取所有HTML标签
+
+    单遍扫描：同时跟踪代码块围栏、跨行标签合并和内联代码反引号计数。
+    """
+    tags = []
+
+    for line_num, (line, is_fence, in_code_block) in enumerate(iter_logical_lines(content.split('\n')), 1):
+        # 围栏行本身和代码块中的行，完全跳过HTML标签检查
+        if is_fence or in_code_block:
             continue
 
-        # 如果在代码块中，完全跳过这一行的所有HTML标签检查
-        if in_code_block:
+        last_gt = line.rfind('>')
+        if last_gt < 0 or '<' not in line:
             continue
 
-        for match in tag_pattern.finditer(line):
-            is_closing = bool(match.group(1))  # 是否是闭合标签 </tag>
-            tag_name = match.group(2)
-            has_slash_end = bool(match.group(3))  # 是否以 /> 结尾
-            col_num = match.start() + 1
+        # 内联代码：按匹配位置递增累计反引号数量，奇数说明在内联代码中
+        backticks_before = 0
+        scanned_to = 0
+        # 限制在最后一个 > 之前匹配，避免无 > 的 < 每次都扫描到行尾
+        for match in TAG_PATTERN.finditer(line, 0, last_gt + 1):
+            start = match.start()
+            backticks_before += line.count('`', scanned_to, start)
+            scanned_to = start
 
             # 检查是否在内联代码中
-            if is_in_inline_code(line, match.start()):
+            if backticks_before % 2 == 1:
                 continue
 
+            is_closing = bool(match.group(1))  # 是否是闭合标签 </tag>
+            tag_name = match.group(2)
+            has_slash_end = bool(match.group(3))  # 是否以 /> 结尾
+            col_num = start + 1
+
             # 判断是否可能是HTML标签
-            if not is_likely_html_tag(tag_name, line, match.start(), match.end()):
+            if not is_likely_html_tag(tag_name, line, start, match.end()):
                 continue
 
             # 检查自闭合标签的情况
@@ -419,13 +443,24 @@ def check_html_tags_balance(tags):
 
     return problems
 
+def extract_file_html_tags(file_path):
+    """读取文件并提取HTML标签，返回 (标签列表, 文件内容)
+
+    启用解析缓存时直接使用缓存的标签事件，此时文件内容为 None。
+    """
+    cache = parse_cache.get_active()
+    if cache is not None:
+        tags = [HTMLTag(name, line_num, col_num, is_opening, is_self_closing)
+                for name, line_num, col_num, is_opening, is_self_closing in cache.get(file_path, 'tags')]
+        return tags, None
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return extract_html_tags(content), content
+
 def check_file_html_tags(file_path):
     """检查单个文件的HTML标签"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        tags = extract_html_tags(content)
+        tags, _ = extract_file_html_tags(file_path)
         problems = check_html_tags_balance(tags)
 
         return problems
@@ -436,44 +471,105 @@ def check_file_html_tags(file_path):
             'message': f'无法读取文件: {str(e)}'
         }]
 
-def get_line_content(file_path, line_num):
-    """获取指定行的内容"""
+def check_file_html_tags_with_context(file_path):
+    """检查单个文件的HTML标签，并为问题补充 file 与 line_content
+
+    行内容直接取自已读取的文件内容，不再为每个问题重新打开文件。
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-            if 1 <= line_num <= len(lines):
-                return lines[line_num - 1].strip()
-    except:
-        pass
-    return ""
-
-def check_files_from_command_line(file_paths):
+        tags, content = extract_file_html_tags(file_path)
+        problems = check_html_tags_balance(tags)
+    except Exception as e:
+        return [{
+            'type': '文件读取错误',
+            'tag': None,
+            'message': f'无法读取文件: {str(e)}',
+            'file': file_path,
+        }]
+    return add_problem_context(problems, file_path, content)
+
+def add_problem_context(problems, file_path, content):
+    """为问题补充 file 与 line_content；content 为 None 时只在有问题的情况下读取文件"""
+    if content is None and problems:
+        # 使用解析缓存时只在有问题的情况下读取文件内容
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception:
+            content = ''
+    lines = content.split('\n') if content else []
+    for problem in problems:
+        problem['file'] = file_path
+        if problem['tag']:
+            line_num = problem['tag'].line_num
+            problem['line_content'] = lines[line_num - 1].strip() if 1 <= line_num <= len(lines) else ''
+    return problems
+
+PARALLEL_MIN_FILES = 50
+
+def _check_files_chunk(file_paths):
+    results = [(file_path, check_file_html_tags_with_context(file_path)) for file_path in file_paths]
+    # 子进程退出前需要把新解析的结果写入解析缓存
+    parse_cache.flush_active()
+    return results
+
+def check_files(file_paths, jobs=1, show_progress=False):
+    """检查一批文件，返回按输入顺序排列的 [(文件路径, 问题列表), ...]
+
+    jobs > 1 且文件较多时按连续分片交给进程池并行检查。
+    """
+    total = len(file_paths)
+    if jobs and jobs > 1 and total >= PARALLEL_MIN_FILES:
+        chunk_count = min(total, jobs * 4)
+        chunk_size = (total + chunk_count - 1) // chunk_count
+        chunks = [file_paths[i:i + chunk_size] for i in range(0, total, chunk_size)]
+        results = []
+        with ProcessPoolExecutor(max_workers=jobs, initializer=parse_cache.init_worker,
+                                 initargs=(parse_cache.active_path(),)) as executor:
+            for chunk_result in executor.map(_check_files_chunk, chunks):
+                results.extend(chunk_result)
+                if show_progress:
+                    print(f'\r检查进度: {len(results)}/{total} ({len(results)/total*100:.1f}%)', end='', flush=True)
+        return results
+
+    results = []
+    for i, file_path in enumerate(file_paths, 1):
+        if show_progress:
+            print(f'\r检查进度: {i}/{total} ({i/total*100:.1f}%)', end='', flush=True)
+        results.append((file_path, check_file_html_tags_with_context(file_path)))
+    return results
+
+def print_file_problems(file_path, problems):
+    """输出单个文件的问题（文件模式与监听模式共用）"""
+    abs_file_path = os.path.abspath(file_path)
+    print(f'{Fore.RED}❌ 文件 {abs_file_path} 发现HTML标签问题:{Style.RESET_ALL}')
+
+    for problem in problems:
+        if problem['tag']:
+            tag = problem['tag']
+            line_content = problem.get('line_content')
+            print(f'  {abs_file_path}:{tag.line_num} - {problem["message"]}')
+            if line_content:
+                print(f'    行内容: {line_content}')
+        else:
+            print(f'  {abs_file_path} - {problem["message"]}')
+    print("")
+
+def check_files_from_command_line(file_paths, jobs=1):
     """从命令行参数检查指定的文件"""
     has_problems = False
 
+    existing = []
     for file_path in file_paths:
         if not os.path.exists(file_path):
             print(f'{Fore.RED}文件不存在: {file_path}{Style.RESET_ALL}')
             continue
+        existing.append(file_path)
 
-        # 获取绝对路径
-        abs_file_path = os.path.abspath(file_path)
-        problems = check_file_html_tags(file_path)
-
+    for file_path, problems in check_files(existing, jobs):
         if problems:
             has_problems = True
-            print(f'{Fore.RED}❌ 文件 {abs_file_path} 发现HTML标签问题:{Style.RESET_ALL}')
-
-            for problem in problems:
-                if problem['tag']:
-                    tag = problem['tag']
-                    line_content = get_line_content(file_path, tag.line_num)
-                    print(f'  {abs_file_path}:{tag.line_num} - {problem["message"]}')
-                    if line_content:
-                        print(f'    行内容: {line_content}')
-                else:
-                    print(f'  {abs_file_path} - {problem["message"]}')
-            print("")
+            print_file_problems(file_path, problems)
 
     if has_problems:
         print(f'{Fore.RED}❌ 发现HTML标签问题，请修复后再提交！{Style.RESET_ALL}')
@@ -482,73 +578,47 @@ def check_files_from_command_line(file_paths):
         print(f'{Fore.GREEN}✅ 所有Markdown文件的HTML标签检查通过{Style.RESET_ALL}')
         return True
 
-def main():
-    """主函数"""
-    # 检查是否有命令行参数指定文件
-    if len(sys.argv) > 1:
-        # 命令行模式：检查指定的文件
-        file_paths = sys.argv[1:]
-        success = check_files_from_command_line(file_paths)
-        sys.exit(0 if success else 1)
-
-    # 交互模式：原有的交互式检查逻辑
-    print(f'{Fore.CYAN}HTML元素闭合检查脚本{Style.RESET_ALL}')
-    print('=' * 50)
-
-    language = choose_language()
-    config, repo_root = load_config(language)
-    instances = config.get('instances', [])
-
-    if not instances:
-        print(f'{Fore.RED}未找到任何实例，请检查配置文件。{Style.RESET_ALL}')
-        sys.exit(1)
-
-    instance = choose_instance(instances)
-    instance_path = instance['path']
-
-    # 确保实例路径是绝对路径
-    if not os.path.isabs(instance_path):
-        instance_path = os.path.join(repo_root, instance_path)
-
+def get_instance_display_name(instance):
     instance_label = instance.get("label", "未知实例")
     platform = instance.get("navigationInfo", {}).get("platform", "")
     if platform:
-        display_name = f"{instance_label} ({platform})"
-    else:
-        display_name = instance_label
-
-    print(f'\n正在检查实例: {display_name}')
-    print(f'路径: {instance_path}')
+        return f"{instance_label} ({platform})"
+    return instance_label
 
-    mdx_files = find_mdx_files(instance_path)
+def check_instances(instances, repo_root, jobs=1):
+    """检查一组实例下的全部MDX文件，返回是否未发现问题"""
+    mdx_files = []
+    for instance in instances:
+        instance_path = instance['path']
+        # 确保实例路径是绝对路径
+        if not os.path.isabs(instance_path):
+            instance_path = os.path.join(repo_root, instance_path)
+        if len(instances) == 1:
+            print(f'\n正在检查实例: {get_instance_display_name(instance)}')
+            print(f'路径: {instance_path}')
+        mdx_files.extend(find_mdx_files(instance_path))
     print(f'共找到 {len(mdx_files)} 个MDX文件。')
 
     if not mdx_files:
         print(f'{Fore.YELLOW}未找到任何MDX文件。{Style.RESET_ALL}')
-        return
+        return True
 
     print('\n开始检查HTML标签...')
-
     all_problems = defaultdict(list)
     total_files_with_problems = 0
-
-    for i, file_path in enumerate(mdx_files, 1):
-        print(f'\r检查进度: {i}/{len(mdx_files)} ({i/len(mdx_files)*100:.1f}%)', end='', flush=True)
-
-        problems = check_file_html_tags(file_path)
-
+    for _, problems in check_files(mdx_files, jobs, show_progress=True):
         if problems:
             total_files_with_problems += 1
             for problem in problems:
-                problem['file'] = file_path
-                if problem['tag']:
-                    problem['line_content'] = get_line_content(file_path, problem['tag'].line_num)
                 all_problems[problem['type']].append(problem)
 
     print('\n\n检查完成！')
     print('=' * 50)
+    print_problems_report(all_problems, total_files_with_problems)
+    return not all_problems
 
-    # 输出结果
+def print_problems_report(all_problems, total_files_with_problems):
+    """按问题类型输出检查结果"""
     if not all_problems:
         print(f'{Fore.GREEN}✅ 未发现任何HTML标签问题！{Style.RESET_ALL}')
         return
@@ -571,5 +641,143 @@ def main():
                 print(f'  "{problem["file"]}": {problem["message"]}')
             print()
 
+def load_all_instances(repo_root):
+    """加载中英文配置中的全部实例，相同目录只保留一次（中文优先），跳过外部链接实例"""
+    instances = []
+    seen_paths = set()
+    for language in ('zh', 'en'):
+        config_file = os.path.join(repo_root, f'docuo.config.{language}.json')
+        if not os.path.exists(config_file):
+            continue
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        for instance in config.get('instances', []):
+            instance_path = instance.get('path', '')
+            if not instance_path or instance_path.startswith('http'):
+                continue
+            abs_path = os.path.normpath(os.path.join(repo_root, instance_path))
+            if abs_path in seen_paths:
+                continue
+            seen_paths.add(abs_path)
+            instances.append(instance)
+    return instances
+
+def watch_instances(instances, repo_root, interval=POLL_INTERVAL):
+    """监听模式：文件保存后只重新检查保存的文件"""
+    watch_dirs = [os.path.join(repo_root, instance['path']) for instance in instances]
+    watcher = create_watcher([d for d in watch_dirs if os.path.isdir(d)], interval=interval)
+    print(f'{Fore.CYAN}正在监听 {watcher.file_count()} 个MDX文件（{watcher_kind(watcher)}），'
+          f'保存文件后自动检查，Ctrl+C 退出{Style.RESET_ALL}')
+    try:
+        while True:
+            changed, _ = watcher.wait()
+            if not changed:
+                continue
+            start = time.perf_counter()
+            print(f'\n{Fore.CYAN}[{datetime.now().strftime("%H:%M:%S")}] 检查 {len(changed)} 个变更文件{Style.RESET_ALL}')
+            has_problems = False
+            for file_path, problems in check_files(changed):
+                if problems:
+                    has_problems = True
+                    print_file_problems(file_path, problems)
+            if not has_problems:
+                print(f'{Fore.GREEN}✅ 未发现HTML标签问题{Style.RESET_ALL}')
+            print(f'检查耗时 {time.perf_counter() - start:.2f}s')
+    except KeyboardInterrupt:
+        print('\n已退出监听模式')
+    finally:
+        watcher.close()
+    return True
+
+def run_non_interactive(args):
+    """CLI 非交互模式"""
+    if args.watch:
+        # 监听模式：--instance 指定实例，未指定时监听全部实例
+        if args.files:
+            print(f'{Fore.RED}--watch 不支持按文件检查，请使用 --instance 或 --all{Style.RESET_ALL}')
+            sys.exit(1)
+        if args.instance:
+            config, repo_root = load_config('en' if args.en else 'zh')
+            instances = [i for i in config.get('instances', []) if i.get('id') == args.instance]
+            if not instances:
+                print(f'{Fore.RED}未找到实例ID: {args.instance}{Style.RESET_ALL}')
+                sys.exit(1)
+        else:
+            repo_root = get_repo_root()
+            if not repo_root:
+                print(f'{Fore.RED}未找到仓库根目录（包含docuo.config.*.json的目录）{Style.RESET_ALL}')
+                sys.exit(1)
+            instances = load_all_instances(repo_root)
+        return watch_instances(instances, repo_root, args.watch_interval)
+
+    if args.files and not (args.instance or args.all):
+        # 文件模式：检查指定的文件（pre-commit 钩子使用）
+        return check_files_from_command_line(args.files, args.jobs)
+
+    if args.all:
+        repo_root = get_repo_root()
+        if not repo_root:
+            print(f'{Fore.RED}未找到仓库根目录（包含docuo.config.*.json的目录）{Style.RESET_ALL}')
+            sys.exit(1)
+        instances = load_all_instances(repo_root)
+        print(f'检查中英文全部实例，共 {len(instances)} 个实例目录')
+        return check_instances(instances, repo_root, args.jobs)
+
+    if args.instance:
+        language = 'en' if args.en else 'zh'
+        config, repo_root = load_config(language)
+        instances = config.get('instances', [])
+        matched = [i for i in instances if i.get('id') == args.instance]
+        if not matched:
+            print(f'{Fore.RED}未找到实例ID: {args.instance}{Style.RESET_ALL}')
+            avail = ', '.join(i.get('id', '') for i in instances if i.get('id'))
+            print(f'可用实例ID:\n  {avail}')
+            sys.exit(1)
+        return check_instances(matched, repo_root, args.jobs)
+
+    print(f'{Fore.RED}请指定要检查的文件、--instance <ID> 或 --all{Style.RESET_ALL}')
+    sys.exit(1)
+
+def main():
+    """主函数"""
+    # 有命令行参数时进入非交互模式
+    if len(sys.argv) > 1:
+        parser = argparse.ArgumentParser(description='检查MDX文件中的HTML元素是否正确闭合')
+        parser.add_argument('files', nargs='*', metavar='FILE', help='要检查的文件（pre-commit 钩子按文件调用）')
+        lang_group = parser.add_mutually_exclusive_group()
+        lang_group.add_argument('--zh', action='store_true', help='使用中文配置（默认）')
+        lang_group.add_argument('--en', action='store_true', help='使用英文配置')
+        parser.add_argument('--instance', metavar='ID', help='要检查的实例ID')
+        parser.add_argument('--all', action='store_true',
+                            help='检查中英文配置中的全部实例（相同目录只检查一次，忽略 --zh/--en）')
+        parser.add_argument('--jobs', '-j', metavar='N', type=int, default=1,
+                            help='并行检查的进程数（默认 1，即串行）')
+        parser.add_argument('--parse-cache', action='store_true', dest='parse_cache',
+                            help='启用 MDX 解析缓存（parse_cache.sqlite，按内容 sha1 复用解析结果，与 check_links.py 共享）')
+        parser.add_argument('--watch', action='store_true',
+                            help='监听模式：文件保存后只重新检查该文件（已安装 watchdog 时使用文件系统事件，否则轮询）')
+        parser.add_argument('--watch-interval', metavar='SECONDS', dest='watch_interval', type=float,
+                            default=POLL_INTERVAL, help=f'监听模式未安装 watchdog 时的轮询间隔（秒，默认 {POLL_INTERVAL}）')
+        args = parser.parse_args()
+        if args.parse_cache:
+            parse_cache.enable()
+        success = run_non_interactive(args)
+        sys.exit(0 if success else 1)
+
+    # 交互模式：原有的交互式检查逻辑
+    print(f'{Fore.CYAN}HTML元素闭合检查脚本{Style.RESET_ALL}')
+    print('=' * 50)
+
+    language = choose_language()
+    config, repo_root = load_config(language)
+    instances = config.get('instances', [])
+
+    if not instances:
+        print(f'{Fore.RED}未找到任何实例，请检查配置文件。{Style.RESET_ALL}')
+        sys.exit(1)
+
+    instance = choose_instance(instances)
+    check_instances([instance], repo_root)
+
 if __name__ == '__main__':
     main()
@@ -38,13 +38,31 @@ import re
 import json
 import sys
 import argparse
+import functools
+import itertools
 import urllib.parse
 import requests
+from requests.adapters import HTTPAdapter
+import sqlite3
+import shutil
 import subprocess
-from collections import defaultdict
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+import parse_cache
+from file_watcher import POLL_INTERVAL, create_watcher, watcher_kind
+from link_graph import LinkGraph, file_sha1, file_stamp
+
+# 直接运行本脚本（或 spawn 启动的进程池子进程）时模块名为 __main__ / __mp_main__，
+# 登记给解析缓存，避免其按名称再导入一份 check_links
+if __name__ in ('__main__', '__mp_main__'):
+    parse_cache.register_extractors('check_links', sys.modules[__name__])
+
 # 终端彩色输出
 try:
     from colorama import init, Fore, Style
@@ -77,8 +95,10 @@ def choose_check_remote():
     choice = input('输入数字选择(1/2)，直接回车默认不检查: ').strip()
     return choice == '1'
 
+_whitelist_cache = {}  # 'stamp' -> 白名单文件的 (mtime_ns, size)，'data' -> 已加载的白名单
+
 def load_whitelist():
-    """加载链接白名单"""
+    """加载链接白名单（同一进程内文件未变化时直接复用）"""
     script_dir = Path(__file__).parent
     whitelist_file = script_dir / 'link_whitelist.json'
 
@@ -91,27 +111,85 @@ def load_whitelist():
         whitelist_file.write_text(json.dumps(default_whitelist, indent=2, ensure_ascii=False), encoding='utf-8')
         return default_whitelist
 
+    st = whitelist_file.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _whitelist_cache.get('stamp') == stamp:
+        return _whitelist_cache['data']
+
     try:
-        return json.loads(whitelist_file.read_text(encoding='utf-8'))
+        whitelist = json.loads(whitelist_file.read_text(encoding='utf-8'))
     except Exception as e:
         print(f'{Fore.YELLOW}警告：无法加载白名单文件：{e}{Style.RESET_ALL}')
         return {"urls": [], "patterns": []}
+    _whitelist_cache['stamp'] = stamp
+    _whitelist_cache['data'] = whitelist
+    return whitelist
 
-def is_url_whitelisted(url, whitelist):
-    """检查URL是否在白名单中"""
-    # 检查完整URL匹配
-    if url in whitelist.get('urls', []):
-        return True
+_whitelist_matchers = {}  # id(白名单) -> (白名单, 编译后的匹配器)
 
-    # 检查正则表达式模式匹配
+def compile_whitelist(whitelist):
+    """将白名单编译为匹配器
+
+    - 完整 URL 放入集合，O(1) 判断
+    - 全部正则合并为一个 (?:p1)|(?:p2)|... 模式，一次 search 完成匹配；
+      含反向引用（分组编号会因合并而错位）或无法合并时，退回逐个预编译的模式
+    - 无效的正则直接忽略（与逐个 re.search 时跳过 re.error 的行为一致）
+    - memo 按 URL 缓存判断结果，重复出现的链接不再匹配
+    """
+    compiled = []
     for pattern in whitelist.get('patterns', []):
         try:
-            if re.search(pattern, url):
-                return True
-        except re.error:
+            compiled.append(re.compile(pattern))
+        except (re.error, TypeError):
             continue
 
-    return False
+    combined = None
+    if compiled and not any(re.search(r'\\[1-9]|\(\?P=', p.pattern) for p in compiled):
+        try:
+            combined = re.compile('|'.join(f'(?:{p.pattern})' for p in compiled))
+        except re.error:
+            combined = None
+
+    return {
+        'urls': frozenset(u for u in whitelist.get('urls', []) if isinstance(u, str)),
+        'regex': combined,
+        'patterns': [] if combined is not None else compiled,
+        'memo': {},
+    }
+
+def _get_whitelist_matcher(whitelist):
+    entry = _whitelist_matchers.get(id(whitelist))
+    if entry is None or entry[0] is not whitelist:
+        # 保留白名单对象的引用，保证 id 不会被复用
+        entry = (whitelist, compile_whitelist(whitelist))
+        _whitelist_matchers[id(whitelist)] = entry
+    return entry[1]
+
+def is_url_whitelisted(url, whitelist):
+    """检查URL是否在白名单中"""
+    matcher = _get_whitelist_matcher(whitelist)
+    if matcher['regex'] is None and not matcher['patterns']:
+        # 没有正则模式时只需查集合
+        return url in matcher['urls']
+
+    memo = matcher['memo']
+    result = memo.get(url)
+    if _profile is not None:
+        _profile_cache_access('whitelist', result is not None)
+    if result is not None:
+        return result
+
+    # 检查完整URL匹配
+    if url in matcher['urls']:
+        result = True
+    # 检查正则表达式模式匹配
+    elif matcher['regex'] is not None:
+        result = matcher['regex'].search(url) is not None
+    else:
+        result = any(p.search(url) for p in matcher['patterns'])
+
+    memo[url] = result
+    return result
 
 def get_repo_root():
     """获取仓库根目录路径"""
@@ -143,25 +221,98 @@ def get_git_changed_files():
         print(f'{Fore.RED}获取git变更文件失败，请确保在git仓库中运行{Style.RESET_ALL}')
         return []
 
+def get_git_changed_entries():
+    """获取git暂存区中变更的md/mdx文件
+
+    返回 (changed, removed)：changed 为新增/修改/重命名后的路径，removed 为删除或重命名前的路径。
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'diff', '--cached', '--name-status', '-M', '-z', '--diff-filter=AMDR'],
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        print(f'{Fore.RED}获取git变更文件失败，请确保在git仓库中运行{Style.RESET_ALL}')
+        return [], []
+
+    changed = []
+    removed = []
+    fields = result.stdout.split('\0')
+    i = 0
+    while i < len(fields) and fields[i]:
+        status = fields[i]
+        if status.startswith('R'):
+            old_path, new_path = fields[i + 1], fields[i + 2]
+            removed.append(old_path)
+            changed.append(new_path)
+            i += 3
+        else:
+            path = fields[i + 1]
+            if status == 'D':
+                removed.append(path)
+            else:
+                changed.append(path)
+            i += 2
+
+    def is_md(path):
+        return path.lower().endswith(('.md', '.mdx'))
+
+    return [f for f in changed if is_md(f)], [f for f in removed if is_md(f)]
+
+_instance_path_trie_cache = {}  # id(config) -> (config, 实例 path 分段前缀树)
+
+def build_instance_path_trie(instances):
+    """按实例 path 的路径段构建前缀树，节点为 [子节点字典, 实例]；同一 path 以配置中第一个实例为准"""
+    root = [{}, None]
+    for inst in instances:
+        instance_path = inst.get('path', '')
+        if not instance_path:
+            continue
+        node = root
+        for seg in instance_path.strip('/').split('/'):
+            node = node[0].setdefault(seg, [{}, None])
+        if node[1] is None:
+            node[1] = inst
+    return root
+
+def find_instance_for_file(file_path, config):
+    """返回包含该文件（相对仓库根目录的路径）的实例，按路径段取最长匹配；找不到时返回 None"""
+    entry = _instance_path_trie_cache.get(id(config))
+    if entry is None or entry[0] is not config:
+        # 保留配置对象的引用，保证 id 不会被复用
+        entry = (config, build_instance_path_trie(config.get('instances', [])))
+        _instance_path_trie_cache[id(config)] = entry
+    node = entry[1]
+    found = None
+    # 最后一段是文件名，不参与匹配
+    for seg in file_path.replace('\\', '/').split('/')[:-1]:
+        node = node[0].get(seg)
+        if node is None:
+            break
+        if node[1] is not None:
+            found = node[1]
+    return found
+
 def find_instances_for_files(files, config, repo_root):
-    """根据文件路径找到对应的实例"""
+    """根据文件路径找到对应的实例
+
+    按路径段匹配实例 path（solutions/large-class 不会误匹配 solutions/large-class-ai 下的文件）。
+    """
     instances_map = {}
-    instances = config.get('instances', [])
 
     for file_path in files:
-        for instance in instances:
-            instance_path = instance.get('path', '')
-            instance_id = instance.get('id', '')
-
-            # 检查文件路径是否以实例的path开头
-            if instance_path and file_path.startswith(instance_path):
-                if instance_id not in instances_map:
-                    instances_map[instance_id] = {
-                        'instance': instance,
-                        'files': []
-                    }
-                instances_map[instance_id]['files'].append(file_path)
-                break  # 找到匹配的实例后跳出循环
+        instance = find_instance_for_file(file_path, config)
+        if instance is None:
+            continue
+        instance_id = instance.get('id', '')
+        if instance_id not in instances_map:
+            instances_map[instance_id] = {
+                'instance': instance,
+                'files': []
+            }
+        instances_map[instance_id]['files'].append(file_path)
 
     return instances_map
 
@@ -342,123 +493,158 @@ def find_mdx_files(root_path):
                 mdx_files.append(os.path.join(dirpath, fname))
     return mdx_files
 
+_WHITESPACE_RUN = re.compile(r'\s*')
+_ATTR_PLAIN_RUN = re.compile(r'[^>"\']*')
+
+
 def remove_paramfield_attrs(content):
     """移除 ParamField 组件的属性部分，保留换行结构
 
     ParamField 组件属性中的链接不需要检查，如：
     prototype="[ZegoRoomState](./enum#zegoroomstate)"
+
+    线性扫描实现，结果与正则
+    <ParamField\\s+((?:[^>"']+|"[^"]*"|'[^']*')*?)(/?>)
+    的替换结果一致（属性中的引号内容可以包含 >），但不会因未闭合的引号产生回溯爆炸。
     """
-    # 匹配 <ParamField ... > 或 <ParamField ... />
-    # 正则处理属性值中可能包含 > 字符的情况
-    paramfield_regex = re.compile(
-        r'<ParamField\s+((?:[^>"\']+|"[^"]*"|\'[^\']*\')*?)(/?>)',
-        re.DOTALL
-    )
+    if '<ParamField' not in content:
+        return content
+
+    tag = '<ParamField'
+    out = []
+    pos = 0
+    start = content.find(tag)
+    while start >= 0:
+        attrs_start = start + len(tag)
+        # 标签名后至少要有一个空白字符
+        k = _WHITESPACE_RUN.match(content, attrs_start).end()
+        end = -1
+        if k > attrs_start:
+            m = k
+            while True:
+                # 跳过引号与 > 以外的字符
+                m = _ATTR_PLAIN_RUN.match(content, m).end()
+                if m >= len(content):
+                    break
+                ch = content[m]
+                if ch == '>':
+                    end = m
+                    break
+                close = content.find(ch, m + 1)
+                if close < 0:
+                    # 引号未闭合，该位置不构成匹配
+                    break
+                m = close + 1
+        if end < 0:
+            start = content.find(tag, attrs_start)
+            continue
 
-    def replace_with_newlines(match):
+        if end > k and content[end - 1] == '/':
+            attrs, closing = content[k:end - 1], '/>'
+        else:
+            attrs, closing = content[k:end], '>'
         # 保留属性部分中的换行符数量，以保持行号一致
-        attrs = match.group(1)
-        closing = match.group(2)
-        newline_count = attrs.count('\n')
-        return '<ParamField' + '\n' * newline_count + closing
+        out.append(content[pos:start])
+        out.append(tag + '\n' * attrs.count('\n') + closing)
+        pos = end + 1
+        start = content.find(tag, pos)
 
-    return paramfield_regex.sub(replace_with_newlines, content)
+    out.append(content[pos:])
+    return ''.join(out)
 
 
-def extract_links_from_file(file_path):
-    # 匹配多种类型的链接
-    # 1. markdown链接: [xxx](url)
-    markdown_pattern = re.compile(r'\[[^\]]*\]\(([^)]+)\)')
-    # 2. HTML a标签链接: <a href="url"> 或 <a href='url'>
-    html_a_pattern = re.compile(r'<a[^>]*href\s*=\s*[\'"]([^\'"]+)[\'"][^>]*>')
-    # 3. 纯文本链接: http://xxx 或 https://xxx
-    url_pattern = re.compile(r'https?://[^\s\'"<>()`]+')
-    # 4. import语句: import xxx from 'path' 或 import { xxx } from 'path'
-    mdx_import_pattern = re.compile(r'import\s+(?:{[^}]+}|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]')
-
-    links = []
+# 1. markdown链接: [xxx](url)
+_MARKDOWN_LINK_PATTERN = re.compile(r'\[[^\]]*\]\(([^)]+)\)')
+# 2. HTML a标签链接: <a href="url"> 或 <a href='url'>
+_HTML_A_PATTERN = re.compile(r'<a[^>]*href\s*=\s*[\'"]([^\'"]+)[\'"][^>]*>')
+# 3. 纯文本链接: http://xxx 或 https://xxx
+_PLAIN_URL_PATTERN = re.compile(r'https?://[^\s\'"<>()`]+')
+# import语句: import xxx from 'path' 或 import { xxx } from 'path'
+_MDX_IMPORT_PATTERN = re.compile(r'import\s+(?:{[^}]+}|\w+)\s+from\s+[\'"]([^\'"]+)[\'"]')
+
+
+def iter_links_from_content(content):
+    """逐行扫描 MDX 内容，依次产出链接记录
+
+    跟踪 ``` 代码块与缩进代码块状态，代码块内的链接跳过。
+    每条记录为 {'url', 'line', 'line_content', 'type'}，同一行内按 markdown、html_a、
+    plain_text、mdx_import 的顺序产出。
+    """
     in_code_block = False  # 是否在代码块内
     code_block_indent = None  # 缩进代码块的缩进级别
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
     # 移除 ParamField 组件的属性部分（保留换行结构以保持行号一致）
     content = remove_paramfield_attrs(content)
 
     for idx, line in enumerate(content.split('\n'), 1):
-            # 检查是否进入/退出代码块（```标记的代码块）
-            if line.strip().startswith('```'):
-                in_code_block = not in_code_block
-                continue
-
-            # 检查缩进代码块
-            if not in_code_block:
-                # 计算当前行的缩进
-                current_indent = len(line) - len(line.lstrip())
-                if line.strip():  # 非空行
-                    if code_block_indent is None and current_indent >= 4:
-                        # 进入缩进代码块
-                        code_block_indent = current_indent
-                    elif code_block_indent is not None and current_indent < 4:
-                        # 退出缩进代码块
-                        code_block_indent = None
-
-            # 如果在代码块内，跳过链接检查
-            if in_code_block or code_block_indent is not None:
-                continue
-            line_content = line.strip()
-
-            # 检查markdown链接
-            for match in markdown_pattern.finditer(line):
-                url = match.group(1).strip()
-                links.append({
-                    'url': url,
-                    'line': idx,
-                    'line_content': line_content,
-                    'type': 'markdown'
-                })
+        lstripped = line.lstrip()
+        # 检查是否进入/退出代码块（```标记的代码块）
+        if lstripped.startswith('```'):
+            in_code_block = not in_code_block
+            continue
 
-            # 检查HTML a标签链接
-            for match in html_a_pattern.finditer(line):
-                url = match.group(1).strip()
-                links.append({
-                    'url': url,
-                    'line': idx,
-                    'line_content': line_content,
-                    'type': 'html_a'
-                })
+        # 检查缩进代码块
+        if not in_code_block and lstripped:
+            # 计算当前行的缩进
+            current_indent = len(line) - len(lstripped)
+            if code_block_indent is None and current_indent >= 4:
+                # 进入缩进代码块
+                code_block_indent = current_indent
+            elif code_block_indent is not None and current_indent < 4:
+                # 退出缩进代码块
+                code_block_indent = None
+
+        # 如果在代码块内，跳过链接检查
+        if in_code_block or code_block_indent is not None:
+            continue
 
-            # 检查纯文本链接（排除已经在markdown链接和HTML a标签中的）
-            line_without_markdown = markdown_pattern.sub('', line)
-            line_without_html = html_a_pattern.sub('', line_without_markdown)
-            for match in url_pattern.finditer(line_without_html):
-                url = match.group(0).strip()
+        # 绝大多数行不包含链接，先用子串判断跳过
+        has_token = '[' in line or '<a' in line or 'http' in line
+        has_import = 'import' in line
+        if not has_token and not has_import:
+            continue
+        stripped = lstripped.rstrip()
+
+        # markdown 链接与 a 标签各自独立匹配（两者可以重叠，如 [<a href="/p">t</a>](/q)），
+        # 纯文本链接在去掉前两者之后的行内容中查找；只在行内出现对应标记时才执行相应的正则
+        markdown_matches = _MARKDOWN_LINK_PATTERN.findall(line) if '[' in line else ()
+        for url in markdown_matches:
+            yield {'url': url.strip(), 'line': idx, 'line_content': stripped, 'type': 'markdown'}
+        if '<a' in line:
+            for url in _HTML_A_PATTERN.findall(line):
+                yield {'url': url.strip(), 'line': idx, 'line_content': stripped, 'type': 'html_a'}
+        if 'http' in line:
+            rest = _MARKDOWN_LINK_PATTERN.sub('', line) if markdown_matches else line
+            if '<a' in rest:
+                rest = _HTML_A_PATTERN.sub('', rest)
+            for url in _PLAIN_URL_PATTERN.findall(rest):
                 # 移除可能的尾部标点符号
-                url = url.rstrip('.,;:!?')
-                links.append({
-                    'url': url,
-                    'line': idx,
-                    'line_content': line_content,
-                    'type': 'plain_text'
-                })
+                yield {'url': url.strip().rstrip('.,;:!?'), 'line': idx, 'line_content': stripped, 'type': 'plain_text'}
 
-            # 检查MDX导入语句
-            for match in mdx_import_pattern.finditer(line):
+        # 检查MDX导入语句
+        if has_import:
+            for match in _MDX_IMPORT_PATTERN.finditer(line):
                 import_path = match.group(1).strip()
                 # 移除开头的斜杠（如果有）
                 if import_path.startswith('/'):
                     import_path = import_path[1:]
-                links.append({
-                    'url': import_path,
-                    'line': idx,
-                    'line_content': line_content,
-                    'type': 'mdx_import'
-                })
+                yield {'url': import_path, 'line': idx, 'line_content': stripped, 'type': 'mdx_import'}
 
 
+def extract_links_from_content(content):
+    return list(iter_links_from_content(content))
 
-    return links
+
+def extract_links_from_file(file_path):
+    cache = parse_cache.get_active()
+    if cache is not None:
+        links = cache.get(file_path, 'links')
+        if _profile is not None:
+            _profile_cache_access('parse', cache.last_hit)
+        return links
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return extract_links_from_content(content)
 
 def check_mixed_language(link, language):
     # 检查中英文链接混用
@@ -527,11 +713,9 @@ def check_local_link(link, base_file_path):
 
     # 如果有锚点，检查锚点是否存在（大小写不敏感）
     if anchor:
-        headings = extract_headings_from_file(abs_path)
         # 宽松匹配：统一小写并移除空格与短横线
         anchor_norm = _normalize_for_anchor_compare(anchor)
-        headings_norm = [_normalize_for_anchor_compare(h) for h in headings]
-        if anchor_norm not in headings_norm:
+        if anchor_norm not in get_file_anchors(abs_path)['normalized']:
             # 文件存在但锚点不存在
             return 'anchor_invalid'
 
@@ -549,11 +733,8 @@ def check_anchor_link(link, base_file_path):
         return False
 
     # 检查当前文件中的锚点（大小写不敏感）
-    headings = extract_headings_from_file(base_file_path)
     # 将锚点和标题都转换为小写进行比较
-    anchor_lower = anchor.lower()
-    headings_lower = [h.lower() for h in headings]
-    if anchor_lower not in headings_lower:
+    if anchor.lower() not in get_file_anchors(base_file_path)['lower']:
         return False
 
     return True
@@ -629,13 +810,10 @@ def extract_anchors_from_paramfield_attrs(name, parent_name, parent_type, anchor
     return anchors
 
 
-def extract_paramfield_anchors(file_path):
-    """从 MDX 文件中提取所有 ParamField 组件生成的锚点"""
+def extract_paramfield_anchors_from_content(content):
+    """从 MDX 内容中提取所有 ParamField 组件生成的锚点"""
     anchors = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
         # 将内容规范化为单行处理（去除换行），因为 ParamField 可能跨多行
         normalized_content = content.replace('\r\n', ' ').replace('\n', ' ')
 
@@ -722,77 +900,187 @@ def extract_steps_anchors(content):
     return anchors
 
 
-def extract_headings_from_file(file_path):
-    """从mdx文件中提取所有锚点（标题 + ParamField 组件），并转换为锚点格式"""
+_HEADING_IMPORT_PATTERN = re.compile(r'import\s+\w+\s+from\s+[\'"]([^\'"]+\.mdx)[\'"]')
+_TAG_ID_PATTERN = re.compile(r'<[^>]+id\s*=\s*[\'"]([^\'"]+)[\'"][^>]*/?>', re.IGNORECASE)
+
+def extract_heading_imports(content):
+    """返回内容中 import Content from "xxx.mdx" 的导入路径（被导入文件的标题会出现在当前页面）"""
+    return [match.group(1) for match in _HEADING_IMPORT_PATTERN.finditer(content)]
+
+def extract_own_headings_from_content(content):
+    """提取内容自身产生的锚点（标题、id 属性、ParamField、Steps），不包含导入文件的锚点"""
     headings = []
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # 处理MDX导入：如果文件包含import Content from语句，则递归处理导入的文件
-        import_pattern = re.compile(r'import\s+\w+\s+from\s+[\'"]([^\'"]+\.mdx)[\'"]')
-        for match in import_pattern.finditer(content):
-            import_path = match.group(1)
-            # 处理相对路径
-            if import_path.startswith('/'):
-                # 绝对路径，从仓库根目录开始
-                repo_root = get_repo_root()
-                if repo_root:
-                    imported_file_path = os.path.join(repo_root, import_path.lstrip('/'))
+
+    # 1. 匹配markdown标题 (# ## ### #### ##### ######)
+    heading_counts = {}  # 用于跟踪重复标题
+    for line in content.split('\n'):
+        line = line.strip()
+        if line.startswith('#'):
+            # 提取标题文本
+            heading_text = line.lstrip('#').strip()
+            if heading_text:
+                # 转换为锚点格式
+                anchor = heading_to_anchor(heading_text)
+
+                # 处理重复标题，添加数字后缀
+                if anchor in heading_counts:
+                    heading_counts[anchor] += 1
+                    anchor_with_suffix = f"{anchor}-{heading_counts[anchor]}"
+                    headings.append(anchor_with_suffix)
                 else:
-                    continue
-            else:
-                # 相对路径
-                imported_file_path = os.path.normpath(os.path.join(os.path.dirname(file_path), import_path))
+                    heading_counts[anchor] = 0
+                    headings.append(anchor)
+                    # 同时添加带-1后缀的版本（某些系统从-1开始）
+                    headings.append(f"{anchor}-1")
 
-            if os.path.exists(imported_file_path):
-                # 递归提取导入文件的标题
-                imported_headings = extract_headings_from_file(imported_file_path)
-                headings.extend(imported_headings)
 
-        # 1. 匹配markdown标题 (# ## ### #### ##### ######)
-        heading_counts = {}  # 用于跟踪重复标题
-        for line in content.split('\n'):
-            line = line.strip()
-            if line.startswith('#'):
-                # 提取标题文本
-                heading_text = line.lstrip('#').strip()
-                if heading_text:
-                    # 转换为锚点格式
-                    anchor = heading_to_anchor(heading_text)
-
-                    # 处理重复标题，添加数字后缀
-                    if anchor in heading_counts:
-                        heading_counts[anchor] += 1
-                        anchor_with_suffix = f"{anchor}-{heading_counts[anchor]}"
-                        headings.append(anchor_with_suffix)
-                    else:
-                        heading_counts[anchor] = 0
-                        headings.append(anchor)
-                        # 同时添加带-1后缀的版本（某些系统从-1开始）
-                        headings.append(f"{anchor}-1")
-
-
-        # 2. 匹配任意HTML标签的id属性
-        # 支持多种格式：<any id="anchor"></any>、<any id='anchor'></any>、<any id="anchor"/>等
-        tag_id_pattern = re.compile(r'<[^>]+id\s*=\s*[\'"]([^\'"]+)[\'"][^>]*/?>', re.IGNORECASE)
-        for match in tag_id_pattern.finditer(content):
-            anchor_id = match.group(1).strip()
-            if anchor_id:
-                headings.append(anchor_id)
-
-        # 3. 提取 ParamField 组件生成的锚点
-        paramfield_anchors = extract_paramfield_anchors(file_path)
-        headings.extend(paramfield_anchors)
-
-        # 4. 提取 Steps/Step 组件生成的锚点（当 titleSize 为 h1~h5 时）
-        steps_anchors = extract_steps_anchors(content)
-        headings.extend(steps_anchors)
+    # 2. 匹配任意HTML标签的id属性
+    # 支持多种格式：<any id="anchor"></any>、<any id='anchor'></any>、<any id="anchor"/>等
+    for match in _TAG_ID_PATTERN.finditer(content):
+        anchor_id = match.group(1).strip()
+        if anchor_id:
+            headings.append(anchor_id)
+
+    # 3. 提取 ParamField 组件生成的锚点
+    headings.extend(extract_paramfield_anchors_from_content(content))
+
+    # 4. 提取 Steps/Step 组件生成的锚点（当 titleSize 为 h1~h5 时）
+    headings.extend(extract_steps_anchors(content))
+
+    return headings
 
+# 导入闭包锚点索引：页面的锚点 = 通过 import 引入的文件（递归）的锚点 + 自身的锚点。
+# 每个文件的导入列表与自身锚点只解析一次，被大量页面导入的 snippets 不再随每个导入方重复解析；
+# 闭包结果同样按文件缓存。以上均以 (绝对路径, mtime_ns, size) 为键，文件变化后自动失效，
+# 导入方的闭包由监听模式按反向链接图清除（见 invalidate_file_caches）。
+_heading_imports_cache = {}   # key -> 被导入 mdx 文件的绝对路径 tuple
+_own_headings_cache = {}      # key -> 文件自身的锚点 tuple
+_closure_headings_cache = {}  # key -> 含导入文件在内的全部锚点 tuple
+_closure_files_cache = {}     # key -> 文件自身及其直接或间接导入的文件 frozenset
+
+def _file_cache_key(abs_path):
+    try:
+        st = os.stat(abs_path)
+        return (abs_path, st.st_mtime_ns, st.st_size)
+    except OSError:
+        return (abs_path, None, None)
+
+def resolve_heading_import(import_path, file_path):
+    """解析 import Content from "xxx.mdx" 中的路径：/ 开头相对仓库根目录，否则相对当前文件；文件不存在时返回 None"""
+    if import_path.startswith('/'):
+        repo_root = get_repo_root()
+        if not repo_root:
+            return None
+        imported_file_path = os.path.join(repo_root, import_path.lstrip('/'))
+    else:
+        imported_file_path = os.path.join(os.path.dirname(file_path), import_path)
+    imported_file_path = os.path.abspath(imported_file_path)
+    return imported_file_path if os.path.exists(imported_file_path) else None
+
+def _read_parsed_field(abs_path, field, parse):
+    """启用解析缓存时从缓存读取字段，否则读取文件并调用 parse(content)；读取失败时返回空列表"""
+    try:
+        cache = parse_cache.get_active()
+        if cache is not None:
+            value = cache.get(abs_path, field)
+            if _profile is not None:
+                _profile_cache_access('parse', cache.last_hit)
+            return value
+        with open(abs_path, 'r', encoding='utf-8') as f:
+            return parse(f.read())
     except Exception:
-        pass
+        return []
+
+def get_heading_imports(abs_path):
+    """返回文件通过 import 引入（其标题会出现在当前页面）的 mdx 文件绝对路径（带缓存）"""
+    key = _file_cache_key(abs_path)
+    imports = _heading_imports_cache.get(key)
+    if imports is None:
+        raw_imports = _read_parsed_field(abs_path, 'heading_imports', extract_heading_imports)
+        imports = tuple(p for p in (resolve_heading_import(i, abs_path) for i in raw_imports) if p)
+        _heading_imports_cache[key] = imports
+    return imports
+
+def get_own_headings(abs_path):
+    """返回文件自身产生的锚点，不含导入文件（带缓存）"""
+    key = _file_cache_key(abs_path)
+    headings = _own_headings_cache.get(key)
+    if headings is None:
+        headings = tuple(_read_parsed_field(abs_path, 'headings', extract_own_headings_from_content))
+        _own_headings_cache[key] = headings
     return headings
 
+def _import_closure(abs_path, cache, combine, visiting):
+    """沿导入图深度优先合并各文件的结果，返回 (结果, 遇到的处理中祖先集合)
+
+    遇到仍在处理中的祖先（即循环导入）时不再深入，环由 find_import_cycle 作为问题报告；
+    依赖被截断祖先的中间结果不完整，不写入缓存。
+    """
+    key = _file_cache_key(abs_path)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached, set()
+    visiting.add(abs_path)
+    children = []
+    cut = set()
+    for imported in get_heading_imports(abs_path):
+        if imported in visiting:
+            cut.add(imported)
+            continue
+        value, child_cut = _import_closure(imported, cache, combine, visiting)
+        children.append(value)
+        cut |= child_cut
+    visiting.discard(abs_path)
+    cut.discard(abs_path)
+    value = combine(abs_path, children)
+    if not cut:
+        cache[key] = value
+    return value, cut
+
+def _combine_headings(abs_path, children):
+    # 导入文件的锚点在前、自身锚点在后（与页面渲染顺序一致）
+    return tuple(itertools.chain.from_iterable(children)) + get_own_headings(abs_path)
+
+def _combine_files(abs_path, children):
+    return frozenset({abs_path}).union(*children)
+
+def extract_headings_from_file(file_path):
+    """从mdx文件中提取所有锚点（标题 + ParamField 等组件），包含通过 import 引入的文件的锚点"""
+    abs_path = os.path.abspath(file_path)
+    return list(_import_closure(abs_path, _closure_headings_cache, _combine_headings, set())[0])
+
+def get_import_closure_files(file_path):
+    """返回文件自身及其直接或间接 import 的全部 mdx 文件（绝对路径）"""
+    abs_path = os.path.abspath(file_path)
+    return _import_closure(abs_path, _closure_files_cache, _combine_files, set())[0]
+
+def find_import_cycle(file_path, import_path):
+    """若 file_path 通过 import_path 引入的文件又（直接或间接）导入了 file_path，返回环上的文件列表
+
+    列表以 file_path 开头和结尾，如 [a.mdx, b.mdx, a.mdx]；不构成循环时返回 None。
+    """
+    abs_path = os.path.abspath(file_path)
+    target = resolve_heading_import(import_path, abs_path)
+    if target is None or abs_path not in get_import_closure_files(target):
+        return None
+    # 按广度优先找出最短的环，便于定位
+    parents = {target: None}
+    queue = deque([target])
+    while queue:
+        current = queue.popleft()
+        if current == abs_path:
+            break
+        for imported in get_heading_imports(current):
+            if imported not in parents:
+                parents[imported] = current
+                queue.append(imported)
+    path = []
+    node = abs_path
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    return [abs_path] + path[::-1]
+
 def heading_to_anchor(heading_text):
     """将标题文本转换为锚点格式
 
@@ -857,6 +1145,84 @@ def _normalize_for_anchor_compare(value: str) -> str:
     normalized = re.sub(r'^[\d\.\s]*', '', normalized)
     return normalized
 
+# 锚点缓存：(文件绝对路径, mtime_ns, size) -> {'lower': 小写锚点集合, 'normalized': 宽松匹配锚点集合}
+# 同一文件被多个链接引用时只解析一次，文件变化后 mtime/size 不同会自动失效
+_anchor_cache = {}
+
+def get_file_anchors(file_path):
+    """获取文件的锚点集合（带缓存）
+
+    返回 dict：
+        lower: 锚点统一小写后的集合，供当前文件锚点（#xxx）精确比较
+        normalized: 经 _normalize_for_anchor_compare 处理后的集合，供跨文件锚点宽松比较
+    """
+    abs_path = os.path.abspath(file_path)
+    key = _file_cache_key(abs_path)
+    anchors = _anchor_cache.get(key)
+    if _profile is not None:
+        _profile_cache_access('anchor', anchors is not None)
+    if anchors is None:
+        headings = extract_headings_from_file(abs_path)
+        anchors = {
+            'lower': frozenset(h.lower() for h in headings),
+            'normalized': frozenset(_normalize_for_anchor_compare(h) for h in headings),
+        }
+        _anchor_cache[key] = anchors
+    return anchors
+
+# 文件ID索引缓存：实例目录绝对路径 -> {'ids': {文件ID: 文件路径}, 'no_dash': {无连字符文件ID: 文件路径}}
+# 每次运行只构建一次，check_instance_links 与 check_git_mode 共享
+_doc_id_index_cache = {}
+
+def build_doc_id_index(abs_path_dir, mdx_files=None):
+    """遍历实例目录，构建文件ID到mdx文件路径的索引
+
+    文件ID规则与 check_root_link 一致：路径各段转小写、空格转连字符并去掉 .mdx 后缀；
+    同时生成不带连字符的版本用于宽松匹配。同一ID对应多个文件时保留遍历顺序中的第一个。
+    mdx_files 为已知的文件列表（如 check_all.py 的单次遍历结果）时不再遍历目录。
+    """
+    ids = {}
+    no_dash = {}
+    if mdx_files is None:
+        mdx_files = find_mdx_files(abs_path_dir)
+    for full_path in mdx_files:
+        rel_id, rel_id_no_dash = doc_ids_for_file(full_path, abs_path_dir)
+        ids.setdefault(rel_id, full_path)
+        no_dash.setdefault(rel_id_no_dash, full_path)
+    return {'ids': ids, 'no_dash': no_dash}
+
+def doc_ids_for_file(full_path, abs_path_dir):
+    """返回文件在实例目录下的 (文件ID, 不带连字符的文件ID)"""
+    # 获取文件的完整相对路径
+    rel = os.path.relpath(full_path, abs_path_dir)
+    rel = rel.replace('\\', '/')
+
+    # 去掉.mdx后缀
+    rel_without_ext = os.path.splitext(rel)[0]
+    segments = rel_without_ext.split('/')
+
+    # 将路径转换为文件ID格式：小写+连接线
+    rel_id = '/'.join(part.lower().replace(' ', '-') for part in segments)
+    # 同时生成不带连字符的版本进行匹配
+    rel_id_no_dash = '/'.join(part.lower().replace(' ', '').replace('-', '') for part in segments)
+    return rel_id, rel_id_no_dash
+
+def prime_doc_id_index(abs_path_dir, mdx_files):
+    """用已知的文件列表（须为 os.walk 顺序）预先构建实例目录的文件ID索引，避免再次遍历目录"""
+    abs_path_dir = os.path.normpath(abs_path_dir)
+    _doc_id_index_cache[abs_path_dir] = build_doc_id_index(abs_path_dir, mdx_files)
+
+def get_doc_id_index(abs_path_dir):
+    """获取实例目录的文件ID索引（按目录缓存，首次访问时构建）"""
+    abs_path_dir = os.path.normpath(abs_path_dir)
+    index = _doc_id_index_cache.get(abs_path_dir)
+    if _profile is not None:
+        _profile_cache_access('doc_id_index', index is not None)
+    if index is None:
+        index = build_doc_id_index(abs_path_dir)
+        _doc_id_index_cache[abs_path_dir] = index
+    return index
+
 def check_root_link(link, config, instance, repo_root):
     """检查站内根路径链接是否有效
 
@@ -867,73 +1233,110 @@ def check_root_link(link, config, instance, repo_root):
     if not link.startswith('/'):
         return None
 
-    # 分离链接和锚点
-    if '#' in link:
-        link_path, anchor = link.split('#', 1)
-    else:
-        link_path, anchor = link, None
-
-    # /routeBasePath/xxx
-    parts = link_path[1:].split('/')
-    if not parts:
+    found_file, anchor = resolve_root_link(link, config, repo_root)
+    if not found_file:
         return False
 
-    # 在所有实例中查找匹配的routeBasePath（支持跨实例链接）
-    matched_base = None
-    matched_instances = []
+    # 如果有锚点，检查锚点是否存在（大小写不敏感）
+    if anchor:
+        # 宽松匹配：统一小写并移除空格与短横线
+        anchor_norm = _normalize_for_anchor_compare(anchor)
+        if anchor_norm not in get_file_anchors(found_file)['normalized']:
+            # 路径存在但锚点不存在
+            return 'anchor_invalid'
+
+    return True
 
-    # 先尝试精确匹配，再尝试前缀匹配
-    for inst in config['instances']:
+_route_trie_cache = {}  # id(config) -> (config, routeBasePath 分段前缀树)
+
+def build_route_trie(instances):
+    """按 routeBasePath 的路径段构建前缀树
+
+    每个节点为 (子节点字典, 条目列表)。对每个实例插入完整的 routeBasePath（偏移 0，精确匹配），
+    以及去掉前 i 段后的各个后缀（偏移 i，用于 /zim-android/... 匹配 zh/zim-android 这类后缀匹配）。
+    条目为 (实例序号, 偏移, 匹配段数)。
+    """
+    root = ({}, [])
+    for idx, inst in enumerate(instances):
         base = inst['routeBasePath'].strip('/')
         if not base:  # 跳过空的routeBasePath
             continue
-
         base_parts = base.split('/')
-        # 检查链接是否以这个routeBasePath开头
-        if len(parts) >= len(base_parts) and parts[:len(base_parts)] == base_parts:
-            # 如果找到更长的匹配，替换之前的匹配
-            if not matched_base or len(base_parts) > len(matched_base.split('/')):
-                matched_base = base
+        for offset in range(len(base_parts)):
+            node = root
+            for seg in base_parts[offset:]:
+                node = node[0].setdefault(seg, ({}, []))
+            node[1].append((idx, offset, len(base_parts) - offset))
+    return root
+
+def get_route_trie(config):
+    entry = _route_trie_cache.get(id(config))
+    if entry is None or entry[0] is not config:
+        # 保留配置对象的引用，保证 id 不会被复用
+        entry = (config, build_route_trie(config['instances']))
+        _route_trie_cache[id(config)] = entry
+    return entry[1]
+
+def match_route_base(parts, config):
+    """查找与链接路径段 parts 匹配的实例
+
+    返回 (匹配的实例列表, routeBasePath 在链接中占用的段数)，无匹配时实例列表为空。
+    先沿前缀树找出所有匹配的实例（每个实例取最长的匹配：精确匹配优先，其次最长后缀），
+    再按配置顺序套用逐个实例比较时的取舍规则：更长的匹配替换之前的结果，同样长度的并列（处理复用情况）。
+    """
+    candidates = {}
+    node = get_route_trie(config)
+    for seg in parts:
+        node = node[0].get(seg)
+        if node is None:
+            break
+        for idx, offset, length in node[1]:
+            # 越深的节点匹配越长，直接覆盖
+            candidates[idx] = (offset, length)
+
+    instances = config['instances']
+    matched_parts_len = 0  # 当前选中的 routeBasePath 的总段数
+    matched_length = 0
+    matched_instances = []
+    for idx in sorted(candidates):
+        offset, length = candidates[idx]
+        inst = instances[idx]
+        if offset == 0:
+            # 精确匹配
+            if not matched_instances or length > matched_parts_len:
+                matched_parts_len = matched_length = length
+                matched_instances = [inst]
+            elif length == matched_parts_len:
+                matched_instances.append(inst)
+        else:
+            # 后缀匹配：与已选中 routeBasePath 的同样数量的末尾段比较长度
+            if not matched_instances or length > min(length, matched_parts_len):
+                matched_parts_len = length + offset
+                matched_length = length
                 matched_instances = [inst]
-            elif matched_base and len(base_parts) == len(matched_base.split('/')):
-                # 同样长度的匹配，添加到列表中（处理复用情况）
+            else:
                 matched_instances.append(inst)
+    return matched_instances, matched_length
 
-        # 如果精确匹配失败，尝试后缀匹配（处理ZIM等情况）
-        # 例如：链接 /zim-android/... 匹配配置 zh/zim-android
-        elif len(base_parts) > 1:
-            # 取routeBasePath的最后几个部分进行匹配
-            for i in range(1, len(base_parts)):
-                suffix_parts = base_parts[i:]
-                if len(parts) >= len(suffix_parts) and parts[:len(suffix_parts)] == suffix_parts:
-                    # 如果找到更长的匹配，替换之前的匹配
-                    if not matched_base or len(suffix_parts) > len(matched_base.split('/')[-len(suffix_parts):]):
-                        matched_base = base
-                        matched_instances = [inst]
-                    elif matched_base and len(suffix_parts) == len(matched_base.split('/')[-len(suffix_parts):]):
-                        # 同样长度的匹配，添加到列表中
-                        matched_instances.append(inst)
-                    break
+def resolve_root_link(link, config, repo_root):
+    """将站内根路径链接解析为对应的 mdx 文件
 
-    if not matched_base or not matched_instances:
-        return False
+    返回 (文件路径, 锚点)，找不到匹配的 routeBasePath 或文件时文件路径为 None。
+    """
+    # 分离链接和锚点
+    if '#' in link:
+        link_path, anchor = link.split('#', 1)
+    else:
+        link_path, anchor = link, None
 
-    # 提取文件id（去掉routeBasePath部分）
-    base_parts = matched_base.split('/')
+    # /routeBasePath/xxx
+    parts = link_path[1:].split('/')
+    if not parts:
+        return None, anchor
 
-    # 确定实际匹配的部分长度
-    matched_length = len(base_parts)
-    # 检查是否是后缀匹配
-    if len(parts) >= len(base_parts) and parts[:len(base_parts)] == base_parts:
-        # 精确匹配
-        matched_length = len(base_parts)
-    else:
-        # 后缀匹配，找到实际匹配的长度
-        for i in range(1, len(base_parts)):
-            suffix_parts = base_parts[i:]
-            if len(parts) >= len(suffix_parts) and parts[:len(suffix_parts)] == suffix_parts:
-                matched_length = len(suffix_parts)
-                break
+    matched_instances, matched_length = match_route_base(parts, config)
+    if not matched_instances:
+        return None, anchor
 
     file_id_parts = parts[matched_length:]
     if not file_id_parts:
@@ -944,63 +1347,43 @@ def check_root_link(link, config, instance, repo_root):
 
     # 在所有匹配的实例路径下查找文件（处理复用情况）
     found_file = None
+    file_id_no_dash = file_id.lower().replace('-', '').replace(' ', '')
     for matched_inst in matched_instances:
         path_dir = matched_inst['path']
         abs_path_dir = os.path.join(repo_root, path_dir) if not os.path.isabs(path_dir) else path_dir
         abs_path_dir = os.path.normpath(abs_path_dir)
 
-        # 遍历该目录下所有mdx文件，找file_id是否能对上
-        for dirpath, _, filenames in os.walk(abs_path_dir):
-            for fname in filenames:
-                if fname.lower().endswith('.mdx'):
-                    # 获取文件的完整相对路径
-                    full_path = os.path.join(dirpath, fname)
-                    rel = os.path.relpath(full_path, abs_path_dir)
-                    rel = rel.replace('\\', '/')
-
-                    # 去掉.mdx后缀
-                    rel_without_ext = os.path.splitext(rel)[0]
-
-                    # 将路径转换为文件ID格式：小写+连接线
-                    rel_id = '/'.join(part.lower().replace(' ', '-') for part in rel_without_ext.split('/'))
-
-                    # 同时生成不带连字符的版本进行匹配
-                    rel_id_no_dash = '/'.join(part.lower().replace(' ', '').replace('-', '') for part in rel_without_ext.split('/'))
-                    file_id_no_dash = file_id.lower().replace('-', '').replace(' ', '')
-
-                    if rel_id == file_id or rel_id_no_dash == file_id_no_dash:
-                        found_file = full_path
-                        break
-            if found_file:
-                break
+        # 通过预先构建的文件ID索引查找，避免每个链接都遍历一次目录
+        doc_index = get_doc_id_index(abs_path_dir)
+        found_file = doc_index['ids'].get(file_id) or doc_index['no_dash'].get(file_id_no_dash)
         if found_file:
             break
 
-    if not found_file:
-        return False
+    return found_file, anchor
 
-    # 如果有锚点，检查锚点是否存在（大小写不敏感）
-    if anchor:
-        headings = extract_headings_from_file(found_file)
-        # 宽松匹配：统一小写并移除空格与短横线
-        anchor_norm = _normalize_for_anchor_compare(anchor)
-        headings_norm = [_normalize_for_anchor_compare(h) for h in headings]
-        if anchor_norm not in headings_norm:
-            # 路径存在但锚点不存在
-            return 'anchor_invalid'
+# 外链并发检查参数
+REMOTE_MAX_WORKERS = 16          # 全局并发线程数
+REMOTE_PER_HOST_LIMIT = 4        # 同一域名的最大并发请求数（同时也是该域名连接池大小）
+REMOTE_HOST_MIN_INTERVAL = 0.05  # 同一域名两次请求发起之间的最小间隔（秒）
 
-    return True
+# 外链检查结果缓存：url -> check_remote_link 的返回值，同一次运行内多个实例共享
+_remote_result_cache = {}
+# 每个域名复用一个 Session（带连接池），以及对应的并发/限速状态
+_host_sessions = {}
+_host_limits = {}
+_host_lock = threading.Lock()
 
-def check_remote_link(link):
+def should_check_remote_link(link):
+    """判断链接是否需要发起外链请求"""
     # 只检查http/https开头，且不是zego.im/zegocloud.com
     if not re.match(r'https?://', link):
-        return None
+        return False
     if re.search(r'https?://[^/]*zego\.im', link) or re.search(r'https?://[^/]*zegocloud\.com', link):
-        return None
+        return False
 
     # old-doc 链接不发起请求
     if is_old_doc_url_any(link):
-        return None
+        return False
 
     # 跳过特定格式的链接
     # https://xxx-api-xxx 或 https://xxxapi.xxx 或 https://yourxxx 或 以/chat/completions结尾的链接
@@ -1008,13 +1391,166 @@ def check_remote_link(link):
        re.search(r'https?://[^/]*api\.[^/]*', link) or \
        re.search(r'https?://your[^/]*', link) or \
        link.endswith('/chat/completions'):
+        return False
+    return True
+
+# 外链结果持久化缓存（JSON Lines，每行一条结果，同一 URL 以最后一行为准）
+REMOTE_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'remote_link_cache.jsonl')
+REMOTE_CACHE_TTL_OK_HOURS = 24 * 7   # 检查成功的结果缓存 7 天
+REMOTE_CACHE_TTL_FAIL_HOURS = 24     # 检查失败的结果缓存 1 天
+# 超时、连接错误与下列状态码视为临时失败，不写入持久化缓存，下次运行重新检查
+REMOTE_TRANSIENT_ERRORS = ('请求超时', '连接错误')
+REMOTE_TRANSIENT_STATUS = (429, 500, 502, 503, 504)
+
+_remote_cache_settings = {
+    'enabled': True,
+    'ttl_ok': REMOTE_CACHE_TTL_OK_HOURS * 3600,
+    'ttl_fail': REMOTE_CACHE_TTL_FAIL_HOURS * 3600,
+    'refresh': False,
+}
+_remote_disk_cache = None  # url -> 缓存记录，首次使用时加载
+
+def configure_remote_cache(enabled=True, ttl_ok_hours=None, ttl_fail_hours=None, refresh=False):
+    """设置外链持久化缓存（命令行参数入口）"""
+    _remote_cache_settings['enabled'] = enabled
+    if ttl_ok_hours is not None:
+        _remote_cache_settings['ttl_ok'] = ttl_ok_hours * 3600
+    if ttl_fail_hours is not None:
+        _remote_cache_settings['ttl_fail'] = ttl_fail_hours * 3600
+    _remote_cache_settings['refresh'] = refresh
+
+def _load_remote_disk_cache():
+    """加载外链持久化缓存；重复记录过多时顺便压缩文件"""
+    global _remote_disk_cache
+    if _remote_disk_cache is not None:
+        return _remote_disk_cache
+
+    _remote_disk_cache = {}
+    line_count = 0
+    try:
+        with open(REMOTE_CACHE_PATH, 'r', encoding='utf-8') as f:
+            for raw in f:
+                raw = raw.strip()
+                if not raw:
+                    continue
+                line_count += 1
+                try:
+                    record = json.loads(raw)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and record.get('url'):
+                    _remote_disk_cache[record['url']] = record
+    except FileNotFoundError:
+        return _remote_disk_cache
+    except Exception as e:
+        print(f'{Fore.YELLOW}警告：无法加载外链缓存文件：{e}{Style.RESET_ALL}')
+        return _remote_disk_cache
+
+    now = time.time()
+    live_count = sum(1 for record in _remote_disk_cache.values() if not _remote_record_stale(record, now))
+    if line_count > 2 * live_count + 100:
+        _rewrite_remote_disk_cache()
+    return _remote_disk_cache
+
+def _is_transient_remote_result(result):
+    """超时、连接错误、限流或服务端错误：结果不代表链接本身无效"""
+    if result.get('valid'):
+        return False
+    return result.get('error') in REMOTE_TRANSIENT_ERRORS or result.get('status_code') in REMOTE_TRANSIENT_STATUS
+
+def _remote_record_stale(record, now):
+    """缓存记录已过期，或是（旧版本写入的）临时失败"""
+    if _is_transient_remote_result(record):
+        return True
+    ttl = _remote_cache_settings['ttl_ok'] if record.get('valid') else _remote_cache_settings['ttl_fail']
+    return now - record.get('checked_at', 0) > ttl
+
+def _rewrite_remote_disk_cache():
+    """压缩缓存文件：每个 URL 只保留最后一条记录，并丢弃过期的记录"""
+    tmp_path = REMOTE_CACHE_PATH + '.tmp'
+    now = time.time()
+    for url in [url for url, record in _remote_disk_cache.items() if _remote_record_stale(record, now)]:
+        del _remote_disk_cache[url]
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in _remote_disk_cache.values():
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, REMOTE_CACHE_PATH)
+    except Exception as e:
+        print(f'{Fore.YELLOW}警告：无法写入外链缓存文件：{e}{Style.RESET_ALL}')
+
+def _get_cached_remote_result(url):
+    """从持久化缓存中读取未过期的结果，未命中返回 None"""
+    if not _remote_cache_settings['enabled'] or _remote_cache_settings['refresh']:
         return None
+    record = _load_remote_disk_cache().get(url)
+    if not record or _remote_record_stale(record, time.time()):
+        return None
+    result = {'valid': record.get('valid', False)}
+    for key in ('error', 'status_code', 'final_url'):
+        if record.get(key) is not None:
+            result[key] = record[key]
+    return result
 
+def _store_remote_results(results):
+    """将本批新检查的结果追加写入持久化缓存（临时失败不写入）"""
+    if not _remote_cache_settings['enabled'] or not results:
+        return
+    cache = _load_remote_disk_cache()
+    now = time.time()
     try:
-        resp = requests.head(link, allow_redirects=True, timeout=5)
+        with open(REMOTE_CACHE_PATH, 'a', encoding='utf-8') as f:
+            for url, result in results.items():
+                if result is None or _is_transient_remote_result(result):
+                    continue
+                record = {
+                    'url': url,
+                    'valid': result.get('valid', False),
+                    'status_code': result.get('status_code'),
+                    'final_url': result.get('final_url'),
+                    'error': result.get('error'),
+                    'checked_at': now,
+                }
+                cache[url] = record
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    except Exception as e:
+        print(f'{Fore.YELLOW}警告：无法写入外链缓存文件：{e}{Style.RESET_ALL}')
+
+def _get_host_session(host):
+    """获取域名对应的 Session 及限速状态（线程安全）"""
+    with _host_lock:
+        session = _host_sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=REMOTE_PER_HOST_LIMIT)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _host_sessions[host] = session
+            _host_limits[host] = {
+                'semaphore': threading.BoundedSemaphore(REMOTE_PER_HOST_LIMIT),
+                'lock': threading.Lock(),
+                'next_time': 0.0,
+            }
+        return session, _host_limits[host]
+
+def _wait_host_rate_limit(limit):
+    """按域名限速：保证同一域名的请求发起间隔不小于 REMOTE_HOST_MIN_INTERVAL"""
+    with limit['lock']:
+        now = time.monotonic()
+        wait = limit['next_time'] - now
+        limit['next_time'] = max(now, limit['next_time']) + REMOTE_HOST_MIN_INTERVAL
+    if wait > 0:
+        time.sleep(wait)
+
+def check_remote_link(link, session=None):
+    if not should_check_remote_link(link):
+        return None
+
+    try:
+        resp = (session or requests).head(link, allow_redirects=True, timeout=5)
         if resp.status_code != 200:
-            return {'valid': False, 'error': f'HTTP {resp.status_code}'}
-        return {'valid': True}
+            return {'valid': False, 'error': f'HTTP {resp.status_code}', 'status_code': resp.status_code, 'final_url': resp.url}
+        return {'valid': True, 'status_code': resp.status_code, 'final_url': resp.url}
     except requests.exceptions.Timeout:
         return {'valid': False, 'error': '请求超时'}
     except requests.exceptions.ConnectionError:
@@ -1024,8 +1560,69 @@ def check_remote_link(link):
     except Exception as e:
         return {'valid': False, 'error': f'其他错误: {str(e)}'}
 
+def _check_remote_link_with_host_limit(link):
+    host = urllib.parse.urlsplit(link).netloc.lower()
+    session, limit = _get_host_session(host)
+    with limit['semaphore']:
+        _wait_host_rate_limit(limit)
+        return check_remote_link(link, session=session)
+
+def check_remote_links(urls, max_workers=None):
+    """并发检查一批外链，返回 {url: 检查结果}
+
+    - 先去重，已在本次运行中检查过的 URL 直接复用结果
+    - 持久化缓存（remote_link_cache.jsonl）中未过期的结果直接复用，不再发起请求
+    - 使用有界线程池并发请求，同一域名复用连接池并限制并发与请求频率
+    - 不需要检查的链接结果为 None（与 check_remote_link 一致）
+    """
+    results = {}
+    pending = []
+    cache_hits = 0
+    for url in dict.fromkeys(urls):
+        if url in _remote_result_cache:
+            results[url] = _remote_result_cache[url]
+            if _profile is not None:
+                _profile_cache_access('remote_memory', True)
+        elif not should_check_remote_link(url):
+            results[url] = None
+        else:
+            cached = _get_cached_remote_result(url)
+            if _profile is not None:
+                _profile_cache_access('remote_memory', False)
+                if _remote_cache_settings['enabled'] and not _remote_cache_settings['refresh']:
+                    _profile_cache_access('remote_disk', cached is not None)
+            if cached is not None:
+                cache_hits += 1
+                _remote_result_cache[url] = cached
+                results[url] = cached
+            else:
+                pending.append(url)
+
+    if cache_hits:
+        print(f'外链缓存命中 {cache_hits} 个')
+
+    if pending:
+        workers = max(1, min(max_workers or REMOTE_MAX_WORKERS, len(pending)))
+        print(f'正在并发检查 {len(pending)} 个外链（{workers} 线程）...')
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            future_to_url = {executor.submit(_check_remote_link_with_host_limit, url): url for url in pending}
+            for done, future in enumerate(as_completed(future_to_url), 1):
+                url = future_to_url[future]
+                result = future.result()
+                _remote_result_cache[url] = result
+                results[url] = result
+                print(f'\r外链检查进度: {done}/{len(pending)}', end='', flush=True)
+        print()
+        _store_remote_results({url: results[url] for url in pending})
+
+    return results
+
 def check_mdx_import(import_path, base_file_path, repo_root):
     """检查MDX导入路径是否有效"""
+    return resolve_mdx_import(import_path, base_file_path, repo_root) is not None
+
+def resolve_mdx_import(import_path, base_file_path, repo_root):
+    """解析MDX导入路径对应的文件，找不到时返回 None"""
     # 处理相对路径（./或../开头）
     if import_path.startswith('./') or import_path.startswith('../'):
         # 相对于当前文件所在目录
@@ -1038,25 +1635,176 @@ def check_mdx_import(import_path, base_file_path, repo_root):
 
     # 1) 明确以某个扩展名结尾：要求存在对应文件
     if import_path.lower().endswith(('.mdx', '.md', '.jsx', '.js', '.ts', '.tsx')):
-        return os.path.isfile(full_path)
+        return full_path if os.path.isfile(full_path) else None
 
     # 2) 可能是省略扩展名的文件：尝试多种扩展名
     for ext in ['.mdx', '.jsx', '.js', '.ts', '.tsx']:
         candidate_file = full_path + ext
         if os.path.isfile(candidate_file):
-            return True
+            return candidate_file
 
     # 3) 可能是目录写法：尝试目录下的 index.mdx 或 index.jsx
     if os.path.isdir(full_path):
         for index_name in ['index.mdx', 'index.jsx', 'index.js', 'index.ts', 'index.tsx']:
             index_file = os.path.join(full_path, index_name)
             if os.path.isfile(index_file):
-                return True
-        return False
+                return index_file
+        return None
 
     # 4) 既不是文件也不是目录
-    return False
+    return None
 
+def resolve_link_target(link_info, base_file_path, config, repo_root):
+    """解析链接指向的本地文件
+
+    返回 (目标文件路径, 锚点)；外链或无法解析的链接返回 (None, None)。
+    """
+    url = link_info['url']
+    if link_info['type'] == 'mdx_import':
+        return resolve_mdx_import(url, base_file_path, repo_root), None
+    if url.startswith('#'):
+        return base_file_path, url[1:]
+    if url.startswith('./') or url.startswith('../'):
+        link_path, _, anchor = url.partition('#')
+        if not link_path.lower().endswith('.mdx'):
+            return None, None
+        abs_path = os.path.normpath(os.path.join(os.path.dirname(base_file_path), urllib.parse.unquote(link_path)))
+        return (abs_path if os.path.exists(abs_path) else None), anchor or None
+    if url.startswith('/'):
+        return resolve_root_link(url, config, repo_root)
+    return None, None
+
+def _repo_rel_path(path, repo_root):
+    return os.path.relpath(os.path.abspath(path), repo_root).replace('\\', '/')
+
+def _route_key(abs_instance_dir, file_id_no_dash, repo_root):
+    return f'route:{_repo_rel_path(abs_instance_dir, repo_root)}/{file_id_no_dash}'
+
+def unresolved_link_keys(link_info, base_file_path, config, repo_root):
+    """站内链接解析不到现有文件时（如目标已删除/重命名），返回其目标的规范化键列表
+
+    - 相对路径 .mdx 链接、mdx import：目标文件相对仓库根目录的路径
+    - 站内根路径链接：route:<实例目录>/<不带连字符的文件ID>（每个匹配的实例一个，与 resolve_root_link 的宽松匹配一致）
+    外链等其他链接返回空列表。
+    """
+    url = link_info['url']
+    if link_info['type'] == 'mdx_import':
+        if url.startswith('./') or url.startswith('../'):
+            full_path = os.path.normpath(os.path.join(os.path.dirname(base_file_path), url))
+        else:
+            full_path = os.path.join(repo_root, url.lstrip('/'))
+        if not url.lower().endswith(('.mdx', '.md', '.jsx', '.js', '.ts', '.tsx')):
+            full_path += '.mdx'
+        return [_repo_rel_path(full_path, repo_root)]
+    link_path = url.partition('#')[0]
+    if url.startswith('./') or url.startswith('../'):
+        if not link_path.lower().endswith('.mdx'):
+            return []
+        abs_path = os.path.join(os.path.dirname(base_file_path), urllib.parse.unquote(link_path))
+        return [_repo_rel_path(abs_path, repo_root)]
+    if url.startswith('/'):
+        parts = link_path[1:].split('/')
+        matched_instances, matched_length = match_route_base(parts, config)
+        file_id = '/'.join(parts[matched_length:]) or 'index'
+        file_id_no_dash = file_id.lower().replace('-', '').replace(' ', '')
+        keys = []
+        for inst in matched_instances:
+            path_dir = inst['path']
+            abs_path_dir = path_dir if os.path.isabs(path_dir) else os.path.join(repo_root, path_dir)
+            keys.append(_route_key(os.path.normpath(abs_path_dir), file_id_no_dash, repo_root))
+        return keys
+    return []
+
+def graph_target_keys(rel_paths, config, repo_root):
+    """返回文件在反向链接图中可能的目标键：文件路径本身，以及各所属实例下的 route 键
+
+    用于查询指向已删除/重命名文件的链接（这些链接在图中以 unresolved_link_keys 的键记录）。
+    """
+    keys = set(rel_paths)
+    instance_dirs = set()
+    for instance in config.get('instances', []):
+        path_dir = instance.get('path', '')
+        if not path_dir or path_dir.startswith('http'):
+            continue
+        abs_path_dir = path_dir if os.path.isabs(path_dir) else os.path.join(repo_root, path_dir)
+        instance_dirs.add(os.path.normpath(abs_path_dir))
+    for rel_path in rel_paths:
+        abs_path = os.path.normpath(os.path.join(repo_root, rel_path))
+        for abs_path_dir in instance_dirs:
+            if abs_path.startswith(abs_path_dir + os.sep):
+                _, file_id_no_dash = doc_ids_for_file(abs_path, abs_path_dir)
+                keys.add(_route_key(abs_path_dir, file_id_no_dash, repo_root))
+    return keys
+
+def build_link_edges(file_path, config, repo_root):
+    """提取文件中所有站内链接，作为反向链接图的出边
+
+    能解析到现有文件的链接以目标文件路径记录；解析不到的（如目标已删除）以 unresolved_link_keys 的键记录，
+    这样首次构建链接图时，指向暂存区中已删除/重命名文件的链接也能被查到。
+    """
+    edges = []
+    for link_info in extract_links_from_file(file_path):
+        target, anchor = resolve_link_target(link_info, file_path, config, repo_root)
+        if target:
+            edges.append((_repo_rel_path(target, repo_root), anchor or '', link_info['line'], link_info['type']))
+            continue
+        anchor = '' if link_info['type'] == 'mdx_import' else link_info['url'].partition('#')[2]
+        for key in unresolved_link_keys(link_info, file_path, config, repo_root):
+            edges.append((key, anchor, link_info['line'], link_info['type']))
+    return edges
+
+def update_link_graph(graph, config, repo_root, source_files):
+    """按 mtime/size 与内容 sha1 增量刷新反向链接图，返回本次重新提取的文件数
+
+    source_files 为当前全部源文件（绝对路径），不在其中的旧记录会被删除。
+    """
+    refreshed = 0
+    seen = set()
+    for abs_path in source_files:
+        rel_path = _repo_rel_path(abs_path, repo_root)
+        seen.add(rel_path)
+        stamp = file_stamp(abs_path)
+        if stamp is None:
+            continue
+        record = graph.get_file(rel_path)
+        if record is not None and record[0] == stamp:
+            continue
+        sha1 = file_sha1(abs_path)
+        if record is not None and record[1] == sha1:
+            # 内容未变化（如 git checkout 只改变了 mtime），只更新时间戳
+            graph.touch_file(rel_path, stamp)
+            continue
+        try:
+            edges = build_link_edges(abs_path, config, repo_root)
+        except Exception:
+            edges = []
+        graph.update_file(rel_path, stamp, sha1, edges)
+        refreshed += 1
+    for rel_path in graph.source_files() - seen:
+        graph.remove_file(rel_path)
+    return refreshed
+
+def refresh_link_graph(graph, repo_root):
+    """使用全部实例配置增量刷新反向链接图，返回本次重新提取的文件数"""
+    config = _load_all_instances_config(repo_root)
+    return update_link_graph(graph, config, repo_root, find_all_instance_mdx_files(config, repo_root))
+
+def find_all_instance_mdx_files(config, repo_root):
+    """返回配置中所有实例目录（去重）下的 mdx 文件"""
+    files = []
+    seen_paths = set()
+    for instance in config.get('instances', []):
+        instance_path = instance.get('path', '')
+        if not instance_path or instance_path.startswith('http'):
+            continue
+        if not os.path.isabs(instance_path):
+            instance_path = os.path.join(repo_root, instance_path)
+        instance_path = os.path.normpath(instance_path)
+        if instance_path in seen_paths:
+            continue
+        seen_paths.add(instance_path)
+        files.extend(find_mdx_files(instance_path))
+    return files
 
 def is_old_doc_url_any(url):
     """判断是否为旧文档链接（不区分实例语言）"""
@@ -1099,56 +1847,375 @@ def _load_all_instances_config(repo_root):
             merged['instances'].append(inst)
     return merged
 
-def _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url):
-    """将 check_instance_links 的结果归并到 structured_results 和 aggregated_by_url"""
-    if display_name not in structured_results:
-        structured_results[display_name] = {}
+def _iter_result_records(problems, collected_urls, display_name):
+    """将 check_instance_links 的结果展开为逐条记录（流式输出与结果归并共用）"""
+    yield {'type': 'instance', 'instance': display_name, 'error_types': list(problems.keys())}
     for ptype, items in problems.items():
-        if ptype not in structured_results[display_name]:
-            structured_results[display_name][ptype] = {}
         for it in items:
-            abs_file = os.path.abspath(it.get('file', ''))
-            line_num = it.get('line', 0)
-            entry = {
+            record = {
+                'type': 'problem',
+                'instance': display_name,
+                'error_type': ptype,
+                'file': os.path.abspath(it.get('file', '')),
+                'line': it.get('line', 0),
                 'url': it.get('url', ''),
                 'line_content': it.get('line_content', ''),
-                'file_with_line': f"{abs_file}:{line_num}",
+                'link_type': it.get('link_type'),
             }
             if 'error' in it:
-                entry['error'] = it['error']
-
-            if abs_file not in structured_results[display_name][ptype]:
-                structured_results[display_name][ptype][abs_file] = []
-            structured_results[display_name][ptype][abs_file].append(entry)
-
-            url_key = entry.get('url')
-            if url_key:
-                if url_key not in aggregated_by_url:
-                    aggregated_by_url[url_key] = []
-                aggregated_by_url[url_key].append({
-                    'instance': display_name,
-                    'error_type': ptype,
-                    'file_path': abs_file,
-                    'file_with_line': f"{abs_file}:{line_num}",
-                    'line_content': entry.get('line_content', ''),
-                    **({'error': entry['error']} if 'error' in entry else {})
-                })
-
+                record['error'] = it['error']
+            yield record
     for it in collected_urls:
-        abs_file = os.path.abspath(it.get('file', ''))
-        line_num = it.get('line', 0)
-        url_key = it.get('url', '')
-        if url_key:
-            if url_key not in aggregated_by_url:
-                aggregated_by_url[url_key] = []
-            aggregated_by_url[url_key].append({
-                'instance': display_name,
-                'error_type': 'collected',
-                'file_path': abs_file,
-                'file_with_line': f"{abs_file}:{line_num}",
-                'line_content': it.get('line_content', ''),
-            })
+        yield {
+            'type': 'collected',
+            'instance': display_name,
+            'file': os.path.abspath(it.get('file', '')),
+            'line': it.get('line', 0),
+            'url': it.get('url', ''),
+            'line_content': it.get('line_content', ''),
+            'link_type': it.get('link_type'),
+        }
+
+def _add_result_record(record, structured_results, aggregated_by_url):
+    """将一条结果记录归并到 structured_results 和 aggregated_by_url"""
+    display_name = record['instance']
+    if record['type'] == 'instance':
+        instance_results = structured_results.setdefault(display_name, {})
+        for ptype in record.get('error_types', []):
+            instance_results.setdefault(ptype, {})
+        return
+
+    abs_file = record['file']
+    line_num = record['line']
+    url_key = record.get('url', '')
+    if record['type'] == 'problem':
+        ptype = record['error_type']
+        entry = {
+            'url': url_key,
+            'line_content': record.get('line_content', ''),
+            'file_with_line': f"{abs_file}:{line_num}",
+        }
+        if 'error' in record:
+            entry['error'] = record['error']
+        structured_results.setdefault(display_name, {}).setdefault(ptype, {}).setdefault(abs_file, []).append(entry)
+        occurrence_extra = {'error': record['error']} if 'error' in record else {}
+    else:
+        ptype = 'collected'
+        occurrence_extra = {}
+
+    if url_key and aggregated_by_url is not None:
+        aggregated_by_url.setdefault(url_key, []).append({
+            'instance': display_name,
+            'error_type': ptype,
+            'file_path': abs_file,
+            'file_with_line': f"{abs_file}:{line_num}",
+            'line_content': record.get('line_content', ''),
+            **occurrence_extra
+        })
+
+def stream_partial_results(display_name):
+    """启用流式输出时，返回传给 check_instance_links 的 on_partial 回调，否则返回 None
+
+    回调把每批（每个文件/分片）新产生的问题立即写入流文件并刷新，
+    之后对同一实例调用 _collect_results 时不再重复写入。
+    """
+    if _result_stream is None:
+        return None
+    _write_stream_record({'type': 'instance', 'instance': display_name, 'error_types': []})
+    _result_stream['file'].flush()
+    _result_stream['streamed_instance'] = display_name
+
+    def on_partial(problems, collected_urls):
+        records = _iter_result_records(problems, collected_urls, display_name)
+        next(records)  # 实例记录已在开始时写入
+        for record in records:
+            _write_stream_record(record)
+        _result_stream['file'].flush()
+    return on_partial
 
+def _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url):
+    """将 check_instance_links 的结果归并到 structured_results 和 aggregated_by_url
+
+    启用流式输出（--stream）时结果直接写入流文件，不在内存中累积，
+    最终报告在 write_result_files 中由流文件重新生成。
+    """
+    if _result_stream is not None:
+        if _result_stream.pop('streamed_instance', None) == display_name:
+            # 已由 stream_partial_results 的回调逐批写入
+            return
+        for record in _iter_result_records(problems, collected_urls, display_name):
+            _write_stream_record(record)
+        _result_stream['file'].flush()
+        return
+    for record in _iter_result_records(problems, collected_urls, display_name):
+        _add_result_record(record, structured_results, aggregated_by_url)
+
+
+# 流式输出：每个文件（并行时每个分片）检查完成后立即把问题逐条写入文件并刷新，
+# 中途崩溃或 Ctrl-C 时已检查文件的结果不会丢失，也可用 --from-stream 重新生成报告。
+# - jsonl：每行一条记录（run / instance / problem / collected / end）
+# - sarif：SARIF 2.1.0，每条 result 单独占一行，文件不完整时仍可逐行恢复
+SARIF_RULE_IDS = {
+    'Import路径无效': 'import-path-invalid',
+    '循环导入': 'import-cycle',
+    '无效的纯数字链接': 'numeric-link-invalid',
+    '中英文链接混用': 'mixed-language-link',
+    '锚点链接无效': 'anchor-link-invalid',
+    '本地链接无效': 'local-link-invalid',
+    'internal-link无效': 'internal-link-invalid',
+    '远端链接无效': 'remote-link-invalid',
+    'collected': 'collected-url',
+}
+
+_result_stream = None  # {'path', 'format', 'file'}，见 open_result_stream
+
+def open_result_stream(path, fmt='jsonl'):
+    """开启流式输出，之后 _collect_results 的结果都写入 path"""
+    global _result_stream
+    f = open(path, 'w', encoding='utf-8')
+    _result_stream = {'path': path, 'format': fmt, 'file': f, 'repo_root': get_repo_root()}
+    started_at = datetime.now().isoformat()
+    if fmt == 'sarif':
+        rules = [{'id': rule_id, 'name': ptype, 'shortDescription': {'text': ptype}}
+                 for ptype, rule_id in SARIF_RULE_IDS.items()]
+        f.write('{"version": "2.1.0", '
+                '"$schema": "https://json.schemastore.org/sarif-2.1.0.json", "runs": [{"tool": ')
+        f.write(json.dumps({'driver': {'name': 'check_links', 'rules': rules}}, ensure_ascii=False))
+        f.write(', "results": [')
+        _result_stream['result_count'] = 0
+        _result_stream['started_at'] = started_at
+        _result_stream['instances'] = []
+    else:
+        _write_stream_record({'type': 'run', 'started_at': started_at, 'argv': sys.argv[1:]})
+    f.flush()
+
+def _record_to_sarif_result(record):
+    is_problem = record['type'] == 'problem'
+    ptype = record['error_type'] if is_problem else 'collected'
+    message = f"{ptype}: {record['url']}"
+    if 'error' in record:
+        message += f" ({record['error']})"
+    repo_root = _result_stream['repo_root']
+    uri = os.path.relpath(record['file'], repo_root).replace(os.sep, '/') if repo_root else record['file']
+    result = {
+        'ruleId': SARIF_RULE_IDS.get(ptype, ptype),
+        'level': 'error' if is_problem else 'none',
+        'message': {'text': message},
+        'locations': [{'physicalLocation': {
+            'artifactLocation': {'uri': uri, 'uriBaseId': '%SRCROOT%'},
+            'region': {'startLine': max(record['line'], 1)},
+        }}],
+        'properties': {k: v for k, v in record.items() if k != 'type'},
+    }
+    if not is_problem:
+        result['kind'] = 'informational'
+    return result
+
+def _write_stream_record(record):
+    f = _result_stream['file']
+    if _result_stream['format'] != 'sarif':
+        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        return
+    if record['type'] == 'instance':
+        # 实例列表写在 run.properties 中（记录其在 results 中的位置），用于按原顺序还原，包括没有问题的实例
+        _result_stream['instances'].append({
+            **{k: v for k, v in record.items() if k != 'type'},
+            'result_index': _result_stream['result_count'],
+        })
+        return
+    f.write(',\n' if _result_stream['result_count'] else '\n')
+    _result_stream['result_count'] += 1
+    f.write(json.dumps(_record_to_sarif_result(record), ensure_ascii=False))
+
+def close_result_stream(mode, language=None, check_remote=None):
+    """写入运行信息并关闭流式输出，返回流文件路径"""
+    global _result_stream
+    stream = _result_stream
+    _result_stream = None
+    meta = {'mode': mode, 'language': language, 'check_remote': check_remote,
+            'finished_at': datetime.now().isoformat()}
+    f = stream['file']
+    if stream['format'] == 'sarif':
+        properties = {**meta, 'started_at': stream['started_at'], 'instances': stream['instances']}
+        f.write('\n], "properties": ')
+        f.write(json.dumps(properties, ensure_ascii=False))
+        f.write('}]}\n')
+    else:
+        f.write(json.dumps({'type': 'end', **meta}, ensure_ascii=False) + '\n')
+    f.close()
+    return stream['path']
+
+def _sarif_result_to_record(result):
+    record = dict(result.get('properties', {}))
+    record['type'] = 'collected' if result.get('kind') == 'informational' else 'problem'
+    return record
+
+def _iter_sarif_stream_records(path):
+    """从 SARIF 流文件读取记录，文件不完整（中途退出）时逐行恢复已写入的 result"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            sarif = json.load(f)
+    except ValueError:
+        sarif = None
+
+    if sarif is not None:
+        run = sarif['runs'][0]
+        properties = run.get('properties', {})
+        instances = properties.get('instances', [])
+        next_instance = 0
+        for index, result in enumerate(run.get('results', [])):
+            while next_instance < len(instances) and instances[next_instance]['result_index'] <= index:
+                inst = instances[next_instance]
+                yield {'type': 'instance', 'instance': inst['instance'], 'error_types': inst.get('error_types', [])}
+                next_instance += 1
+            yield _sarif_result_to_record(result)
+        for inst in instances[next_instance:]:
+            yield {'type': 'instance', 'instance': inst['instance'], 'error_types': inst.get('error_types', [])}
+        yield {'type': 'end', **{k: v for k, v in properties.items() if k not in ('instances', 'started_at')}}
+        return
+
+    seen_instances = set()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip().rstrip(',')
+            if not line.startswith('{"ruleId"'):
+                continue
+            try:
+                result = json.loads(line)
+            except ValueError:
+                # 最后一行可能只写了一半
+                continue
+            record = _sarif_result_to_record(result)
+            if record['instance'] not in seen_instances:
+                seen_instances.add(record['instance'])
+                yield {'type': 'instance', 'instance': record['instance'], 'error_types': []}
+            yield record
+
+def iter_result_stream(path):
+    """逐条读取流式输出文件（jsonl 或 sarif）中的记录"""
+    with open(path, 'r', encoding='utf-8') as f:
+        head = f.read(64)
+    if head.lstrip().startswith('{"version"'):
+        yield from _iter_sarif_stream_records(path)
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # 中途退出时最后一行可能不完整
+                continue
+
+def _ordered_instance_records(records):
+    """将一个实例的记录还原为 check_instance_links 的结果顺序
+
+    流文件按文件逐批写入，问题类型交错出现；非流式时问题按类型（首次出现的顺序）分组，之后才是 collected。
+    """
+    type_order = {}
+    for record in records:
+        if record['type'] == 'problem':
+            type_order.setdefault(record['error_type'], len(type_order))
+    problem_records = sorted((r for r in records if r['type'] == 'problem'), key=lambda r: type_order[r['error_type']])
+    return problem_records + [r for r in records if r['type'] == 'collected']
+
+def read_result_stream_meta(path):
+    """读取流式输出文件中的运行信息（mode / language / check_remote）"""
+    meta = {'mode': 'stream', 'language': None, 'check_remote': None}
+    for record in iter_result_stream(path):
+        if record.get('type') == 'end':
+            meta.update({k: record.get(k) for k in ('mode', 'language', 'check_remote')})
+    return meta
+
+def _count_url(url_stats, record):
+    """累计 URL 的出现次数与分类所需的标记（报告中的 urls_by_category 只需要这些）"""
+    url = record.get('url', '')
+    if not url:
+        return
+    stats = url_stats.get(url)
+    if stats is None:
+        stats = url_stats[url] = {'count': 0, 'is_import': False, 'has_anchor_error': False}
+    stats['count'] += 1
+    if record['type'] == 'problem':
+        if record['error_type'] in ('Import路径无效', '循环导入'):
+            stats['is_import'] = True
+        elif record['error_type'] == '锚点链接无效':
+            stats['has_anchor_error'] = True
+
+def _url_stats_from_occurrences(aggregated_by_url):
+    """由内存中的 aggregated_by_url 计算与 _count_url 相同的统计"""
+    return {
+        url_key: {
+            'count': len(occurrences),
+            'is_import': any(occ.get('error_type') in ('Import路径无效', '循环导入') for occ in occurrences),
+            'has_anchor_error': any(occ.get('error_type') == '锚点链接无效' for occ in occurrences),
+        }
+        for url_key, occurrences in aggregated_by_url.items()
+    }
+
+def split_result_stream(path, out_dir):
+    """把流文件中的记录按实例拆分到 out_dir 下的文件，返回 ({实例名: 文件路径}, url_stats)
+
+    每次只在内存中保留一个实例块（一条 instance 记录及其后的记录），按 _ordered_instance_records
+    还原顺序后追加到该实例的文件中；同名实例的多个块写入同一个文件。
+    """
+    instance_files = {}
+    url_stats = {}
+    block = []
+
+    def flush_block():
+        if not block:
+            return
+        name = block[0]['instance']
+        target = instance_files.get(name)
+        if target is None:
+            target = instance_files[name] = os.path.join(out_dir, f'{len(instance_files)}.jsonl')
+        with open(target, 'a', encoding='utf-8') as f:
+            for record in [block[0]] + _ordered_instance_records(block[1:]):
+                if record['type'] != 'instance':
+                    _count_url(url_stats, record)
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        block.clear()
+
+    for record in iter_result_stream(path):
+        record_type = record.get('type')
+        if record_type == 'instance':
+            flush_block()
+            block.append(record)
+        elif record_type in ('problem', 'collected') and block:
+            block.append(record)
+    flush_block()
+    return instance_files, url_stats
+
+def _iter_split_instances(instance_files):
+    """逐个读取 split_result_stream 拆分出的实例文件，产出 (实例名, 该实例的结构化结果)"""
+    for name, path in instance_files.items():
+        structured_results = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                _add_result_record(json.loads(line), structured_results, None)
+        yield name, structured_results.get(name, {})
+
+def _write_json_report(f, fields, instances):
+    """按 json.dump(indent=2) 的格式写入报告，instances 为 (实例名, 结果) 的迭代器，逐个写入"""
+    def dumps(value, level):
+        return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + '  ' * level)
+
+    f.write('{')
+    for index, (key, value) in enumerate(fields):
+        f.write(f'{"," if index else ""}\n  {dumps(key, 1)}: ')
+        if key != 'instances':
+            f.write(dumps(value, 1))
+            continue
+        f.write('{')
+        empty = True
+        for name, instance_results in instances:
+            f.write(f'{"" if empty else ","}\n    {dumps(name, 2)}: {dumps(instance_results, 2)}')
+            empty = False
+        f.write('}' if empty else '\n  }')
+    f.write('\n}')
 
 def check_git_mode():
     """git模式：检查变更文件对应的实例"""
@@ -1224,12 +2291,234 @@ def check_git_mode():
         print(f'{Fore.RED}加载配置失败: {e}{Style.RESET_ALL}')
         return False
 
-    # 写入结构化结果到 JSON 和 Markdown 文件
+    # 写入结构化结果到 JSON 文件
     write_result_files(mode='git', structured_results=structured_results, aggregated_by_url=aggregated_by_url)
 
     # git模式只输出警告，不返回失败
     return True
 
+def _iter_instance_checks(rel_files, config, repo_root, check_remote=True, line_filter=None):
+    """按所属实例分组检查指定文件，逐个实例产出 (display_name, problems, collected_urls)"""
+    instances_map = find_instances_for_files(rel_files, config, repo_root)
+    for instance_info in instances_map.values():
+        instance = instance_info['instance']
+        instance_label = instance.get("label", "未知实例")
+        platform = get_instance_platform(instance, config)
+        display_name = f"{instance_label} ({platform})" if platform else instance_label
+
+        abs_files = [os.path.normpath(os.path.join(repo_root, f)) for f in instance_info['files']]
+        abs_files = [f for f in abs_files if os.path.isfile(f)]
+        if not abs_files:
+            continue
+        problems, collected_urls = check_instance_links(abs_files, config, instance, repo_root, check_remote=check_remote,
+                                                        line_filter=line_filter)
+        yield display_name, problems, collected_urls
+
+def _check_files_by_instance(rel_files, config, repo_root, structured_results, aggregated_by_url, line_filter=None):
+    """按所属实例分组检查指定文件（git 增量模式使用）"""
+    for display_name, problems, collected_urls in _iter_instance_checks(rel_files, config, repo_root,
+                                                                        line_filter=line_filter):
+        _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url)
+
+def collect_inbound_lines(graph, targets, exclude=()):
+    """返回其他文件中指向 targets（含通过 import 引入它们的页面）的链接所在行：{源文件相对路径: {行号, ...}}"""
+    exclude = set(exclude)
+    inbound_lines = defaultdict(set)
+    for target in graph.importers_closure(set(targets)):
+        for source, _, line, _ in graph.inbound(target):
+            if source not in exclude:
+                inbound_lines[source].add(line)
+    return inbound_lines
+
+def check_git_incremental_mode():
+    """git增量模式：只检查变更文件中的链接，以及其他文件中指向变更/删除/重命名文件的链接
+
+    依赖持久化的反向链接图（link_graph.sqlite），首次运行时会为全部实例构建，之后按文件 mtime/sha1 增量刷新。
+    """
+    print(f'{Fore.CYAN}Git增量模式：检查变更文件及指向它们的链接{Style.RESET_ALL}')
+
+    changed_files, removed_files = get_git_changed_entries()
+    if not changed_files and not removed_files:
+        print(f'{Fore.YELLOW}未发现待提交的md/mdx文件变更{Style.RESET_ALL}')
+        return True
+
+    print(f'发现{len(changed_files)}个变更、{len(removed_files)}个删除/重命名的md/mdx文件:')
+    for f in changed_files:
+        print(f'  - {f}')
+    for f in removed_files:
+        print(f'  - {f} (已删除/重命名)')
+
+    structured_results = {}
+    aggregated_by_url = {}
+
+    repo_root = get_repo_root()
+    if not repo_root:
+        print(f'{Fore.RED}未找到仓库根目录{Style.RESET_ALL}')
+        return False
+
+    try:
+        config = _load_all_instances_config(repo_root)
+    except Exception as e:
+        print(f'{Fore.RED}加载配置失败: {e}{Style.RESET_ALL}')
+        return False
+    if not config.get('instances'):
+        print(f'{Fore.RED}未找到任何实例，请检查配置文件。{Style.RESET_ALL}')
+        return False
+
+    # 刷新反向链接图（仅重新提取内容变化的文件）
+    try:
+        graph = LinkGraph.load()
+        if not graph.file_count():
+            print('首次运行，正在构建反向链接图...')
+        refreshed = update_link_graph(graph, config, repo_root, find_all_instance_mdx_files(config, repo_root))
+        graph.save()
+    except sqlite3.Error as e:
+        print(f'{Fore.RED}反向链接图读写失败: {e}（可删除 link_graph.sqlite 后重试）{Style.RESET_ALL}')
+        return False
+    print(f'反向链接图已更新（重新提取{refreshed}个文件，共{graph.file_count()}个文件）')
+
+    # 1. 检查变更文件中的所有链接
+    _check_files_by_instance(changed_files, config, repo_root, structured_results, aggregated_by_url)
+
+    # 2. 检查其他文件中指向变更/删除文件（含通过 import 引入它们的页面）的链接
+    targets = graph_target_keys(set(changed_files) | set(removed_files), config, repo_root)
+    inbound_lines = collect_inbound_lines(graph, targets, exclude=changed_files)
+
+    if inbound_lines:
+        print(f'另有{len(inbound_lines)}个文件包含指向变更文件的链接，检查对应链接...')
+        line_filter = {os.path.normpath(os.path.join(repo_root, src)): lines for src, lines in inbound_lines.items()}
+        _check_files_by_instance(sorted(inbound_lines), config, repo_root, structured_results, aggregated_by_url,
+                                 line_filter=line_filter)
+
+    write_result_files(mode='git-incremental', structured_results=structured_results, aggregated_by_url=aggregated_by_url)
+
+    # git模式只输出警告，不返回失败
+    return True
+
+def invalidate_file_caches(graph, repo_root, changed_files, removed_files, created_files):
+    """监听模式：文件变化后使常驻内存的缓存失效（文件路径均为相对仓库根目录的路径）
+
+    - 文件ID索引：只有新增或删除文件时才需要重建，且只清除包含这些文件的实例目录
+    - 锚点缓存与导入闭包缓存：变化文件本身会因 mtime/size 不同自动失效，但通过 import 引入它的页面
+      锚点中包含它的标题，需要按路径一并清除
+    """
+    for rel_path in list(created_files) + list(removed_files):
+        abs_path = os.path.normpath(os.path.join(repo_root, rel_path))
+        for instance_dir in [d for d in _doc_id_index_cache if abs_path.startswith(d + os.sep)]:
+            del _doc_id_index_cache[instance_dir]
+
+    stale = {os.path.normpath(os.path.join(repo_root, p))
+             for p in graph.importers_closure(set(changed_files) | set(removed_files))}
+    for cache in (_anchor_cache, _closure_headings_cache, _closure_files_cache):
+        for key in [k for k in cache if k[0] in stale]:
+            del cache[key]
+
+def split_files_by_language(rel_files, configs):
+    """把文件分给其所属实例对应的语言配置（中文配置优先，与 check_all_instances 一致），返回 [(config, 文件列表), ...]"""
+    groups = []
+    remaining = list(rel_files)
+    for _, config in configs:
+        matched = [f for f in remaining if find_instance_for_file(f, config) is not None]
+        if matched:
+            groups.append((config, matched))
+            matched_set = set(matched)
+            remaining = [f for f in remaining if f not in matched_set]
+    return groups
+
+def recheck_changed_files(graph, graph_config, configs, repo_root, changed_files, removed_files, check_remote=False):
+    """监听模式的一次增量检查：刷新缓存与反向链接图，检查变更文件中的全部链接，
+    以及其他文件中指向变更/删除文件的链接。返回 (按问题类型合并的问题, 检查了指向链接的文件数)
+
+    反向链接图与 git 增量模式共用合并配置 graph_config；检查时每个文件使用所属语言的配置（configs），
+    结果与 --all 一致。
+    """
+    created_files = [f for f in changed_files if graph.get_file(f) is None]
+    # 新增/删除文件会改变文件ID索引，需在解析链接目标（更新反向链接图）之前失效
+    invalidate_file_caches(graph, repo_root, changed_files, removed_files, created_files)
+
+    for rel_path in removed_files:
+        graph.remove_file(rel_path)
+    for rel_path in changed_files:
+        abs_path = os.path.normpath(os.path.join(repo_root, rel_path))
+        stamp = file_stamp(abs_path)
+        if stamp is None:
+            continue
+        try:
+            edges = build_link_edges(abs_path, graph_config, repo_root)
+        except Exception:
+            edges = []
+        graph.update_file(rel_path, stamp, file_sha1(abs_path), edges)
+    graph.save()
+
+    problems = defaultdict(list)
+    targets = graph_target_keys(set(changed_files) | set(removed_files), graph_config, repo_root)
+    inbound_lines = collect_inbound_lines(graph, targets, exclude=changed_files)
+    line_filter = {os.path.normpath(os.path.join(repo_root, src)): lines for src, lines in inbound_lines.items()}
+    for rel_files, file_filter in ((changed_files, None), (sorted(inbound_lines), line_filter)):
+        for config, files in split_files_by_language(rel_files, configs):
+            for _, instance_problems, _ in _iter_instance_checks(files, config, repo_root, check_remote=check_remote,
+                                                                 line_filter=file_filter):
+                for ptype, items in instance_problems.items():
+                    problems[ptype].extend(items)
+    return dict(problems), len(inbound_lines)
+
+def watch_mode(watch_dirs, repo_root, check_remote=False, interval=POLL_INTERVAL):
+    """监听模式：常驻内存保留文件ID索引、锚点缓存与反向链接图，文件保存后只检查该文件及链接到它的文件
+
+    watch_dirs 为要监听的目录；链接目标的解析与反向链接图始终覆盖全部实例。
+    """
+    config = _load_all_instances_config(repo_root)
+    configs = load_language_configs(repo_root)
+    if not config.get('instances') or not configs:
+        print(f'{Fore.RED}未找到任何实例，请检查配置文件。{Style.RESET_ALL}')
+        return False
+
+    start = time.perf_counter()
+    graph = LinkGraph.load()
+    if not graph.file_count():
+        print('首次运行，正在构建反向链接图...')
+    refreshed = update_link_graph(graph, config, repo_root, find_all_instance_mdx_files(config, repo_root))
+    graph.save()
+    # 预先构建全部实例的文件ID索引，之后只在文件新增/删除时重建对应实例
+    for instance in config['instances']:
+        instance_path = instance.get('path', '')
+        if instance_path and not instance_path.startswith('http'):
+            get_doc_id_index(os.path.join(repo_root, instance_path))
+    print(f'反向链接图已更新（重新提取{refreshed}个文件，共{graph.file_count()}个文件），'
+          f'准备耗时 {time.perf_counter() - start:.2f}s')
+
+    watcher = create_watcher(watch_dirs, interval=interval)
+    print(f'{Fore.CYAN}正在监听 {watcher.file_count()} 个mdx文件（{watcher_kind(watcher)}），'
+          f'保存文件后自动检查，Ctrl+C 退出{Style.RESET_ALL}')
+    try:
+        while True:
+            changed, removed = watcher.wait()
+            start = time.perf_counter()
+            changed_files = [_repo_rel_path(f, repo_root) for f in changed]
+            removed_files = [_repo_rel_path(f, repo_root) for f in removed]
+            print(f'\n{Fore.CYAN}[{datetime.now().strftime("%H:%M:%S")}] 文件变化:{Style.RESET_ALL}')
+            for f in changed_files:
+                print(f'  - {f}')
+            for f in removed_files:
+                print(f'  - {f} (已删除/重命名)')
+            try:
+                problems, inbound_count = recheck_changed_files(graph, config, configs, repo_root, changed_files,
+                                                                removed_files, check_remote)
+            except Exception as e:
+                # 单次检查出错（如文件正在写入）不退出监听
+                print(f'{Fore.RED}检查失败: {e}{Style.RESET_ALL}')
+                continue
+            if inbound_count:
+                print(f'另检查了{inbound_count}个文件中指向变更文件的链接')
+            print_problems_summary(problems)
+            print(f'检查耗时 {time.perf_counter() - start:.2f}s')
+    except KeyboardInterrupt:
+        print('\n已退出监听模式')
+    finally:
+        watcher.close()
+        graph.close()
+    return True
+
 def check_invalid_numeric_link(url):
     """检查是否为无效的纯数字链接"""
     # 检查是否为纯数字（可能包含空白字符）
@@ -1237,20 +2526,322 @@ def check_invalid_numeric_link(url):
         return True
     return False
 
-def check_instance_links(mdx_files, config, instance, repo_root, check_remote=False):
-    """检查实例中的链接"""
+# 性能统计（--profile）：启用后把下列函数替换为计时包装，记录各阶段的耗时与调用次数。
+# seconds 为包含内部调用的总耗时，self_seconds 扣除了其中其他被统计函数的耗时（如 local 中的锚点解析）。
+# 未启用时不做任何替换，没有额外开销。
+PROFILED_FUNCTIONS = {
+    'extract_links_from_file': 'extraction',
+    'is_url_whitelisted': 'whitelist',
+    'check_mdx_import': 'import',
+    'check_mixed_language': 'mixed_language',
+    'check_anchor_link': 'anchor',
+    'check_local_link': 'local',
+    'check_root_link': 'root',
+    'get_own_headings': 'anchor_parse',
+    'build_doc_id_index': 'doc_id_index',
+    'check_remote_links': 'remote',
+    'check_remote_link': 'remote_request',
+}
+PROFILE_TOP_N = 10
+
+_profile = None  # 启用 --profile 时为统计数据，见 enable_profile
+_profile_lock = threading.Lock()
+_profile_local = threading.local()
+
+def _new_profile_state():
+    return {
+        'started': time.perf_counter(),
+        'phases': {},     # 阶段 -> {'seconds', 'self_seconds', 'calls'}
+        'caches': {},     # 缓存 -> {'hits', 'misses'}
+        'instances': {},  # 实例 -> {'seconds', 'files', 'phases': {阶段: self_seconds}}
+        'files': {},      # 文件 -> self_seconds 之和
+        'hosts': {},      # 域名 -> {'requests', 'seconds', 'max_seconds'}
+        'current_instance': None,
+        'current_file': None,
+    }
+
+def _profiled(func, phase):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_profile_local, 'stack', None)
+        if stack is None:
+            stack = _profile_local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            child_elapsed = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            _profile_record(phase, elapsed, elapsed - child_elapsed, args)
+    wrapper._profiled = True
+    return wrapper
+
+def enable_profile():
+    """启用性能统计（重复调用只会重置统计数据，不会重复包装）"""
+    global _profile
+    _profile = _new_profile_state()
+    module_globals = globals()
+    for func_name, phase in PROFILED_FUNCTIONS.items():
+        func = module_globals[func_name]
+        if not getattr(func, '_profiled', False):
+            module_globals[func_name] = _profiled(func, phase)
+
+def _profile_record(phase, elapsed, self_elapsed, args):
+    with _profile_lock:
+        stats = _profile['phases'].setdefault(phase, {'seconds': 0.0, 'self_seconds': 0.0, 'calls': 0})
+        stats['seconds'] += elapsed
+        stats['self_seconds'] += self_elapsed
+        stats['calls'] += 1
+
+        instance_key = _profile['current_instance']
+        if instance_key is not None:
+            instance_phases = _profile['instances'].setdefault(
+                instance_key, {'seconds': 0.0, 'files': 0, 'phases': {}})['phases']
+            instance_phases[phase] = instance_phases.get(phase, 0.0) + self_elapsed
+
+        current_file = _profile['current_file']
+        if current_file is not None and phase != 'remote_request':
+            _profile['files'][current_file] = _profile['files'].get(current_file, 0.0) + self_elapsed
+
+        if phase == 'remote_request' and args:
+            host = urllib.parse.urlsplit(args[0]).netloc.lower()
+            host_stats = _profile['hosts'].setdefault(host, {'requests': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            host_stats['requests'] += 1
+            host_stats['seconds'] += elapsed
+            host_stats['max_seconds'] = max(host_stats['max_seconds'], elapsed)
+
+def _profile_cache_access(cache, hit):
+    with _profile_lock:
+        stats = _profile['caches'].setdefault(cache, {'hits': 0, 'misses': 0})
+        stats['hits' if hit else 'misses'] += 1
+
+def _profile_instance_key(instance):
+    instance = instance or {}
+    return instance.get('id') or instance.get('path') or '(未匹配实例)'
+
+def _profile_snapshot():
+    """返回当前进程的统计数据（供进程池任务回传给主进程合并）"""
+    return {k: _profile[k] for k in ('phases', 'caches', 'instances', 'files', 'hosts')}
+
+def _profile_merge(snapshot):
+    with _profile_lock:
+        for phase, stats in snapshot['phases'].items():
+            target = _profile['phases'].setdefault(phase, {'seconds': 0.0, 'self_seconds': 0.0, 'calls': 0})
+            for key in ('seconds', 'self_seconds', 'calls'):
+                target[key] += stats[key]
+        for cache, stats in snapshot['caches'].items():
+            target = _profile['caches'].setdefault(cache, {'hits': 0, 'misses': 0})
+            target['hits'] += stats['hits']
+            target['misses'] += stats['misses']
+        for instance_key, stats in snapshot['instances'].items():
+            target = _profile['instances'].setdefault(instance_key, {'seconds': 0.0, 'files': 0, 'phases': {}})
+            for phase, seconds in stats['phases'].items():
+                target['phases'][phase] = target['phases'].get(phase, 0.0) + seconds
+        for file_path, seconds in snapshot['files'].items():
+            _profile['files'][file_path] = _profile['files'].get(file_path, 0.0) + seconds
+        for host, stats in snapshot['hosts'].items():
+            target = _profile['hosts'].setdefault(host, {'requests': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            target['requests'] += stats['requests']
+            target['seconds'] += stats['seconds']
+            target['max_seconds'] = max(target['max_seconds'], stats['max_seconds'])
+
+def _check_files_local_profiled(instance_key, *args):
+    """进程池任务：在子进程中统计 _check_files_local，连同统计数据一起返回"""
+    enable_profile()
+    _profile['current_instance'] = instance_key
+    return _check_files_local(*args), _profile_snapshot()
+
+def build_profile_report(top=PROFILE_TOP_N):
+    """汇总统计数据，返回写入结果 JSON 的 profile 字段"""
+    def rounded(value):
+        return round(value, 4)
+
+    phases = {
+        phase: {'seconds': rounded(st['seconds']), 'self_seconds': rounded(st['self_seconds']), 'calls': st['calls']}
+        for phase, st in sorted(_profile['phases'].items(), key=lambda kv: kv[1]['self_seconds'], reverse=True)
+    }
+    caches = {}
+    for cache, st in _profile['caches'].items():
+        total = st['hits'] + st['misses']
+        caches[cache] = {**st, 'hit_rate': round(st['hits'] / total, 4) if total else None}
+    instances = {
+        key: {
+            'seconds': rounded(st['seconds']),
+            'files': st['files'],
+            'phases': {p: rounded(v) for p, v in sorted(st['phases'].items(), key=lambda kv: kv[1], reverse=True)},
+        }
+        for key, st in sorted(_profile['instances'].items(), key=lambda kv: kv[1]['seconds'], reverse=True)
+    }
+    slowest_files = [
+        {'file': f, 'seconds': rounded(sec)}
+        for f, sec in sorted(_profile['files'].items(), key=lambda kv: kv[1], reverse=True)[:top]
+    ]
+    slowest_hosts = [
+        {'host': host, 'requests': st['requests'], 'seconds': rounded(st['seconds']),
+         'avg_seconds': rounded(st['seconds'] / st['requests']), 'max_seconds': rounded(st['max_seconds'])}
+        for host, st in sorted(_profile['hosts'].items(), key=lambda kv: kv[1]['seconds'], reverse=True)[:top]
+    ]
+    return {
+        'total_seconds': rounded(time.perf_counter() - _profile['started']),
+        'phases': phases,
+        'caches': caches,
+        'instances': instances,
+        'slowest_files': slowest_files,
+        'slowest_hosts': slowest_hosts,
+    }
+
+def print_profile_summary(report, top=PROFILE_TOP_N):
+    """打印性能统计摘要"""
+    print(f'\n{Fore.CYAN}性能统计（总耗时 {report["total_seconds"]:.2f}s）{Style.RESET_ALL}')
+    print(f'  {"阶段":<16}{"自身耗时(s)":>12}{"总耗时(s)":>12}{"调用次数":>10}')
+    for phase, st in report['phases'].items():
+        print(f'  {phase:<16}{st["self_seconds"]:>12.3f}{st["seconds"]:>12.3f}{st["calls"]:>10}')
+    if report['caches']:
+        print('  缓存命中率:')
+        for cache, st in report['caches'].items():
+            rate = f'{st["hit_rate"]:.1%}' if st['hit_rate'] is not None else '-'
+            print(f'    {cache:<16}{rate:>8}  (命中 {st["hits"]} / 未命中 {st["misses"]})')
+    if len(report['instances']) > 1:
+        print(f'  最慢的实例（前 {top} 个）:')
+        for key, st in list(report['instances'].items())[:top]:
+            print(f'    {st["seconds"]:>8.3f}s  {st["files"]:>5} 个文件  {key}')
+    if report['slowest_files']:
+        print(f'  最慢的文件（前 {top} 个）:')
+        for item in report['slowest_files']:
+            print(f'    {item["seconds"]:>8.3f}s  {item["file"]}')
+    if report['slowest_hosts']:
+        print(f'  最慢的外链域名（前 {top} 个，按请求总耗时）:')
+        for item in report['slowest_hosts']:
+            print(f'    {item["seconds"]:>8.3f}s  {item["requests"]:>4} 次  平均 {item["avg_seconds"]:.3f}s  '
+                  f'最长 {item["max_seconds"]:.3f}s  {item["host"]}')
+
+# 文件数少于该值时不启用多进程（进程启动与结果传输的开销大于收益）
+PARALLEL_MIN_FILES = 50
+
+def _shard_files(mdx_files, jobs, total_files=None):
+    """把文件连续分片（保证合并后的结果顺序与串行检查一致），分片大小按 total_files 总数与 jobs 计算"""
+    total_files = total_files or len(mdx_files)
+    chunk_count = min(total_files, jobs * 4)
+    chunk_size = (total_files + chunk_count - 1) // chunk_count
+    return [mdx_files[i:i + chunk_size] for i in range(0, len(mdx_files), chunk_size)]
+
+def _submit_file_chunks(executor, chunks, config, instance, repo_root, check_remote=False, line_filter=None):
+    """把一个实例的文件分片提交到进程池，返回与分片顺序一致的 future 列表"""
+    if _profile is not None:
+        # 子进程各自统计，结果回传后合并
+        instance_key = _profile_instance_key(instance)
+        return [executor.submit(_check_files_local_profiled, instance_key, chunk, config, instance, repo_root,
+                                check_remote, line_filter)
+                for chunk in chunks]
+    return [executor.submit(_check_files_local, chunk, config, instance, repo_root, check_remote, line_filter)
+            for chunk in chunks]
+
+def _merge_chunk_results(chunk_futures, on_partial=None):
+    """按分片顺序合并进程池任务的结果，返回 (problems, collected_urls, remote_links)
+
+    取出结果后把 chunk_futures 中对应的 future 置为 None，释放已处理分片的结果。
+    """
+    problems = defaultdict(list)
+    collected_urls = []
+    remote_links = []
+    for index, future in enumerate(chunk_futures):
+        chunk_futures[index] = None
+        chunk_result = future.result()
+        if _profile is not None:
+            chunk_result, snapshot = chunk_result
+            _profile_merge(snapshot)
+        chunk_problems, chunk_collected, chunk_remote = chunk_result
+        remote_links.extend(chunk_remote)
+        if on_partial is not None:
+            on_partial(chunk_problems, chunk_collected)
+            continue
+        for ptype, items in chunk_problems.items():
+            problems[ptype].extend(items)
+        collected_urls.extend(chunk_collected)
+    return problems, collected_urls, remote_links
+
+def check_instance_links(mdx_files, config, instance, repo_root, check_remote=False, remote_workers=None, jobs=1,
+                         line_filter=None, on_partial=None, chunk_futures=None):
+    """检查实例中的链接
+
+    jobs > 1 时把文件分片交给进程池并行做本地检查，再按文件顺序合并结果；
+    外链检查始终在主进程中统一并发进行。
+    line_filter 为 {文件路径: 行号集合} 时，只检查这些文件中指定行上的链接。
+    on_partial(problems, collected_urls) 在结果产生时分批调用（串行时每个文件一次，并行时每个分片一次，
+    外链检查完成后再调用一次），见 stream_partial_results；此时结果不在内存中累积，返回的结果为空。
+    chunk_futures 为已提交到共享进程池的分片任务（check_all_instances 使用），此时不再创建进程池。
+    """
+    if _profile is not None:
+        instance_key = _profile_instance_key(instance)
+        _profile['current_instance'] = instance_key
+        instance_start = time.perf_counter()
+
+    if chunk_futures is not None:
+        problems, collected_urls, remote_links = _merge_chunk_results(chunk_futures, on_partial)
+    elif jobs and jobs > 1 and len(mdx_files) >= PARALLEL_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=parse_cache.init_worker,
+                                 initargs=(parse_cache.active_path(),)) as executor:
+            chunk_futures = _submit_file_chunks(executor, _shard_files(mdx_files, jobs), config, instance, repo_root,
+                                                check_remote, line_filter)
+            problems, collected_urls, remote_links = _merge_chunk_results(chunk_futures, on_partial)
+    else:
+        problems, collected_urls, remote_links = _check_files_local(mdx_files, config, instance, repo_root, check_remote,
+                                                                    line_filter, on_partial)
+
+    # 外链去重后并发检查，再把结果分发回每一处引用
+    if remote_links:
+        remote_results = check_remote_links([it['url'] for it in remote_links], max_workers=remote_workers)
+        remote_problems = []
+        for it in remote_links:
+            remote_result = remote_results.get(it['url'])
+            if remote_result is not None and not remote_result.get('valid', True):
+                remote_problems.append({
+                    **it,
+                    'error': remote_result.get('error', '未知错误')
+                })
+        if remote_problems and on_partial is not None:
+            on_partial({'远端链接无效': remote_problems}, [])
+        elif remote_problems:
+            problems['远端链接无效'].extend(remote_problems)
+
+    if _profile is not None:
+        instance_stats = _profile['instances'].setdefault(instance_key, {'seconds': 0.0, 'files': 0, 'phases': {}})
+        instance_stats['seconds'] += time.perf_counter() - instance_start
+        instance_stats['files'] += len(mdx_files)
+        _profile['current_instance'] = None
+
+    return problems, collected_urls
+
+def _check_files_local(mdx_files, config, instance, repo_root, check_remote=False, line_filter=None, on_partial=None):
+    """对一组文件做除外链请求以外的所有检查
+
+    返回 (problems, collected_urls, remote_links)，remote_links 为待统一检查的外链引用。
+    作为进程池任务时各进程独立维护文件ID索引与锚点缓存。
+    on_partial(problems, collected_urls) 在每个文件检查完后以该文件的结果调用（流式输出用），
+    此时结果交给回调后即丢弃，返回的 problems 与 collected_urls 为空。
+    """
     problems = defaultdict(list)
     # 额外收集：仅用于聚合统计（例如 old-doc），不计入问题
     collected_urls = []
+    # 待检查的外链引用（所有文件处理完后统一并发检查）
+    remote_links = []
 
     # 加载白名单
     whitelist = load_whitelist()
 
     for file_path in mdx_files:
+        if _profile is not None:
+            _profile['current_file'] = file_path
         links = extract_links_from_file(file_path)
+        allowed_lines = line_filter.get(file_path) if line_filter is not None else None
         for link_info in links:
             url = link_info['url']
             line = link_info['line']
+            if allowed_lines is not None and line not in allowed_lines:
+                continue
             line_content = link_info['line_content']
             link_type = link_info['type']
 
@@ -1269,6 +2860,18 @@ def check_instance_links(mdx_files, config, instance, repo_root, check_remote=Fa
                         'line_content': line_content,
                         'link_type': link_type
                     })
+                    continue
+                # 循环导入：被导入的文件又（间接）导入了当前文件
+                cycle = find_import_cycle(file_path, url)
+                if cycle:
+                    problems['循环导入'].append({
+                        'file': file_path,
+                        'line': line,
+                        'url': url,
+                        'line_content': line_content,
+                        'link_type': link_type,
+                        'error': ' -> '.join(_repo_rel_path(p, repo_root) for p in cycle)
+                    })
                 continue
 
             # 0. 检查无效的纯数字链接
@@ -1360,22 +2963,26 @@ def check_instance_links(mdx_files, config, instance, repo_root, check_remote=Fa
                     'link_type': link_type,
                 })
 
-            # 6. 检查远端链接（如果用户选择检查；old-doc 跳过请求）
-            if check_remote and not is_old_doc_url_any(url):
-                remote_result = check_remote_link(url)
-                if remote_result is not None and not remote_result.get('valid', True):
-                    error_msg = remote_result.get('error', '未知错误')
-                    problems['远端链接无效'].append({
-                        'file': file_path,
-                        'line': line,
-                        'url': url,
-                        'line_content': line_content,
-                        'link_type': link_type,
-                        'error': error_msg
-                    })
-                    continue
+            # 6. 收集需要检查的远端链接（如果用户选择检查；old-doc 跳过请求），稍后统一并发检查
+            if check_remote and should_check_remote_link(url):
+                remote_links.append({
+                    'file': file_path,
+                    'line': line,
+                    'url': url,
+                    'line_content': line_content,
+                    'link_type': link_type,
+                })
 
-    return problems, collected_urls
+        if on_partial is not None and (problems or collected_urls):
+            on_partial(problems, collected_urls)
+            problems = defaultdict(list)
+            collected_urls = []
+
+    if _profile is not None:
+        _profile['current_file'] = None
+    # 作为进程池任务时，子进程退出前需要把新解析的结果写入解析缓存
+    parse_cache.flush_active()
+    return problems, collected_urls, remote_links
 
 def print_problems_summary(problems, is_warning=False):
     """打印问题总结"""
@@ -1398,6 +3005,119 @@ def print_problems_summary(problems, is_warning=False):
             print(f'    {item["line_content"]}')
             print()
 
+def load_language_configs(repo_root):
+    """加载 docuo.config.zh.json 与 docuo.config.en.json，返回 [(language, config), ...]"""
+    configs = []
+    for language in ('zh', 'en'):
+        path = os.path.join(repo_root, f'docuo.config.{language}.json')
+        if not os.path.exists(path):
+            continue
+        config = _load_json_file(path)
+        if config:
+            configs.append((language, config))
+    return configs
+
+def check_all_instances(repo_root, check_remote=False, remote_workers=None, jobs=1, configs=None,
+                        find_files=find_mdx_files):
+    """全仓库单次检查：中英文配置各加载一次，相同 path 的实例目录只扫描一次
+
+    每个目录下的文件使用其所属（首次出现的）实例的 locale 与对应语言的配置检查，
+    文件ID索引、锚点缓存与外链结果在所有实例之间共享。
+    configs / find_files 供 check_all.py 传入已加载的配置与单次遍历得到的文件列表。
+    返回 (structured_results, aggregated_by_url)。
+    """
+    structured_results = {}
+    aggregated_by_url = {}
+
+    if configs is None:
+        configs = load_language_configs(repo_root)
+    if not configs:
+        print(f'{Fore.RED}未找到配置文件: docuo.config.zh.json 或 docuo.config.en.json{Style.RESET_ALL}')
+        sys.exit(1)
+
+    seen_paths = set()
+    owners = []
+    for language, config in configs:
+        for instance in config.get('instances', []):
+            instance_path = instance.get('path', '')
+            if not instance_path or instance_path.startswith('http'):
+                continue
+            if not os.path.isabs(instance_path):
+                instance_path = os.path.join(repo_root, instance_path)
+            instance_path = os.path.normpath(instance_path)
+            if instance_path in seen_paths:
+                continue
+            seen_paths.add(instance_path)
+            owners.append((config, instance, instance_path))
+
+    print(f'共 {len(owners)} 个不重复的实例目录需要检查')
+
+    owner_files = [find_files(instance_path) for _, _, instance_path in owners]
+    total_files = sum(len(mdx_files) for mdx_files in owner_files)
+
+    # 并行时所有实例共用一个进程池：按全部文件统一分片并一次性提交，
+    # 小实例也能并行，子进程内的文件ID索引与锚点缓存在各实例的分片之间复用
+    executor = None
+    pending_chunks = [None] * len(owners)
+    if jobs and jobs > 1 and total_files >= PARALLEL_MIN_FILES:
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=parse_cache.init_worker,
+                                       initargs=(parse_cache.active_path(),))
+        for idx, ((config, instance, _), mdx_files) in enumerate(zip(owners, owner_files)):
+            pending_chunks[idx] = _submit_file_chunks(executor, _shard_files(mdx_files, jobs, total_files), config,
+                                                      instance, repo_root, check_remote)
+
+    try:
+        for (config, instance, instance_path), mdx_files, chunk_futures in zip(owners, owner_files, pending_chunks):
+            label = instance.get('label', '未知实例')
+            platform = get_instance_platform(instance, config)
+            display_name = f"{label} ({platform})" if platform else label
+            print(f'正在检查实例: {display_name} [{instance.get("locale", "en")}] ({len(mdx_files)}个mdx文件)')
+
+            problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote,
+                                                            remote_workers, jobs,
+                                                            on_partial=stream_partial_results(display_name),
+                                                            chunk_futures=chunk_futures)
+            _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    print(f'共检查 {total_files} 个mdx文件')
+    return structured_results, aggregated_by_url
+
+def run_watch_mode(args, language, check_remote):
+    """--watch：按 --instance / --instance-path 确定监听目录，未指定时监听全部实例"""
+    repo_root = get_repo_root()
+    if not repo_root:
+        print(f'{Fore.RED}未找到仓库根目录（包含docuo.config.*.json 的目录）{Style.RESET_ALL}')
+        sys.exit(1)
+
+    if args.file:
+        print(f'{Fore.RED}--watch 不支持 --file，请使用 --instance、--instance-path 或 --all{Style.RESET_ALL}')
+        sys.exit(1)
+    if args.instance:
+        config, _ = load_config(language)
+        instances = config.get('instances', [])
+        matched = [i for i in instances if i.get('id') == args.instance]
+        if not matched:
+            print(f'{Fore.RED}未找到实例ID: {args.instance}{Style.RESET_ALL}')
+            avail = ', '.join(i.get('id', '') for i in instances if i.get('id'))
+            print(f'可用实例ID:\n  {avail}')
+            sys.exit(1)
+        watch_dirs = [os.path.join(repo_root, matched[0]['path'])]
+    elif args.instance_path:
+        watch_dirs = [os.path.join(repo_root, args.instance_path)]
+    else:
+        config = _load_all_instances_config(repo_root)
+        watch_dirs = [os.path.join(repo_root, i['path']) for i in config.get('instances', [])
+                      if i.get('path') and not i['path'].startswith('http')]
+
+    watch_dirs = [d for d in watch_dirs if os.path.isdir(d)]
+    if not watch_dirs:
+        print(f'{Fore.RED}没有可监听的实例目录{Style.RESET_ALL}')
+        sys.exit(1)
+    return watch_mode(watch_dirs, repo_root, check_remote, args.watch_interval)
+
 def run_non_interactive(args):
     """CLI 非交互模式"""
     # 确定语言
@@ -1408,7 +3128,51 @@ def run_non_interactive(args):
     else:
         language = 'zh'  # 默认中文
 
+    if args.from_stream:
+        # 由流式输出文件重新生成报告，不执行检查
+        if not os.path.isfile(args.from_stream):
+            print(f'{Fore.RED}文件不存在: {args.from_stream}{Style.RESET_ALL}')
+            sys.exit(1)
+        meta = read_result_stream_meta(args.from_stream)
+        write_result_files(mode=meta['mode'], structured_results=None, language=meta['language'],
+                           check_remote=meta['check_remote'], stream_path=args.from_stream)
+        return
+
+    if args.profile:
+        enable_profile()
+    if args.parse_cache:
+        parse_cache.enable()
+
+    if args.stream and args.watch:
+        # 监听模式不生成报告，也不会关闭流文件
+        print(f'{Fore.RED}--stream 不能与 --watch 同时使用{Style.RESET_ALL}')
+        sys.exit(1)
+    if args.stream:
+        stream_format = args.stream_format or ('sarif' if args.stream.endswith(('.sarif', '.sarif.json')) else 'jsonl')
+        open_result_stream(args.stream, stream_format)
+
     check_remote = args.remote
+    configure_remote_cache(
+        enabled=not args.no_remote_cache,
+        ttl_ok_hours=args.remote_cache_ttl,
+        ttl_fail_hours=args.remote_cache_failure_ttl,
+        refresh=args.refresh_remote,
+    )
+    if args.watch:
+        return run_watch_mode(args, language, check_remote)
+
+    if args.all:
+        # 全仓库模式：一次性加载中英文配置，每个实例目录只检查一次
+        repo_root = get_repo_root()
+        if not repo_root:
+            print(f'{Fore.RED}未找到仓库根目录（包含docuo.config.*.json 的目录）{Style.RESET_ALL}')
+            sys.exit(1)
+        structured_results, aggregated_by_url = check_all_instances(
+            repo_root, check_remote, args.remote_workers, args.jobs)
+        write_result_files(mode='all', structured_results=structured_results, language='all',
+                           check_remote=check_remote, aggregated_by_url=aggregated_by_url)
+        return
+
     config, repo_root = load_config(language)
 
     structured_results = {}
@@ -1436,7 +3200,8 @@ def run_non_interactive(args):
         display_name = f"[文件] {os.path.relpath(file_path, repo_root)}"
         print(f'\n正在检查文件: {file_path}')
 
-        problems, collected_urls = check_instance_links([file_path], config, instance, repo_root, check_remote)
+        problems, collected_urls = check_instance_links([file_path], config, instance, repo_root, check_remote, args.remote_workers, args.jobs,
+                                                        on_partial=stream_partial_results(display_name))
         _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url)
 
     elif args.instance:
@@ -1467,7 +3232,8 @@ def run_non_interactive(args):
         mdx_files = find_mdx_files(instance_path)
         print(f'共找到{len(mdx_files)}个mdx文件。')
 
-        problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote)
+        problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote, args.remote_workers, args.jobs,
+                                                        on_partial=stream_partial_results(display_name))
         _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url)
 
     elif args.instance_path:
@@ -1504,11 +3270,12 @@ def run_non_interactive(args):
         mdx_files = find_mdx_files(inst_path)
         print(f'共找到{len(mdx_files)}个mdx文件。')
 
-        problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote)
+        problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote, args.remote_workers, args.jobs,
+                                                        on_partial=stream_partial_results(display_name))
         _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url)
 
     else:
-        print(f'{Fore.RED}请指定 --file <路径>、--instance <ID> 或 --instance-path <目录路径>{Style.RESET_ALL}')
+        print(f'{Fore.RED}请指定 --file <路径>、--instance <ID>、--instance-path <目录路径> 或 --all{Style.RESET_ALL}')
         sys.exit(1)
 
     write_result_files(mode='cli', structured_results=structured_results, language=language,
@@ -1518,6 +3285,13 @@ def run_non_interactive(args):
 def main():
     # git 模式
     if len(sys.argv) > 1 and sys.argv[1] == 'git':
+        if '--profile' in sys.argv[2:]:
+            enable_profile()
+        if '--parse-cache' in sys.argv[2:]:
+            parse_cache.enable()
+        # git --incremental：只检查变更文件以及指向它们的链接
+        if '--incremental' in sys.argv[2:]:
+            return check_git_incremental_mode()
         return check_git_mode()
 
     # 解析 CLI 参数
@@ -1534,6 +3308,30 @@ def main():
   python check_links.py --zh --instance rtc-android-java
   # 同时检查外链
   python check_links.py --zh --instance rtc-android-java --remote
+  # 一次检查中英文全部实例
+  python check_links.py --all --jobs 8
+  # 外链并发检查线程数（默认 16，同一域名最多 4 个并发）
+  python check_links.py --zh --instance rtc-android-java --remote --remote-workers 32
+  # 使用 8 个进程并行检查
+  python check_links.py --zh --instance rtc-android-java --jobs 8
+  # 外链结果默认缓存在 remote_link_cache.jsonl（成功 7 天、失败 1 天），强制重新检查
+  python check_links.py --zh --instance rtc-android-java --remote --refresh-remote
+  # git 模式：检查暂存区变更文件所在的实例
+  python check_links.py git
+  # git 增量模式：只检查变更文件及其他文件中指向它们的链接（基于 link_graph.sqlite）
+  python check_links.py git --incremental
+  # 流式输出结果（JSON Lines 或 SARIF），每个文件检查完成后立即写入
+  python check_links.py --all --stream check_links.jsonl
+  python check_links.py --all --stream check_links.sarif
+  # 由流式输出文件重新生成 check_link_result.json（例如检查中途被中断后）
+  python check_links.py --from-stream check_links.jsonl
+  # 输出各阶段耗时、缓存命中率、最慢的文件与外链域名（git 模式同样支持 --profile）
+  python check_links.py --zh --instance rtc-android-java --remote --profile
+  # 复用 parse_cache.sqlite 中的解析结果，只重新解析内容变化的文件（与 check_html_tags.py 共享，git 模式同样支持）
+  python check_links.py --all --parse-cache
+  # 监听模式：常驻内存，保存文件后只检查该文件以及链接到它的文件（不指定实例时监听全部实例）
+  python check_links.py --zh --instance rtc-android-java --watch
+  python check_links.py --watch
   # 无参数进入交互模式
   python check_links.py
 ''')
@@ -1543,7 +3341,37 @@ def main():
     parser.add_argument('--instance', metavar='ID', help='要检查的实例ID')
     parser.add_argument('--instance-path', metavar='DIR', dest='instance_path', help='要检查的实例目录路径（相对根目录或绝对路径）')
     parser.add_argument('--file', metavar='PATH', help='要检查的单个文件路径（相对根目录或绝对路径）')
+    parser.add_argument('--all', action='store_true',
+                        help='检查中英文配置中的全部实例（相同目录只检查一次，忽略 --zh/--en）')
     parser.add_argument('--remote', action='store_true', help='同时检查外链（耗时较长）')
+    parser.add_argument('--remote-workers', metavar='N', dest='remote_workers', type=int, default=REMOTE_MAX_WORKERS,
+                        help=f'外链并发检查线程数（默认 {REMOTE_MAX_WORKERS}）')
+    parser.add_argument('--jobs', '-j', metavar='N', type=int, default=1,
+                        help='并行检查的进程数（默认 1，即串行；设为 CPU 核数可加速大实例）')
+    parser.add_argument('--refresh-remote', action='store_true', dest='refresh_remote',
+                        help='忽略外链缓存，重新请求所有外链（结果仍会写回缓存）')
+    parser.add_argument('--no-remote-cache', action='store_true', dest='no_remote_cache',
+                        help='不读取也不写入外链缓存文件 remote_link_cache.jsonl')
+    parser.add_argument('--remote-cache-ttl', metavar='HOURS', dest='remote_cache_ttl', type=float,
+                        default=REMOTE_CACHE_TTL_OK_HOURS,
+                        help=f'外链检查成功结果的缓存有效期（小时，默认 {REMOTE_CACHE_TTL_OK_HOURS}）')
+    parser.add_argument('--remote-cache-failure-ttl', metavar='HOURS', dest='remote_cache_failure_ttl', type=float,
+                        default=REMOTE_CACHE_TTL_FAIL_HOURS,
+                        help=f'外链检查失败结果的缓存有效期（小时，默认 {REMOTE_CACHE_TTL_FAIL_HOURS}；超时、连接错误等临时失败不缓存）')
+    parser.add_argument('--profile', action='store_true',
+                        help='输出各阶段耗时、调用次数、缓存命中率以及最慢的文件和外链域名（同时写入结果 JSON 的 profile 字段）')
+    parser.add_argument('--parse-cache', action='store_true', dest='parse_cache',
+                        help='启用 MDX 解析缓存（parse_cache.sqlite，按内容 sha1 复用解析结果，与 check_html_tags.py 共享）')
+    parser.add_argument('--watch', action='store_true',
+                        help='监听模式：文件保存后只重新检查该文件及链接到它的文件（已安装 watchdog 时使用文件系统事件，否则轮询）')
+    parser.add_argument('--watch-interval', metavar='SECONDS', dest='watch_interval', type=float, default=POLL_INTERVAL,
+                        help=f'监听模式未安装 watchdog 时的轮询间隔（秒，默认 {POLL_INTERVAL}）')
+    parser.add_argument('--stream', metavar='PATH',
+                        help='流式输出：每个文件检查完成后立即把问题逐条写入该文件（中途退出也不会丢失已检查的结果）')
+    parser.add_argument('--stream-format', dest='stream_format', choices=['jsonl', 'sarif'],
+                        help='流式输出格式（默认按扩展名判断：.sarif 为 SARIF，其余为 JSON Lines）')
+    parser.add_argument('--from-stream', metavar='PATH', dest='from_stream',
+                        help='不执行检查，由 --stream 生成的文件重新生成 check_link_result.json')
 
     # 有参数时进入非交互模式
     if len(sys.argv) > 1:
@@ -1579,22 +3407,46 @@ def main():
         mdx_files = find_mdx_files(instance_path)
         print(f'共找到{len(mdx_files)}个mdx文件。')
 
-        problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote)
+        problems, collected_urls = check_instance_links(mdx_files, config, instance, repo_root, check_remote,
+                                                        on_partial=stream_partial_results(display_name))
         _collect_results(problems, collected_urls, display_name, structured_results, aggregated_by_url)
 
     write_result_files(mode='interactive', structured_results=structured_results, language=language,
                        check_remote=check_remote, aggregated_by_url=aggregated_by_url)
 
-def write_result_files(mode, structured_results, language=None, check_remote=None, aggregated_by_url=None):
-    """将结果分别写入 JSON 和 Markdown 文件"""
+def write_result_files(mode, structured_results, language=None, check_remote=None, aggregated_by_url=None,
+                       stream_path=None):
+    """将结果写入 JSON 文件（当前不输出 Markdown）
+
+    启用流式输出时先关闭流文件，再由流文件生成报告（stream_path 供 --from-stream 使用）：
+    记录先按实例拆分到临时文件，再逐个实例写入报告，内存中只保留一个实例的结果与每个 URL 的计数。
+    """
+    if _result_stream is not None:
+        stream_path = close_result_stream(mode, language, check_remote)
+        print(f"流式结果已写入: {stream_path}")
+
     base_dir = os.path.dirname(os.path.abspath(__file__))
     json_path = os.path.join(base_dir, 'check_link_result.json')
     md_path = os.path.join(base_dir, 'check_link_result.md')
 
-    # 写 JSON
-    if aggregated_by_url is None:
-        aggregated_by_url = {}
+    tmp_dir = None
+    try:
+        if stream_path is not None:
+            tmp_dir = tempfile.mkdtemp(prefix='check_links_')
+            instance_files, url_stats = split_result_stream(stream_path, tmp_dir)
+            instances = _iter_split_instances(instance_files)
+        else:
+            url_stats = _url_stats_from_occurrences(aggregated_by_url or {})
+            instances = iter(structured_results.items())
+        _write_result_json(json_path, mode, language, check_remote, instances, url_stats)
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # 按需可扩展写入 Markdown 的逻辑；当前按需求不输出 Markdown 文件
 
+def _write_result_json(json_path, mode, language, check_remote, instances, url_stats):
+    """写入 check_link_result.json：instances 逐个实例写入，urls_by_category 由 url_stats 计算"""
     # 计算 URL 分类别汇总（按 count 降序）
     def categorize_url(u):
         if u.startswith('#'):
@@ -1624,16 +3476,16 @@ def write_result_files(mode, structured_results, language=None, check_remote=Non
         'import': [],
         'other': [],
     }
-    for url_key, occurrences in aggregated_by_url.items():
+    for url_key, stats in url_stats.items():
         # 检查是否为 import 类型的 URL
-        is_import = any(occ.get('error_type') == 'Import路径无效' for occ in occurrences)
+        is_import = stats['is_import']
 
         category = categorize_url(url_key)
         is_old_doc = (category == 'external' and is_old_doc_url_any(url_key))
-        has_anchor_error = any((occ.get('error_type') == '锚点链接无效') for occ in occurrences)
+        has_anchor_error = stats['has_anchor_error']
         item = {
             'url': url_key,
-            'count': len(occurrences),
+            'count': stats['count'],
         }
 
         # 如果是 import 类型，归入 import 分类
@@ -1669,22 +3521,24 @@ def write_result_files(mode, structured_results, language=None, check_remote=Non
             urls_by_category[cat]['old-doc'].sort(key=lambda x: x['count'], reverse=True)
     urls_by_category['other'].sort(key=lambda x: x['count'], reverse=True)
 
-    output_obj = {
-        'mode': mode,
-        'language': language,
-        'check_remote': check_remote,
-        'generated_at': datetime.now().isoformat(),
-        'instances': structured_results,
-        'urls_by_category': urls_by_category,
-    }
+    fields = [
+        ('mode', mode),
+        ('language', language),
+        ('check_remote', check_remote),
+        ('generated_at', datetime.now().isoformat()),
+        ('instances', None),
+        ('urls_by_category', urls_by_category),
+    ]
+    if _profile is not None:
+        profile_report = build_profile_report()
+        print_profile_summary(profile_report)
+        fields.append(('profile', profile_report))
     try:
         with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(output_obj, f, ensure_ascii=False, indent=2)
+            _write_json_report(f, fields, instances)
         print(f"结果已写入: {json_path}")
     except Exception as e:
         print(f"{Fore.RED}写入JSON结果失败: {e}{Style.RESET_ALL}")
 
-    # 按需可扩展写入 Markdown 的逻辑；当前按需求不输出 Markdown 文件
-
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -4,22 +4,79 @@
 
 读取 check_link_result.json 中的 old-doc 链接，
 通过 HTTP HEAD 请求获取重定向后的最终 URL。
+
+先用本地规则（local_redirects.py：nginx_redirect.conf、generate_redirect.py、
+redirect_map.json）解析，命中的结果带 "source": "local"，只对最终 URL 发一次请求确认页面存在
+（"verified": true 并记录真实状态码）；未命中的链接才完整地发 HTTP 请求跟随重定向。
+--offline 时不发请求，本地结果的 status_code 为 null、verified 为 false，apply_redirects.py 不会应用。
+
+HTTP 请求去重后并发进行：同一域名复用一个带连接池的 Session 并限制并发数，
+连接失败、429/5xx 按指数退避重试。结果按输入顺序输出，格式与逐个请求时一致。
 """
 
 import json
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 from pathlib import Path
 from urllib.parse import urlparse
-
-
-def get_final_url(url: str, timeout: int = 10) -> dict:
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from local_redirects import get_redirect_stats, get_redirect_table, resolve_local
+
+# 并发请求参数
+MAX_WORKERS = 16            # 全局并发线程数
+PER_HOST_LIMIT = 8          # 同一域名的最大并发请求数（同时也是该域名连接池大小）
+MAX_RETRIES = 2             # 连接失败、429/5xx 时的重试次数
+BACKOFF_FACTOR = 0.5        # 重试间隔：0.5s、1s、2s...
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 每个 (域名, 重试次数) 复用一个 Session（带连接池与重试策略），每个域名一个并发限制
+_host_sessions = {}
+_host_semaphores = {}
+_host_lock = threading.Lock()
+
+
+def _get_host_session(host: str, retries: int = MAX_RETRIES):
+    """获取域名对应的 Session 及并发信号量（线程安全）"""
+    with _host_lock:
+        session = _host_sessions.get((host, retries))
+        if session is None:
+            retry = Retry(
+                total=retries,
+                connect=retries,
+                read=retries,
+                status=retries,
+                redirect=False,
+                backoff_factor=BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS,
+                allowed_methods=frozenset(["HEAD"]),
+                # 重试用尽后返回最后一次响应，状态码照常记录
+                raise_on_status=False,
+            )
+            # 重定向会跨域名（如 zegocloud.com → www.zegocloud.com），
+            # pool_connections 保持默认，避免跟随重定向时频繁淘汰其他域名的连接池
+            adapter = HTTPAdapter(pool_maxsize=PER_HOST_LIMIT, max_retries=retry)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _host_sessions[(host, retries)] = session
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = _host_semaphores[host] = threading.BoundedSemaphore(PER_HOST_LIMIT)
+        return session, semaphore
+
+
+def get_final_url(url: str, timeout: int = 10, session: Optional[requests.Session] = None) -> dict:
     """
     获取 URL 重定向后的最终地址。
 
     Args:
         url: 原始 URL
         timeout: 请求超时时间（秒）
+        session: 复用的 Session（可选，默认不复用连接）
 
     Returns:
         包含重定向信息的字典
@@ -35,7 +92,7 @@ def get_final_url(url: str, timeout: int = 10) -> dict:
 
     try:
         # 使用 HEAD 请求，跟随重定向
-        response = requests.head(
+        response = (session or requests).head(
             url,
             timeout=timeout,
             allow_redirects=True
@@ -59,9 +116,111 @@ def get_final_url(url: str, timeout: int = 10) -> dict:
     return result
 
 
+def _get_final_url_with_host_limit(url: str, retries: int = MAX_RETRIES) -> dict:
+    host = urlparse(url).netloc.lower()
+    session, semaphore = _get_host_session(host, retries)
+    with semaphore:
+        return get_final_url(url, session=session)
+
+
+def resolve_urls(urls, max_workers: int = MAX_WORKERS, retries: int = MAX_RETRIES) -> dict:
+    """
+    并发解析一批 URL 的重定向，返回 {url: get_final_url 的结果}。
+
+    相同的 URL 只请求一次；同一域名复用连接池并限制并发数。
+    """
+    pending = list(dict.fromkeys(urls))
+    results = {}
+    if not pending:
+        return results
+
+    workers = max(1, min(max_workers, len(pending)))
+    print(f"正在并发检查 {len(pending)} 个链接（{workers} 线程）...")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        future_to_url = {executor.submit(_get_final_url_with_host_limit, url, retries): url for url in pending}
+        for done, future in enumerate(as_completed(future_to_url), 1):
+            results[future_to_url[future]] = future.result()
+            print(f"\r检查进度: {done}/{len(pending)}", end="", flush=True)
+    print("\n")
+    return results
+
+
+def _offline_miss(url: str) -> dict:
+    """离线模式下本地规则未命中的结果"""
+    return {
+        "original_url": url,
+        "final_url": url,
+        "status_code": None,
+        "redirected": False,
+        "redirect_chain": [],
+        "error": "本地重定向规则未命中（离线模式）"
+    }
+
+
+def _merge_verification(local: dict, check: dict) -> dict:
+    """将对最终 URL 的请求结果合并到本地解析结果中"""
+    merged = dict(local)
+    merged["status_code"] = check["status_code"]
+    merged["error"] = check["error"]
+    if check["redirected"]:
+        # 最终页面仍有重定向（本地规则不完整），接在本地重定向链之后
+        merged["redirect_chain"] = local["redirect_chain"] + check["redirect_chain"]
+        merged["final_url"] = check["final_url"]
+    if "url_path" in check:
+        merged["url_path"] = check["url_path"]
+    merged["verified"] = check["error"] is None
+    return merged
+
+
+def resolve_with_local_rules(
+    urls,
+    max_workers: int = MAX_WORKERS,
+    retries: int = MAX_RETRIES,
+    offline: bool = False
+) -> dict:
+    """
+    先用本地规则解析，未命中的再并发发起 HTTP 请求，返回 {url: 结果}。
+
+    本地命中的只请求最终 URL 以确认页面状态；offline=True 时不发起任何请求，
+    本地结果保持未验证，未命中的链接记为错误。
+    """
+    table = get_redirect_table()
+    print(f"已加载本地重定向规则 {len(table)} 条（"
+          + "，".join(f"{name} {count}" for name, count in get_redirect_stats().items()) + "）")
+
+    results = {}
+    misses = []
+    for url in dict.fromkeys(urls):
+        result = resolve_local(url, table)
+        if result is not None:
+            results[url] = result
+        else:
+            misses.append(url)
+    print(f"本地规则命中 {len(results)} 个，未命中 {len(misses)} 个\n")
+
+    if offline:
+        if results:
+            print(f"离线模式：本地规则解析的 {len(results)} 个结果未验证最终页面是否存在"
+                  f"（status_code 为 null），apply_redirects.py 不会应用这些结果\n")
+        results.update((url, _offline_miss(url)) for url in misses)
+        return results
+
+    # 本地命中的只请求最终 URL，与未命中的链接一起并发请求
+    final_urls = {url: result["final_url"] for url, result in results.items()}
+    checked = resolve_urls(misses + list(final_urls.values()), max_workers, retries)
+    for url, final_url in final_urls.items():
+        results[url] = _merge_verification(results[url], checked[final_url])
+    results.update((url, checked[url]) for url in misses)
+    return results
+
+
 def check_redirects(
     result_file: str = None,
-    output_file: str = None
+    output_file: str = None,
+    max_workers: int = MAX_WORKERS,
+    retries: int = MAX_RETRIES,
+    use_local: bool = True,
+    offline: bool = False
 ) -> dict:
     """
     检查所有 old-doc 链接的重定向情况。
@@ -69,6 +228,10 @@ def check_redirects(
     Args:
         result_file: check_link_result.json 文件路径
         output_file: 输出文件路径（可选）
+        max_workers: 并发线程数
+        retries: 连接失败、429/5xx 时的重试次数
+        use_local: 是否先用本地重定向规则解析
+        offline: 只用本地规则，不发起 HTTP 请求
 
     Returns:
         重定向检查结果
@@ -91,6 +254,11 @@ def check_redirects(
 
     print(f"共找到 {len(old_doc_urls)} 个旧文档链接，开始检查重定向...\n")
 
+    urls = [item["url"] for item in old_doc_urls]
+    if use_local or offline:
+        resolved = resolve_with_local_rules(urls, max_workers, retries, offline)
+    else:
+        resolved = resolve_urls(urls, max_workers, retries)
     redirect_results = []
 
     for item in old_doc_urls:
@@ -98,12 +266,15 @@ def check_redirects(
         count = item["count"]
 
         print(f"检查：{url}")
-        result = get_final_url(url)
+        result = dict(resolved[url])
         result["count"] = count
 
         # 简化输出
         if result["redirected"]:
-            print(f"  → 重定向 ({len(result['redirect_chain'])} 次)")
+            source = ""
+            if result.get("source") == "local":
+                source = "，本地规则" if result.get("verified") else "，本地规则，未验证"
+            print(f"  → 重定向 ({len(result['redirect_chain'])} 次{source})")
             for redirect_url in result["redirect_chain"]:
                 print(f"    → {redirect_url}")
             print(f"  → 最终：{result['final_url']}")
@@ -125,6 +296,9 @@ def check_redirects(
         },
         "urls": redirect_results
     }
+    if use_local or offline:
+        output["summary"]["local"] = sum(1 for r in redirect_results if r.get("source") == "local")
+        output["summary"]["unverified"] = sum(1 for r in redirect_results if r.get("verified") is False)
 
     # 保存结果
     if output_file is None:
@@ -140,6 +314,9 @@ def check_redirects(
     print(f"  发生重定向：{output['summary']['redirected']}")
     print(f"  无重定向：{output['summary']['no_redirect']}")
     print(f"  请求错误：{output['summary']['error']}")
+    if "local" in output["summary"]:
+        print(f"  本地规则解析：{output['summary']['local']}")
+        print(f"  未验证（apply_redirects.py 不会应用）：{output['summary']['unverified']}")
 
     return output
 
@@ -147,7 +324,16 @@ def check_redirects(
 if __name__ == "__main__":
     import argparse
 
-    parser = argparse.ArgumentParser(description="检查旧文档链接的重定向情况")
+    parser = argparse.ArgumentParser(
+        description="检查旧文档链接的重定向情况",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  python3 check_redirects.py                 # 先查本地规则，未命中的发 HTTP 请求
+  python3 check_redirects.py --offline       # 只用本地规则，不联网（结果未验证，不会被应用）
+  python3 check_redirects.py --no-local      # 全部发 HTTP 请求（与旧行为一致）
+        """
+    )
     parser.add_argument(
         "--input",
         type=str,
@@ -161,6 +347,39 @@ if __name__ == "__main__":
         help="输出文件路径（默认：check_redirect_result.json）"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_WORKERS,
+        help=f"并发线程数（默认：{MAX_WORKERS}）"
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=MAX_RETRIES,
+        help=f"连接失败、429/5xx 时的重试次数（默认：{MAX_RETRIES}）"
+    )
 
-    check_redirects(result_file=args.input, output_file=args.output)
+    parser.add_argument(
+        "--no-local",
+        action="store_true",
+        help="不使用本地重定向规则，全部发起 HTTP 请求"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="只用本地重定向规则解析，不发起 HTTP 请求（本地结果未验证，未命中的记为错误）"
+    )
+
+    args = parser.parse_args()
+    if args.offline and args.no_local:
+        parser.error("--offline 与 --no-local 不能同时使用")
+
+    check_redirects(
+        result_file=args.input,
+        output_file=args.output,
+        max_workers=args.workers,
+        retries=args.retries,
+        use_local=not args.no_local,
+        offline=args.offline
+    )
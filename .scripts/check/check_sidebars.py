@@ -1,13 +1,31 @@
 #!/usr/bin/env python3
+"""
+校验各实例 sidebars.json 中的文档 id 是否存在，结果写入 sidebars_result.json，
+并在 sidebars.json 中为无效 id 的行末追加 "//id-incorrect" 注释。
+
+同时反向检查未被任何 sidebars 引用的文档（孤立页面）：
+- orphanFiles:      既不在 sidebars 中、也没有被可达页面通过 import 引入的文件（构建后无法访问）
+- importOnlyFiles:  不在 sidebars 中，只通过 import 被可达页面引入（作为片段使用）的文件
+doc 节点与 autogenerated 目录下的文件视为被引用；import 关系在遍历实例目录时一并读取，不额外遍历目录树，
+但独立运行时需要读取每个文档文件的内容（check_all.py 中直接复用链接检查的解析结果）。
+共用同一目录的实例（如多个实例指向同一 server 目录）在孤立页面报告中合并为一项，汇总数按文件去重。
+
+使用方法：
+python3 .scripts/check/check_sidebars.py            # 依次校验全部实例
+python3 .scripts/check/check_sidebars.py --jobs 8   # 使用 8 个进程并行校验（结果顺序与串行一致）
+"""
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 
 ROOT_DIR = Path(__file__).resolve().parent
@@ -16,6 +34,9 @@ PROJECT_ROOT = ROOT_DIR.parent.parent
 # 配置文件默认名，若不存在将于 main 中尝试回退到 en 版本
 DOCUO_CONFIG_PATH = (PROJECT_ROOT / "docuo.config.json").resolve()
 RESULT_PATH = ROOT_DIR / "sidebars_result.json"
+DOC_SUFFIXES = (".md", ".mdx")
+# import Xxx from "xxx.md(x)"：被导入文档的内容会出现在导入方页面中
+DOC_IMPORT_PATTERN = re.compile(r"import\s+\w+\s+from\s+['\"]([^'\"]+\.mdx?)['\"]")
 
 
 @dataclass
@@ -39,6 +60,16 @@ class InstanceResult:
     missingIds: List[SidebarDocIssue]
 
 
+@dataclass
+class InstanceCheck:
+    """validate_instance 的完整结果（供主进程标注 sidebars.json 与统计孤立页面）"""
+    result: InstanceResult
+    invalid_ids: Set[str]
+    doc_files: Dict[str, str]  # 文件绝对路径 -> 文档 ID
+    referenced: Set[str]       # sidebars 引用到的文件（绝对路径）
+    imports: Dict[str, List[str]]  # 文件绝对路径 -> 其 import 的文档（绝对路径）
+
+
 def read_json(path: Path) -> Any:
     with path.open("r", encoding="utf-8") as f:
         return json.load(f)
@@ -101,18 +132,65 @@ def path_to_doc_id(relative_path: Path) -> str:
     return "/".join(normalized_parts)
 
 
-def collect_valid_doc_ids(instance_dir: Path) -> Set[str]:
+def extract_doc_imports(content: str) -> List[str]:
+    """返回内容中 import Xxx from "xxx.md(x)" 的导入路径"""
+    if "import" not in content:
+        return []
+    return DOC_IMPORT_PATTERN.findall(content)
+
+
+def read_doc_imports(path: Path) -> List[str]:
+    """读取文件内容并返回其中的文档导入路径（孤立页面统计需要读取每个文档文件）"""
+    try:
+        return extract_doc_imports(path.read_text(encoding="utf-8"))
+    except Exception:
+        return []
+
+
+def resolve_doc_import(import_path: str, file_path: Path) -> str:
+    """/ 开头的导入相对项目根目录，其余相对当前文件所在目录；返回规范化后的绝对路径（不检查是否存在）"""
+    if import_path.startswith("/"):
+        return os.path.normpath(os.path.join(str(PROJECT_ROOT), import_path.lstrip("/")))
+    return os.path.normpath(os.path.join(str(file_path.parent), import_path))
+
+
+def doc_ids_from_files(instance_dir: Path, files: Iterable[Path]) -> Set[str]:
+    """由实例目录下的文件列表计算文档 ID 集合（只统计 .md/.mdx 文件）"""
     valid_ids: Set[str] = set()
-    if not instance_dir.exists():
-        return valid_ids
-    for path in instance_dir.rglob("*"):
-        if path.is_file() and path.suffix.lower() in {".md", ".mdx"}:
+    for path in files:
+        if path.suffix.lower() in {".md", ".mdx"}:
             rel = path.relative_to(instance_dir)
             doc_id = path_to_doc_id(rel)
             valid_ids.add(doc_id)
     return valid_ids
 
 
+def iter_doc_files(instance_dir: Path) -> Iterable[Path]:
+    """用 os.scandir 遍历实例目录，只产出 .md/.mdx 文件（目录项自带类型信息，无需逐个 stat）"""
+    stack = [str(instance_dir)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(DOC_SUFFIXES) and entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+
+
+def collect_valid_doc_ids(instance_dir: Path) -> Set[str]:
+    if not instance_dir.exists():
+        return set()
+    return doc_ids_from_files(instance_dir, iter_doc_files(instance_dir))
+
+
 def iter_doc_nodes(sidebars_obj: Any) -> Iterable[Tuple[Dict[str, Any], List[str]]]:
     """
     递归遍历 sidebars.json，产出 (node, nodePathLabels)。
@@ -145,7 +223,22 @@ def iter_doc_nodes(sidebars_obj: Any) -> Iterable[Tuple[Dict[str, Any], List[str
     yield from _walk(sidebars_obj, [])
 
 
-def load_sidebars(instance_dir: Path) -> Tuple[Optional[Path], Optional[Any]]:
+def iter_autogenerated_dirs(sidebars_obj: Any) -> Iterable[str]:
+    """产出 sidebars.json 中 autogenerated 节点的 dirName（该目录下的文档均由侧边栏自动引用）"""
+    if isinstance(sidebars_obj, dict):
+        if sidebars_obj.get("type") == "autogenerated":
+            dir_name = sidebars_obj.get("dirName")
+            if isinstance(dir_name, str):
+                yield dir_name
+        elif sidebars_obj.get("type") == "category":
+            yield from iter_autogenerated_dirs(sidebars_obj.get("items") or [])
+    elif isinstance(sidebars_obj, list):
+        for item in sidebars_obj:
+            yield from iter_autogenerated_dirs(item)
+
+
+def load_sidebars_data(instance_dir: Path) -> Tuple[Optional[Path], Optional[Any]]:
+    """读取实例的 sidebars.json（兼容 // 注释），返回 (路径, 解析后的完整对象)"""
     sidebars_path = instance_dir / "sidebars.json"
     if not sidebars_path.exists():
         return None, None
@@ -162,7 +255,10 @@ def load_sidebars(instance_dir: Path) -> Tuple[Optional[Path], Optional[Any]]:
             data = json.loads(cleaned)
         except Exception:
             return sidebars_path, None
+    return sidebars_path, data
+
 
+def select_sidebar_root(data: Any) -> Any:
     # 兼容 { "mySidebar": [...] } 或直接 [ ... ] 的结构
     if isinstance(data, dict):
         # 取第一个数组值作为侧边栏根（常见为 mySidebar）
@@ -174,7 +270,14 @@ def load_sidebars(instance_dir: Path) -> Tuple[Optional[Path], Optional[Any]]:
         root = array_like if array_like is not None else data
     else:
         root = data
-    return sidebars_path, root
+    return root
+
+
+def load_sidebars(instance_dir: Path) -> Tuple[Optional[Path], Optional[Any]]:
+    sidebars_path, data = load_sidebars_data(instance_dir)
+    if data is None:
+        return sidebars_path, None
+    return sidebars_path, select_sidebar_root(data)
 
 
 def annotate_sidebars_file(sidebars_path: Path, invalid_ids: Set[str]) -> int:
@@ -207,8 +310,8 @@ def annotate_sidebars_file(sidebars_path: Path, invalid_ids: Set[str]) -> int:
     return added
 
 
-def main() -> int:
-    # 优先使用 docuo.config.json，不存在时回退到 docuo.config.en.json
+def resolve_config_path() -> Optional[Path]:
+    """优先使用 docuo.config.json，不存在时回退到 docuo.config.en.json；都不存在时返回 None"""
     config_path = DOCUO_CONFIG_PATH
     if not config_path.exists():
         fallback_path = (PROJECT_ROOT / "docuo.config.en.json").resolve()
@@ -217,37 +320,47 @@ def main() -> int:
             print(f"未找到 docuo.config.json，已回退使用: {config_path}")
         else:
             print(f"未找到配置文件: {DOCUO_CONFIG_PATH} 或 {fallback_path}")
-            return 1
-
-    try:
-        config = read_json(config_path)
-    except Exception as e:
-        print(f"读取配置失败: {e}")
-        return 1
-
-    instances = config.get("instances") or []
-    if not isinstance(instances, list):
-        print("配置中的 instances 非数组")
-        return 1
+            return None
+    return config_path
 
-    results: List[InstanceResult] = []
-    total_invalid = 0
 
-    for inst in instances:
-        inst_id = inst.get("id") if isinstance(inst, dict) else None
-        inst_rel_path = inst.get("path") if isinstance(inst, dict) else None
-        if not inst_rel_path:
-            continue
-        # 跳过 path 为 http(s) 的实例
-        if isinstance(inst_rel_path, str) and inst_rel_path.strip().lower().startswith(("http://", "https://")):
+def validate_instance(
+    inst: Any,
+    files_for: Callable[[Path], Iterable[Path]] = iter_doc_files,
+    imports_for: Callable[[Path], List[str]] = read_doc_imports,
+) -> Optional[InstanceCheck]:
+    """
+    校验单个实例的 sidebars.json（不修改文件）。
+    跳过没有 path 或 path 为 http(s) 的实例（返回 None）。
+    files_for 返回实例目录下的 .md/.mdx 文件，imports_for 返回文件中的文档导入路径；
+    遍历文件时一并计算文档 ID 与 import 关系（check_all.py 传入单次遍历与解析的结果）。
+    """
+    inst_id = inst.get("id") if isinstance(inst, dict) else None
+    inst_rel_path = inst.get("path") if isinstance(inst, dict) else None
+    if not inst_rel_path:
+        return None
+    # 跳过 path 为 http(s) 的实例
+    if isinstance(inst_rel_path, str) and inst_rel_path.strip().lower().startswith(("http://", "https://")):
+        return None
+    inst_dir = (PROJECT_ROOT / inst_rel_path).resolve()
+
+    doc_files: Dict[str, str] = {}
+    imports: Dict[str, List[str]] = {}
+    for path in files_for(inst_dir):
+        if path.suffix.lower() not in DOC_SUFFIXES:
             continue
-        inst_dir = (PROJECT_ROOT / inst_rel_path).resolve()
-
-        valid_ids = collect_valid_doc_ids(inst_dir)
-
-        sidebars_path, sidebars_root = load_sidebars(inst_dir)
-        if sidebars_root is None:
-            res = InstanceResult(
+        file_key = str(path)
+        doc_files[file_key] = path_to_doc_id(path.relative_to(inst_dir))
+        file_imports = imports_for(path)
+        if file_imports:
+            imports[file_key] = [resolve_doc_import(p, path) for p in file_imports]
+    valid_ids = set(doc_files.values())
+
+    sidebars_path, sidebars_data = load_sidebars_data(inst_dir)
+    sidebars_root = select_sidebar_root(sidebars_data) if sidebars_data is not None else None
+    if sidebars_root is None:
+        return InstanceCheck(
+            result=InstanceResult(
                 id=inst_id,
                 path=inst_rel_path,
                 absPath=str(inst_dir),
@@ -257,42 +370,53 @@ def main() -> int:
                 docsValid=0,
                 docsInvalid=0,
                 missingIds=[],
-            )
-            results.append(res)
-            continue
+            ),
+            invalid_ids=set(),
+            doc_files=doc_files,
+            referenced=set(),
+            imports=imports,
+        )
 
-        issues: List[SidebarDocIssue] = []
-        docs_total = 0
-        docs_valid = 0
-        for node, breadcrumbs in iter_doc_nodes(sidebars_root):
-            docs_total += 1
-            node_id = node.get("id")
-            node_label = node.get("label")
-            node_article_id = node.get("articleID")
-            if isinstance(node_id, str) and node_id in valid_ids:
-                docs_valid += 1
-            else:
-                issues.append(
-                    SidebarDocIssue(
-                        id=str(node_id),
-                        label=str(node_label) if node_label is not None else None,
-                        articleID=node_article_id,
-                        nodePath=[str(x) for x in breadcrumbs if x is not None],
-                    )
+    issues: List[SidebarDocIssue] = []
+    docs_total = 0
+    docs_valid = 0
+    for node, breadcrumbs in iter_doc_nodes(sidebars_root):
+        docs_total += 1
+        node_id = node.get("id")
+        node_label = node.get("label")
+        node_article_id = node.get("articleID")
+        if isinstance(node_id, str) and node_id in valid_ids:
+            docs_valid += 1
+        else:
+            issues.append(
+                SidebarDocIssue(
+                    id=str(node_id),
+                    label=str(node_label) if node_label is not None else None,
+                    articleID=node_article_id,
+                    nodePath=[str(x) for x in breadcrumbs if x is not None],
                 )
+            )
 
-        docs_invalid = docs_total - docs_valid
-        total_invalid += docs_invalid
+    docs_invalid = docs_total - docs_valid
+
+    # 被引用的文件：文件中全部侧边栏（如 mySidebar 与 clientApi）的 doc 节点对应的文件，
+    # 以及 autogenerated 目录下的全部文件
+    all_roots = list(sidebars_data.values()) if isinstance(sidebars_data, dict) else [sidebars_data]
+    referenced_ids = {node.get("id") for node, _ in iter_doc_nodes(all_roots)}
+    auto_prefixes = tuple(
+        "/".join(normalize_segment(p) for p in Path(d.strip("/")).parts) + "/"
+        for d in iter_autogenerated_dirs(all_roots) if d.strip("/")
+    )
+    referenced = {
+        file_key for file_key, doc_id in doc_files.items()
+        if doc_id in referenced_ids or (auto_prefixes and doc_id.startswith(auto_prefixes))
+    }
 
-        # 将无效 id 收集为集合以便原文件标注
-        invalid_id_set: Set[str] = set(mi.id for mi in issues if mi.id)
-        # 写回标注
-        try:
-            annotate_sidebars_file(sidebars_path, invalid_id_set)
-        except Exception:
-            pass
+    # 将无效 id 收集为集合以便原文件标注
+    invalid_id_set: Set[str] = set(mi.id for mi in issues if mi.id)
 
-        res = InstanceResult(
+    return InstanceCheck(
+        result=InstanceResult(
             id=inst_id,
             path=inst_rel_path,
             absPath=str(inst_dir),
@@ -302,19 +426,138 @@ def main() -> int:
             docsValid=docs_valid,
             docsInvalid=docs_invalid,
             missingIds=issues,
-        )
-        results.append(res)
+        ),
+        invalid_ids=invalid_id_set,
+        doc_files=doc_files,
+        referenced=referenced,
+        imports=imports,
+    )
+
+
+def annotate_instance(result: InstanceResult, invalid_ids: Set[str]) -> None:
+    """在实例的 sidebars.json 中标注无效 id（同一文件可能被多个实例共用，只在主进程中依次写入）"""
+    if not result.sidebarsPath or not invalid_ids:
+        return
+    try:
+        annotate_sidebars_file(Path(result.sidebarsPath), invalid_ids)
+    except Exception:
+        pass
+
+
+def check_instance(
+    inst: Any,
+    files_for: Callable[[Path], Iterable[Path]] = iter_doc_files,
+    imports_for: Callable[[Path], List[str]] = read_doc_imports,
+) -> Optional[InstanceCheck]:
+    """校验单个实例的 sidebars.json，并在原文件中标注无效 id；跳过的实例返回 None"""
+    checked = validate_instance(inst, files_for, imports_for)
+    if checked is not None:
+        annotate_instance(checked.result, checked.invalid_ids)
+    return checked
+
+
+def check_instances(instances: List[Any], jobs: int = 1) -> List[InstanceCheck]:
+    """
+    校验一组实例，结果按配置中的顺序排列。
+    jobs > 1 时由进程池并行校验；标注 sidebars.json 统一在全部校验完成后于主进程中按顺序进行，
+    避免多个实例共用同一 sidebars.json 时并发读写。
+    """
+    if jobs > 1 and len(instances) > 1:
+        chunksize = max(1, len(instances) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            checked = list(executor.map(validate_instance, instances, chunksize=chunksize))
+    else:
+        checked = [validate_instance(inst) for inst in instances]
+
+    checks = [item for item in checked if item is not None]
+    for item in checks:
+        annotate_instance(item.result, item.invalid_ids)
+    return checks
+
 
+def find_orphans(checks: List[InstanceCheck]) -> List[Dict[str, Any]]:
+    """
+    统计各实例目录中未被 sidebars 引用的文档（集合差），返回有孤立页面的目录列表。
+
+    从全部实例中被 sidebars 引用的文件出发，沿 import 关系求可达文件（可跨实例）：
+    不可达的为 orphanFiles，可达但只通过 import 引入的为 importOnlyFiles。
+    被 import 的文件附带 importedBy（引用它的文件，相对仓库根目录）。
+    共用同一目录的实例合并为一项（ids 为这些实例的 id），目录中的文件被其中任一实例引用即不算孤立。
+    没有 sidebars.json 的实例不参与统计。
+    """
+    reachable: Set[str] = set()
+    all_imports: Dict[str, List[str]] = {}
+    imported_by: Dict[str, List[str]] = {}
+    for check in checks:
+        reachable |= check.referenced
+        all_imports.update(check.imports)
+        for source, targets in check.imports.items():
+            for target in targets:
+                importers = imported_by.setdefault(target, [])
+                if source not in importers:
+                    importers.append(source)
+
+    queue = list(reachable)
+    while queue:
+        for target in all_imports.get(queue.pop(), ()):
+            if target not in reachable:
+                reachable.add(target)
+                queue.append(target)
+
+    # 按实例目录分组（保持配置中首次出现的顺序）
+    groups: Dict[str, List[InstanceCheck]] = {}
+    for check in checks:
+        if not check.result.sidebarsMissing:
+            groups.setdefault(check.result.absPath, []).append(check)
+
+    orphans: List[Dict[str, Any]] = []
+    for inst_dir, group in groups.items():
+        doc_files: Dict[str, str] = {}
+        referenced: Set[str] = set()
+        for check in group:
+            doc_files.update(check.doc_files)
+            referenced |= check.referenced
+        orphan_files: List[Dict[str, Any]] = []
+        import_only_files: List[Dict[str, Any]] = []
+        for file_key in sorted(set(doc_files) - referenced):
+            entry = {"id": doc_files[file_key], "file": os.path.relpath(file_key, inst_dir)}
+            # 孤立页面也可能被其他孤立页面 import，同样列出便于一并处理
+            if file_key in imported_by:
+                entry["importedBy"] = [os.path.relpath(p, str(PROJECT_ROOT)) for p in imported_by[file_key]]
+            if file_key in reachable:
+                import_only_files.append(entry)
+            else:
+                orphan_files.append(entry)
+        if orphan_files or import_only_files:
+            orphans.append({
+                "ids": [check.result.id for check in group],
+                "path": group[0].result.path,
+                "absPath": inst_dir,
+                "orphanFiles": orphan_files,
+                "importOnlyFiles": import_only_files,
+            })
+    return orphans
+
+
+def build_output(checks: List[InstanceCheck]) -> Dict[str, Any]:
+    results = [c.result for c in checks]
     total_instances = len(results)
+    total_invalid = sum(r.docsInvalid for r in results)
     error_instances = [r for r in results if r.docsInvalid > 0 or r.sidebarsMissing]
+    orphans = find_orphans(checks)
+    # 嵌套的实例目录可能包含相同文件，汇总数按绝对路径去重
+    orphan_paths = {os.path.join(o["absPath"], f["file"]) for o in orphans for f in o["orphanFiles"]}
+    import_only_paths = {os.path.join(o["absPath"], f["file"]) for o in orphans for f in o["importOnlyFiles"]}
 
-    output = {
+    return {
         "checkedAt": datetime.now(timezone.utc).isoformat(),
         "root": str(PROJECT_ROOT),
         "summary": {
             "totalInstances": total_instances,
             "instancesWithErrors": len(error_instances),
             "totalInvalidIds": total_invalid,
+            "totalOrphanFiles": len(orphan_paths),
+            "totalImportOnlyFiles": len(import_only_paths),
         },
         "instances": [
             {
@@ -324,11 +567,42 @@ def main() -> int:
             }
             for r in error_instances
         ],
+        "orphans": orphans,
     }
 
+
+def write_result(output: Dict[str, Any]) -> None:
     with RESULT_PATH.open("w", encoding="utf-8") as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
 
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="校验 sidebars.json 中的文档 id 是否存在")
+    parser.add_argument("--jobs", "-j", metavar="N", type=int, default=1,
+                        help="并行校验的进程数（默认 1，即串行）")
+    args = parser.parse_args()
+
+    config_path = resolve_config_path()
+    if config_path is None:
+        return 1
+
+    try:
+        config = read_json(config_path)
+    except Exception as e:
+        print(f"读取配置失败: {e}")
+        return 1
+
+    instances = config.get("instances") or []
+    if not isinstance(instances, list):
+        print("配置中的 instances 非数组")
+        return 1
+
+    output = build_output(check_instances(instances, args.jobs))
+    write_result(output)
+
+    summary = output["summary"]
+    print(f"无效 id {summary['totalInvalidIds']} 个；未被 sidebars 引用的页面 {summary['totalOrphanFiles']} 个，"
+          f"另有 {summary['totalImportOnlyFiles']} 个只通过 import 引入")
     print(f"校验完成，结果已写入: {RESULT_PATH}")
     return 0
 
@@ -27,6 +27,10 @@ def extract_images_from_file(file_path):
         print(f'读取文件失败 {file_path}: {e}', file=sys.stderr)
         return []
 
+    return extract_images_from_content(content)
+
+def extract_images_from_content(content):
+    """从文件内容中提取所有图片链接"""
     image_urls = []
 
     # 1. 提取 Markdown 格式的图片: ![alt](url)
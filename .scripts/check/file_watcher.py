@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文件变化监听（check_links.py / check_html_tags.py 的 --watch 模式共用）
+
+- 已安装 watchdog 时使用系统文件事件（inotify / FSEvents / ReadDirectoryChangesW）
+- 未安装时退化为按固定间隔轮询：遍历监听目录，比较各文件的 mtime_ns/size
+  （约 1 万个 mdx 文件单次轮询约 0.1 秒）
+
+两种方式都会把短时间内的连续事件合并为一批：编辑器"写临时文件再重命名"式的保存、
+一次保存多个文件等只会触发一次检查。
+
+使用方法：
+python3 .scripts/check/file_watcher.py <目录>...            # 打印监听到的变化（调试用）
+python3 .scripts/check/file_watcher.py <目录> --poll        # 强制使用轮询
+"""
+
+import argparse
+import os
+import queue
+import sys
+import time
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+DEFAULT_SUFFIXES = ('.mdx',)
+POLL_INTERVAL = 0.5     # 轮询间隔（秒）
+DEBOUNCE_SECONDS = 0.1  # 发现变化后再等待的时间，用于合并同一次保存产生的多个事件
+
+
+def top_level_dirs(roots):
+    """去掉重复以及被其他目录包含的目录，避免同一文件被监听两次"""
+    result = []
+    for root in sorted({os.path.normpath(os.path.abspath(r)) for r in roots}):
+        if result and (root == result[-1] or root.startswith(result[-1] + os.sep)):
+            continue
+        result.append(root)
+    return result
+
+
+def snapshot(roots, suffixes=DEFAULT_SUFFIXES):
+    """返回 {文件绝对路径: (mtime_ns, size)}，文件范围与 find_mdx_files 一致（后缀不区分大小写）"""
+    stamps = {}
+    stack = list(top_level_dirs(roots))
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(suffixes):
+                        st = entry.stat()
+                        stamps[entry.path] = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    continue
+    return stamps
+
+
+def diff_snapshots(old, new):
+    """比较两次快照，返回 (新增或修改的文件, 删除的文件)，均已排序"""
+    changed = sorted(path for path, stamp in new.items() if old.get(path) != stamp)
+    removed = sorted(path for path in old if path not in new)
+    return changed, removed
+
+
+class PollingWatcher:
+    """按间隔轮询 mtime/size 的监听器"""
+
+    def __init__(self, roots, suffixes=DEFAULT_SUFFIXES, interval=POLL_INTERVAL):
+        self.roots = top_level_dirs(roots)
+        self.suffixes = tuple(suffixes)
+        self.interval = interval
+        self.stamps = snapshot(self.roots, self.suffixes)
+
+    def file_count(self):
+        return len(self.stamps)
+
+    def wait(self):
+        """阻塞直到有文件变化，返回 (新增或修改的文件, 删除的文件)"""
+        while True:
+            time.sleep(self.interval)
+            current = snapshot(self.roots, self.suffixes)
+            if current == self.stamps:
+                continue
+            # 等保存动作完成后再取一次快照，与上一批次的基准比较
+            time.sleep(DEBOUNCE_SECONDS)
+            current = snapshot(self.roots, self.suffixes)
+            changed, removed = diff_snapshots(self.stamps, current)
+            self.stamps = current
+            if changed or removed:
+                return changed, removed
+
+    def close(self):
+        pass
+
+
+class _EventCollector(FileSystemEventHandler):
+    def __init__(self, suffixes, events):
+        super().__init__()
+        self.suffixes = suffixes
+        self.events = events
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        for path in (getattr(event, 'src_path', None), getattr(event, 'dest_path', None)):
+            if path and os.fsdecode(path).lower().endswith(self.suffixes):
+                self.events.put(os.path.normpath(os.fsdecode(path)))
+
+
+class WatchdogWatcher:
+    """基于 watchdog 系统文件事件的监听器"""
+
+    def __init__(self, roots, suffixes=DEFAULT_SUFFIXES):
+        self.roots = top_level_dirs(roots)
+        self.suffixes = tuple(suffixes)
+        self.events = queue.Queue()
+        self.stamps = snapshot(self.roots, self.suffixes)
+        self.observer = Observer()
+        handler = _EventCollector(self.suffixes, self.events)
+        for root in self.roots:
+            self.observer.schedule(handler, root, recursive=True)
+        self.observer.start()
+
+    def file_count(self):
+        return len(self.stamps)
+
+    def wait(self):
+        """阻塞直到有文件变化，返回 (新增或修改的文件, 删除的文件)"""
+        while True:
+            # 带超时等待，保证主线程能及时响应 Ctrl+C
+            try:
+                paths = {self.events.get(timeout=0.5)}
+            except queue.Empty:
+                continue
+            deadline = time.monotonic() + DEBOUNCE_SECONDS
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    paths.add(self.events.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            # 事件只说明"可能变了"，仍以 mtime/size 为准（忽略只读访问、内容未变的重复写入等）
+            changed, removed = [], []
+            for path in sorted(paths):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    if self.stamps.pop(path, None) is not None:
+                        removed.append(path)
+                    continue
+                stamp = (st.st_mtime_ns, st.st_size)
+                if self.stamps.get(path) != stamp:
+                    self.stamps[path] = stamp
+                    changed.append(path)
+            if changed or removed:
+                return changed, removed
+
+    def close(self):
+        self.observer.stop()
+        self.observer.join()
+
+
+def create_watcher(roots, suffixes=DEFAULT_SUFFIXES, interval=POLL_INTERVAL, force_poll=False):
+    """创建监听器：已安装 watchdog 时使用系统事件，否则轮询"""
+    if Observer is not None and not force_poll:
+        try:
+            return WatchdogWatcher(roots, suffixes)
+        except OSError:
+            # 如 inotify 监听数达到上限，退化为轮询
+            pass
+    return PollingWatcher(roots, suffixes, interval)
+
+
+def watcher_kind(watcher):
+    return '文件系统事件 (watchdog)' if isinstance(watcher, WatchdogWatcher) else f'轮询 (每 {watcher.interval}s)'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='监听目录下文件的变化（调试用）')
+    parser.add_argument('roots', nargs='+', metavar='DIR', help='要监听的目录')
+    parser.add_argument('--suffix', action='append', help='文件后缀（可多次指定，默认 .mdx）')
+    parser.add_argument('--poll', action='store_true', help='强制使用轮询')
+    parser.add_argument('--interval', type=float, default=POLL_INTERVAL, help=f'轮询间隔（秒，默认 {POLL_INTERVAL}）')
+    args = parser.parse_args()
+
+    watcher = create_watcher(args.roots, tuple(args.suffix or DEFAULT_SUFFIXES), args.interval, args.poll)
+    print(f'正在监听 {watcher.file_count()} 个文件，方式: {watcher_kind(watcher)}（Ctrl+C 退出）')
+    try:
+        while True:
+            changed, removed = watcher.wait()
+            for path in changed:
+                print(f'  修改 {path}')
+            for path in removed:
+                print(f'  删除 {path}')
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
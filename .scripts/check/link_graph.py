@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文档反向链接图（谁链接到了谁）
+
+由 check_links.py 在提取链接时生成并持久化到 link_graph.sqlite：
+- 正向：源文件 -> [(目标文件, 锚点, 行号, 链接类型), ...]
+- 反向：目标文件 -> [(源文件, 锚点, 行号, 链接类型), ...]（按目标建索引，查询为毫秒级）
+
+文件路径统一使用相对仓库根目录的 POSIX 路径，并在 paths 表中只存一份。
+解析不到现有文件的站内链接（如目标已删除）也会记录：相对路径链接与 import 以规范化后的目标路径为目标，
+站内根路径链接以 route:<实例目录>/<不带连字符的文件ID> 为目标（见 check_links.graph_target_keys）。
+每个源文件记录 mtime/size 与内容 sha1：mtime/size 未变化时直接跳过；
+变化但内容 sha1 相同（如 git checkout 后）时只更新时间戳，不重新提取。
+
+使用方法：
+python3 .scripts/check/link_graph.py refresh                     # 增量刷新全部实例
+python3 .scripts/check/link_graph.py inbound <文件> [--anchor A]  # 哪些地方链接到了该文件
+python3 .scripts/check/link_graph.py outbound <文件>              # 该文件链接到了哪些文件
+python3 .scripts/check/link_graph.py stats
+
+其他脚本（如重命名、标题修改、重定向处理）可直接使用 LinkGraph.load().inbound(path) 查询影响范围。
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+
+GRAPH_VERSION = '3'
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 以项目根目录为基准（本脚本位于 .scripts/check/ 下，因此向上两级）
+PROJECT_ROOT = os.path.dirname(os.path.dirname(ROOT_DIR))
+DEFAULT_GRAPH_PATH = os.path.join(ROOT_DIR, 'link_graph.sqlite')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS paths (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS files (
+    path_id INTEGER PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER,
+    sha1 TEXT
+);
+CREATE TABLE IF NOT EXISTS edges (
+    source_id INTEGER NOT NULL,
+    target_id INTEGER NOT NULL,
+    anchor TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS edges_by_target ON edges (target_id);
+CREATE INDEX IF NOT EXISTS edges_by_source ON edges (source_id);
+'''
+
+
+def file_stamp(abs_path):
+    """返回文件的 [mtime_ns, size]，文件不存在时返回 None"""
+    try:
+        st = os.stat(abs_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def file_sha1(abs_path):
+    """返回文件内容的 sha1，读取失败时返回 None"""
+    try:
+        with open(abs_path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def to_repo_rel(path, repo_root=PROJECT_ROOT):
+    """将绝对路径或相对仓库根目录的路径统一为 POSIX 相对路径"""
+    if os.path.isabs(path):
+        path = os.path.relpath(path, repo_root)
+    return os.path.normpath(path).replace('\\', '/')
+
+
+class LinkGraph:
+    """基于 SQLite 的反向链接图"""
+
+    def __init__(self, path=DEFAULT_GRAPH_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != GRAPH_VERSION:
+            # 版本不一致时清空重建
+            self.conn.executescript('DELETE FROM edges; DELETE FROM files; DELETE FROM paths;')
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (GRAPH_VERSION,))
+            self.conn.commit()
+        self._path_ids = {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_GRAPH_PATH):
+        return cls(path)
+
+    def save(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def _path_id(self, rel_path, create=True):
+        path_id = self._path_ids.get(rel_path)
+        if path_id is not None:
+            return path_id
+        row = self.conn.execute('SELECT id FROM paths WHERE path = ?', (rel_path,)).fetchone()
+        if row is not None:
+            path_id = row[0]
+        elif create:
+            path_id = self.conn.execute('INSERT INTO paths (path) VALUES (?)', (rel_path,)).lastrowid
+        else:
+            return None
+        self._path_ids[rel_path] = path_id
+        return path_id
+
+    def file_count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+
+    def source_files(self):
+        """返回图中记录的全部源文件"""
+        rows = self.conn.execute('SELECT paths.path FROM files JOIN paths ON paths.id = files.path_id')
+        return {row[0] for row in rows}
+
+    def get_file(self, rel_path):
+        """返回源文件记录 (stamp, sha1)，不存在时返回 None"""
+        path_id = self._path_id(rel_path, create=False)
+        if path_id is None:
+            return None
+        row = self.conn.execute('SELECT mtime_ns, size, sha1 FROM files WHERE path_id = ?', (path_id,)).fetchone()
+        if row is None:
+            return None
+        return [row[0], row[1]], row[2]
+
+    def is_fresh(self, rel_path, stamp):
+        record = self.get_file(rel_path)
+        return record is not None and record[0] == list(stamp)
+
+    def touch_file(self, rel_path, stamp):
+        """内容未变化时只更新时间戳"""
+        self.conn.execute('UPDATE files SET mtime_ns = ?, size = ? WHERE path_id = ?',
+                          (stamp[0], stamp[1], self._path_id(rel_path)))
+
+    def update_file(self, rel_path, stamp, sha1, edges):
+        """替换源文件的出链；edges 为 [(目标, 锚点, 行号, 类型), ...]"""
+        source_id = self._path_id(rel_path)
+        self.conn.execute('DELETE FROM edges WHERE source_id = ?', (source_id,))
+        self.conn.execute('INSERT OR REPLACE INTO files (path_id, mtime_ns, size, sha1) VALUES (?, ?, ?, ?)',
+                          (source_id, stamp[0], stamp[1], sha1))
+        self.conn.executemany(
+            'INSERT INTO edges (source_id, target_id, anchor, line, kind) VALUES (?, ?, ?, ?, ?)',
+            [(source_id, self._path_id(target), anchor or '', line, kind) for target, anchor, line, kind in edges]
+        )
+
+    def remove_file(self, rel_path):
+        source_id = self._path_id(rel_path, create=False)
+        if source_id is None:
+            return
+        self.conn.execute('DELETE FROM edges WHERE source_id = ?', (source_id,))
+        self.conn.execute('DELETE FROM files WHERE path_id = ?', (source_id,))
+
+    def inbound(self, target_rel_path, anchor=None):
+        """返回链接到目标文件的所有 (源文件, 锚点, 行号, 类型)；指定 anchor 时只返回指向该锚点的链接"""
+        target_id = self._path_id(target_rel_path, create=False)
+        if target_id is None:
+            return []
+        sql = ('SELECT paths.path, edges.anchor, edges.line, edges.kind FROM edges '
+               'JOIN paths ON paths.id = edges.source_id WHERE edges.target_id = ?')
+        params = [target_id]
+        if anchor is not None:
+            sql += ' AND lower(edges.anchor) = lower(?)'
+            params.append(anchor)
+        return [tuple(row) for row in self.conn.execute(sql + ' ORDER BY paths.path, edges.line', params)]
+
+    def outbound(self, source_rel_path):
+        """返回源文件链接到的所有 (目标文件, 锚点, 行号, 类型)"""
+        source_id = self._path_id(source_rel_path, create=False)
+        if source_id is None:
+            return []
+        rows = self.conn.execute(
+            'SELECT paths.path, edges.anchor, edges.line, edges.kind FROM edges '
+            'JOIN paths ON paths.id = edges.target_id WHERE edges.source_id = ? ORDER BY edges.line',
+            (source_id,))
+        return [tuple(row) for row in rows]
+
+    def importers_closure(self, target_rel_paths):
+        """返回目标文件及所有（直接或间接）通过 import 引入它们的文件
+
+        被导入文件的标题会出现在导入方页面中，因此导入方的锚点也会随之变化。
+        """
+        result = set(target_rel_paths)
+        queue = list(target_rel_paths)
+        while queue:
+            current = queue.pop()
+            for source, _, _, kind in self.inbound(current):
+                if kind == 'mdx_import' and source not in result:
+                    result.add(source)
+                    queue.append(source)
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='查询文档反向链接图（谁链接到了谁）')
+    parser.add_argument('--db', default=DEFAULT_GRAPH_PATH, help='链接图数据库路径（默认 link_graph.sqlite）')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('refresh', help='按 mtime/sha1 增量刷新全部实例的链接图')
+    p_in = sub.add_parser('inbound', help='列出链接到指定文件的位置')
+    p_in.add_argument('file', help='目标文件（相对仓库根目录或绝对路径）')
+    p_in.add_argument('--anchor', help='只列出指向该锚点的链接')
+    p_out = sub.add_parser('outbound', help='列出指定文件链接到的文件')
+    p_out.add_argument('file', help='源文件（相对仓库根目录或绝对路径）')
+    sub.add_parser('stats', help='输出链接图统计信息')
+    parser.add_argument('--json', action='store_true', help='以 JSON 格式输出查询结果')
+    args = parser.parse_args()
+
+    graph = LinkGraph.load(args.db)
+
+    if args.command == 'refresh':
+        # 延迟导入，避免查询时加载 check_links 的依赖
+        import check_links
+        refreshed = check_links.refresh_link_graph(graph, PROJECT_ROOT)
+        graph.save()
+        print(f'链接图已更新：重新提取 {refreshed} 个文件，共 {graph.file_count()} 个文件')
+        return 0
+
+    if args.command == 'stats':
+        edge_count = graph.conn.execute('SELECT COUNT(*) FROM edges').fetchone()[0]
+        print(f'源文件数: {graph.file_count()}')
+        print(f'链接数: {edge_count}')
+        return 0
+
+    rel_path = to_repo_rel(args.file)
+    if args.command == 'inbound':
+        rows = graph.inbound(rel_path, args.anchor)
+    else:
+        rows = graph.outbound(rel_path)
+
+    if args.json:
+        keys = ('source' if args.command == 'inbound' else 'target', 'anchor', 'line', 'type')
+        print(json.dumps([dict(zip(keys, row)) for row in rows], ensure_ascii=False, indent=2))
+        return 0
+
+    for path, anchor, line, kind in rows:
+        anchor_display = f'#{anchor}' if anchor else ''
+        if args.command == 'inbound':
+            # vscode终端可点击跳转格式: "file_path":line
+            print(f'  "{os.path.join(PROJECT_ROOT, path)}":{line}  [{kind}] {anchor_display}')
+        else:
+            print(f'  {line}: [{kind}] {path}{anchor_display}')
+    print(f'共 {len(rows)} 处')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
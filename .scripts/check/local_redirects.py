@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+本地重定向规则（check_redirects.py 先查本地规则，未命中的再发 HTTP 请求）。
+
+规则来源（同一旧链接以先出现的为准）：
+1. .scripts/migrate/nginx_redirect.conf 中的 rewrite ^/article/ID$ 规则（线上配置，nginx 按顺序取第一条匹配）
+2. generate_redirect.py 根据各实例 sidebars.json 中 articleID 生成的 rewrite 规则
+3. .scripts/api/redirect_map.json 中的 old_url -> new_url 映射
+
+三者合并为一张 {旧链接: 目标链接} 表，解析时沿表跟随多次重定向，
+返回结果的格式与 check_redirects.get_final_url 一致（含 requests 对锚点、URL 编码的处理）。
+只有 path 完全匹配的链接才算命中，带查询参数的 /article 链接、
+if ($request_uri ~ ...) 形式的规则不在本地解析，交给 HTTP 请求。
+
+本地解析不确认最终页面是否存在：结果的 status_code 为 None、verified 为 False，
+由 check_redirects.py 对最终 URL 发一次请求后补上真实状态码（--offline 时保持未验证）。
+
+使用方法：
+python3 .scripts/check/local_redirects.py <url>...      # 打印本地解析结果
+python3 .scripts/check/local_redirects.py --stats       # 打印规则统计
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+
+from requests.utils import requote_uri
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+NGINX_CONF_PATH = REPO_ROOT / ".scripts" / "migrate" / "nginx_redirect.conf"
+REDIRECT_MAP_PATH = REPO_ROOT / ".scripts" / "api" / "redirect_map.json"
+# nginx_redirect.conf 是 doc-zh.zego.im 的 location /article 配置
+NGINX_BASE_DOMAIN = "https://doc-zh.zego.im"
+MAX_HOPS = 30  # 与 requests 默认的最大重定向次数一致
+
+# rewrite ^/article/(id1|id2)$ https://... permanent;  或  rewrite ^/article/id$ https://... permanent;
+# 与 migrate/replace_article_link.parse_nginx_config 的两种写法相同，这里按出现顺序一次匹配
+REWRITE_PATTERN = re.compile(
+    r"^\s*rewrite\s+\^/article/(?:\(([^)]+)\)|(\d+))[$]\s+(\S+)\s+permanent;",
+    re.MULTILINE
+)
+
+# 合并后的规则表，首次使用时加载：{"table": {...}, "stats": {...}}
+_redirect_table = None
+
+
+def parse_rewrite_rules(content: str, base_domain: str = NGINX_BASE_DOMAIN) -> List[Tuple[str, str]]:
+    """解析 rewrite ^/article/ID$ 规则，按出现顺序返回 [(旧链接, 目标链接)]"""
+    rules = []
+    for match in REWRITE_PATTERN.finditer(content):
+        ids = match.group(1) or match.group(2)
+        target = match.group(3)
+        # 目标以 ? 结尾表示不带原请求的查询参数
+        if target.endswith("?"):
+            target = target[:-1]
+        if target.startswith("/"):
+            target = base_domain + target
+        for article_id in ids.split("|"):
+            article_id = article_id.strip()
+            if article_id:
+                rules.append((f"{base_domain}/article/{article_id}", target))
+    return rules
+
+
+def load_nginx_rules(conf_path: Path = NGINX_CONF_PATH) -> List[Tuple[str, str]]:
+    try:
+        content = conf_path.read_text(encoding="utf-8")
+    except OSError as e:
+        print(f"警告：无法读取 {conf_path}：{e}")
+        return []
+    return parse_rewrite_rules(content)
+
+
+def load_generated_rules() -> List[Tuple[str, str]]:
+    """用 generate_redirect.py 为 docuo.config.zh.json 中的实例生成规则，再按 rewrite 格式解析"""
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    try:
+        import generate_redirect
+    except ImportError as e:
+        print(f"警告：无法导入 generate_redirect.py：{e}")
+        return []
+
+    config_path = REPO_ROOT / generate_redirect.CONFIG_FILENAME
+    try:
+        config = generate_redirect.load_json_file(str(config_path))
+    except Exception as e:
+        print(f"警告：无法读取 {config_path}：{e}")
+        return []
+
+    rules = []
+    for instance in config.get("instances", []):
+        block, _ = generate_redirect.generate_for_instance(str(REPO_ROOT), instance)
+        if block:
+            rules.extend(parse_rewrite_rules(block, generate_redirect.BASE_DOMAIN))
+    return rules
+
+
+def load_redirect_map(map_path: Path = REDIRECT_MAP_PATH) -> List[Tuple[str, str]]:
+    try:
+        with open(map_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"警告：无法读取 {map_path}：{e}")
+        return []
+    return [
+        (item["old_url"], item["new_url"])
+        for item in entries
+        if isinstance(item, dict) and item.get("old_url") and item.get("new_url")
+    ]
+
+
+def build_redirect_table(sources: List[Tuple[str, List[Tuple[str, str]]]]) -> Tuple[Dict[str, str], Dict[str, int]]:
+    """
+    合并多个来源的规则，同一旧链接以先出现的为准。
+
+    Returns:
+        (规则表, {来源名: 实际生效的规则数})
+    """
+    table: Dict[str, str] = {}
+    stats: Dict[str, int] = {}
+    for name, rules in sources:
+        added = 0
+        for old_url, target in rules:
+            if old_url not in table:
+                table[old_url] = target
+                added += 1
+        stats[name] = added
+    return table, stats
+
+
+def get_redirect_table() -> Dict[str, str]:
+    """返回合并后的规则表（同一进程内只加载一次）"""
+    global _redirect_table
+    if _redirect_table is None:
+        table, stats = build_redirect_table([
+            ("nginx_redirect.conf", load_nginx_rules()),
+            ("generate_redirect.py", load_generated_rules()),
+            ("redirect_map.json", load_redirect_map()),
+        ])
+        _redirect_table = {"table": table, "stats": stats}
+    return _redirect_table["table"]
+
+
+def get_redirect_stats() -> Dict[str, int]:
+    get_redirect_table()
+    return _redirect_table["stats"]
+
+
+def _lookup(table: Dict[str, str], url: str) -> Tuple[Optional[str], str]:
+    """
+    查找 URL 对应的重定向目标，返回 (目标链接, 命中的键)。
+
+    redirect_map.json 中有按锚点区分的映射，先按完整 URL 查找；
+    未命中再去掉锚点查找（与服务器收不到锚点的行为一致），此时目标沿用原锚点。
+    """
+    target = table.get(url)
+    if target is not None:
+        return target, url
+    base, sep, fragment = url.partition("#")
+    if sep:
+        target = table.get(base)
+        if target is not None:
+            return _with_fragment(target, fragment), base
+    return None, url
+
+
+def _with_fragment(url: str, fragment: str) -> str:
+    """与 requests 一致：重定向目标没有锚点时沿用上一跳的锚点"""
+    parsed = urlparse(url)
+    if fragment and not parsed.fragment:
+        parsed = parsed._replace(fragment=fragment)
+    return urlunparse(parsed)
+
+
+def resolve_local(url: str, table: Optional[Dict[str, str]] = None) -> Optional[dict]:
+    """
+    用本地规则解析 URL 的重定向。
+
+    Args:
+        url: 原始 URL
+        table: 规则表（默认使用 get_redirect_table()）
+
+    Returns:
+        与 check_redirects.get_final_url 格式相同的字典，另带 source、verified 字段；
+        第一跳未命中、或重定向成环/过长时返回 None（交给 HTTP 请求）
+    """
+    if table is None:
+        table = get_redirect_table()
+
+    current = requote_uri(url)
+    chain = []
+    seen = set()
+    while True:
+        target, key = _lookup(table, current)
+        if target is None:
+            break
+        if key in seen or len(chain) >= MAX_HOPS:
+            return None
+        seen.add(key)
+        chain.append(current)
+        current = requote_uri(target)
+
+    if not chain:
+        return None
+
+    result = {
+        "original_url": url,
+        "final_url": current,
+        # 最终页面是否存在需要请求后才知道
+        "status_code": None,
+        "redirected": True,
+        "redirect_chain": chain,
+        "error": None
+    }
+    parsed = urlparse(current)
+    result["url_path"] = parsed.path
+    if parsed.fragment:
+        result["url_path"] += f"#{parsed.fragment}"
+    result["source"] = "local"
+    result["verified"] = False
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="用本地规则解析旧文档链接的重定向")
+    parser.add_argument("urls", nargs="*", metavar="URL", help="要解析的链接")
+    parser.add_argument("--stats", action="store_true", help="打印各来源的规则数")
+    args = parser.parse_args()
+
+    table = get_redirect_table()
+    if args.stats or not args.urls:
+        print(f"本地重定向规则 {len(table)} 条：")
+        for name, count in get_redirect_stats().items():
+            print(f"  {name}：{count}")
+    for url in args.urls:
+        result = resolve_local(url, table)
+        if result is None:
+            print(f"{url}\n  ✗ 本地规则未命中")
+            continue
+        print(url)
+        for redirect_url in result["redirect_chain"][1:]:
+            print(f"  → {redirect_url}")
+        print(f"  → 最终：{result['final_url']}")
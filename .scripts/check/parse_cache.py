@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MDX 解析缓存（check_links.py、check_html_tags.py 与 check_all.py 共享）
+
+按文件内容 sha1 缓存每个 MDX 文件的解析结果，持久化到 parse_cache.sqlite：
+- links:            链接与 import 记录（同 check_links.extract_links_from_content）
+- headings:         文件自身产生的锚点（标题、id 属性、ParamField、Steps）
+- heading_imports:  需要合并锚点的 .mdx 导入路径（被导入文件的锚点在使用时递归合并）
+- tags:             HTML 标签事件 [名称, 行号, 列号, 是否开放, 是否自闭合]（同 check_html_tags.extract_html_tags）
+- images:           图片链接（同 extract_images.extract_images_from_content）
+- doc_imports:      import 的 .md/.mdx 文档路径（同 check_sidebars.extract_doc_imports，用于统计孤立页面）
+
+文件的 mtime/size 未变化时直接使用记录的 sha1，不读取文件；变化时读取并计算 sha1，
+内容相同（如 git checkout 后）时仍然命中。文件首次被任一脚本读取时一次性解析出全部结构，
+其他脚本随后直接复用，只有内容变化的文件才会重新解析。
+解析器源码（本文件、check_links.py、check_html_tags.py、extract_images.py、check_sidebars.py）变化后缓存自动失效。
+解析函数取自已登记的检查脚本模块（见 register_extractors），check_links.py 等作为 __main__ 运行时
+不会再导入一份同名模块。
+
+启用方式：check_links.py / check_html_tags.py / check_all.py 加 --parse-cache 参数（git 模式同样支持）。
+check_all.py 遍历一次文档树后，用 MemoryParseStore 把解析结果分发给各检查器。
+
+使用方法：
+python3 .scripts/check/parse_cache.py stats    # 输出缓存统计
+python3 .scripts/check/parse_cache.py clear    # 清空缓存
+"""
+
+import argparse
+import atexit
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import sys
+
+PARSE_CACHE_VERSION = '1'
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_PATH = os.path.join(ROOT_DIR, 'parse_cache.sqlite')
+# 解析结果依赖的源码，任一文件变化都会使缓存失效
+PARSER_SOURCES = ('parse_cache.py', 'check_links.py', 'check_html_tags.py', 'extract_images.py', 'check_sidebars.py')
+PARSED_FIELDS = ('links', 'headings', 'heading_imports', 'tags', 'images', 'doc_imports')
+FLUSH_THRESHOLD = 500  # 累计多少个新解析的文件后写入一次数据库
+# 各字段的解析函数：字段 -> (模块名, 函数名)
+EXTRACTOR_SOURCES = {
+    'links': ('check_links', 'extract_links_from_content'),
+    'headings': ('check_links', 'extract_own_headings_from_content'),
+    'heading_imports': ('check_links', 'extract_heading_imports'),
+    'tags': ('check_html_tags', 'extract_html_tags'),
+    'images': ('extract_images', 'extract_images_from_content'),
+    'doc_imports': ('check_sidebars', 'extract_doc_imports'),
+}
+_extractor_modules = {}  # 模块名 -> 模块，见 register_extractors
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER,
+    sha1 TEXT
+);
+CREATE TABLE IF NOT EXISTS parsed (
+    sha1 TEXT PRIMARY KEY,
+    links TEXT NOT NULL,
+    headings TEXT NOT NULL,
+    heading_imports TEXT NOT NULL,
+    tags TEXT NOT NULL,
+    images TEXT NOT NULL,
+    doc_imports TEXT NOT NULL
+);
+'''
+
+
+def parser_version():
+    """缓存版本：PARSE_CACHE_VERSION 与解析器源码的 sha1"""
+    digest = hashlib.sha1(PARSE_CACHE_VERSION.encode('utf-8'))
+    for name in PARSER_SOURCES:
+        with open(os.path.join(ROOT_DIR, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def read_text(abs_path):
+    """按文本模式的规则读取文件（utf-8，换行统一为 \\n），返回 (内容, 原始字节的 sha1)"""
+    with open(abs_path, 'rb') as f:
+        raw = f.read()
+    content = raw.decode('utf-8')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, hashlib.sha1(raw).hexdigest()
+
+
+def register_extractors(module_name, module):
+    """登记提供解析函数的模块
+
+    check_links.py、check_html_tags.py 作为脚本直接运行时登记自身：此时模块名为 __main__，
+    若由这里按名称导入会得到第二份模块（各自持有一套缓存）。以模块方式导入时无需登记。
+    """
+    _extractor_modules[module_name] = module
+
+
+def _extractor(field):
+    module_name, func_name = EXTRACTOR_SOURCES[field]
+    module = _extractor_modules.get(module_name)
+    if module is None:
+        # 未登记的模块（extract_images、check_sidebars，或尚未导入的检查脚本）在首次解析时导入
+        module = _extractor_modules[module_name] = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+def parse_mdx_content(content, fields=PARSED_FIELDS):
+    """解析出指定的结构（默认全部），返回 {字段: 结果}"""
+    parsed = {field: _extractor(field)(content) for field in fields}
+    if 'tags' in parsed:
+        parsed['tags'] = [[t.name, t.line_num, t.col_num, t.is_opening, t.is_self_closing] for t in parsed['tags']]
+    return parsed
+
+
+class ParseCache:
+    """基于 SQLite 的 MDX 解析缓存
+
+    进程池子进程会各自打开连接；新解析的结果先暂存在内存中，
+    由 flush() 批量写入（累计 FLUSH_THRESHOLD 个文件时也会自动写入）。
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.last_hit = False
+        self._conn = None
+        self._pid = None
+        self._version = None
+        self._pending_files = {}   # 绝对路径 -> ((mtime_ns, size), sha1)
+        self._pending_parsed = {}  # sha1 -> {字段: JSON 文本}
+
+    def _connection(self):
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        # fork 出的子进程不能复用父进程的连接，也不继承父进程尚未写入的数据
+        self._pending_files = {}
+        self._pending_parsed = {}
+        self._conn = sqlite3.connect(self.path, timeout=60)
+        self._pid = os.getpid()
+        self._conn.executescript(_SCHEMA)
+        if self._version is None:
+            self._version = parser_version()
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != self._version:
+            # 解析器变化时清空重建（字段可能变化，因此重建表结构）
+            self._conn.executescript('DROP TABLE files; DROP TABLE parsed;' + _SCHEMA)
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (self._version,))
+            self._conn.commit()
+        return self._conn
+
+    def _known_sha1(self, abs_path, stamp):
+        pending = self._pending_files.get(abs_path)
+        if pending is not None:
+            return pending[1] if pending[0] == stamp else None
+        row = self._connection().execute(
+            'SELECT mtime_ns, size, sha1 FROM files WHERE path = ?', (abs_path,)).fetchone()
+        if row is None or (row[0], row[1]) != stamp:
+            return None
+        return row[2]
+
+    def _lookup(self, sha1, fields):
+        pending = self._pending_parsed.get(sha1)
+        if pending is not None:
+            return {field: json.loads(pending[field]) for field in fields}
+        row = self._connection().execute(
+            f'SELECT {", ".join(fields)} FROM parsed WHERE sha1 = ?', (sha1,)).fetchone()
+        return None if row is None else {field: json.loads(value) for field, value in zip(fields, row)}
+
+    def get(self, file_path, field):
+        """返回文件的某项解析结果；读取失败时抛出与 open()/read() 相同的异常"""
+        return self.get_many(file_path, (field,))[field]
+
+    def get_all(self, file_path):
+        return self.get_many(file_path, PARSED_FIELDS)
+
+    def get_many(self, file_path, fields):
+        """返回文件的多项解析结果 {字段: 结果}"""
+        unknown = [field for field in fields if field not in PARSED_FIELDS]
+        if unknown:
+            raise ValueError(f'未知的解析字段: {", ".join(unknown)}')
+        abs_path = os.path.abspath(file_path)
+        self._connection()
+        # 先取 stat 再读取：读取期间文件被修改时，下次 mtime 不一致会重新读取
+        st = os.stat(abs_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+
+        sha1 = self._known_sha1(abs_path, stamp)
+        if sha1 is not None:
+            value = self._lookup(sha1, fields)
+            if value is not None:
+                self.hits += 1
+                self.last_hit = True
+                return value
+
+        content, sha1 = read_text(abs_path)
+        self._pending_files[abs_path] = (stamp, sha1)
+        value = self._lookup(sha1, fields)
+        if value is not None:
+            # 内容未变化（如 git checkout 后只有 mtime 变化）
+            self.hits += 1
+            self.last_hit = True
+            return value
+
+        self.misses += 1
+        self.last_hit = False
+        parsed = parse_mdx_content(content)
+        self._pending_parsed[sha1] = {name: json.dumps(parsed[name], ensure_ascii=False) for name in PARSED_FIELDS}
+        if len(self._pending_parsed) >= FLUSH_THRESHOLD:
+            self.flush()
+        return {field: parsed[field] for field in fields}
+
+    def flush(self):
+        """把新解析的结果写入数据库"""
+        if self._conn is None or self._pid != os.getpid():
+            return
+        if not self._pending_files and not self._pending_parsed:
+            return
+        with self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO files (path, mtime_ns, size, sha1) VALUES (?, ?, ?, ?)',
+                [(path, stamp[0], stamp[1], sha1) for path, (stamp, sha1) in self._pending_files.items()])
+            self._conn.executemany(
+                f'INSERT OR REPLACE INTO parsed (sha1, {", ".join(PARSED_FIELDS)}) '
+                f'VALUES (?{", ?" * len(PARSED_FIELDS)})',
+                [(sha1, *(data[name] for name in PARSED_FIELDS)) for sha1, data in self._pending_parsed.items()])
+        self._pending_files = {}
+        self._pending_parsed = {}
+
+    def close(self):
+        if self._conn is None or self._pid != os.getpid():
+            return
+        self.flush()
+        self._conn.close()
+        self._conn = None
+
+    def stats(self):
+        conn = self._connection()
+        return {
+            'files': conn.execute('SELECT COUNT(*) FROM files').fetchone()[0],
+            'parsed': conn.execute('SELECT COUNT(*) FROM parsed').fetchone()[0],
+            'size_mb': round(os.path.getsize(self.path) / 1024 / 1024, 1),
+        }
+
+    def clear(self):
+        conn = self._connection()
+        with conn:
+            conn.executescript('DELETE FROM files; DELETE FROM parsed;')
+        conn.execute('VACUUM')
+
+
+class MemoryParseStore:
+    """内存中的解析结果，接口与 ParseCache 相同
+
+    check_all.py 遍历一次文档树、读取解析每个文件后收录到这里，再分发给各检查器。
+    未收录的文件（如实例目录之外被导入的文件）交给 fallback（ParseCache）或直接读取解析后补充收录。
+    """
+
+    def __init__(self, fallback=None, fields=PARSED_FIELDS):
+        self.fallback = fallback
+        self.fields = tuple(fields)
+        self.entries = {}  # 绝对路径 -> {字段: 结果}
+        self.hits = 0
+        self.misses = 0
+        self.last_hit = False
+
+    def add(self, file_path, parsed):
+        self.entries[os.path.abspath(file_path)] = parsed
+
+    def get(self, file_path, field):
+        return self.get_many(file_path, (field,))[field]
+
+    def get_all(self, file_path):
+        return self.get_many(file_path, self.fields)
+
+    def get_many(self, file_path, fields):
+        abs_path = os.path.abspath(file_path)
+        parsed = self.entries.get(abs_path)
+        self.last_hit = parsed is not None and all(field in parsed for field in fields)
+        if self.last_hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+            if self.fallback is not None:
+                parsed = self.fallback.get_all(abs_path)
+            else:
+                content, _ = read_text(abs_path)
+                parsed = parse_mdx_content(content, sorted(set(self.fields) | set(fields), key=PARSED_FIELDS.index))
+            self.entries[abs_path] = parsed
+        return {field: parsed[field] for field in fields}
+
+    def flush(self):
+        if self.fallback is not None:
+            self.fallback.flush()
+
+    def close(self):
+        if self.fallback is not None:
+            self.fallback.close()
+
+
+_active_cache = None  # 当前进程使用的 ParseCache 或 MemoryParseStore，见 enable / activate
+
+
+def enable(path=DEFAULT_CACHE_PATH):
+    """启用解析缓存（进程退出时自动写入）
+
+    进程池子进程需要通过 init_worker 启用：spawn 启动（macOS、Windows 的默认方式）的子进程不继承该设置。
+    """
+    global _active_cache
+    if _active_cache is None:
+        _active_cache = ParseCache(path)
+        atexit.register(_active_cache.close)
+    return _active_cache
+
+
+def activate(cache):
+    """使用指定的解析结果来源（如 check_all.py 的 MemoryParseStore）；传入 None 时停用"""
+    global _active_cache
+    _active_cache = cache
+    return cache
+
+
+def active_path():
+    """当前使用的 SQLite 解析缓存路径（MemoryParseStore 取其 fallback），未启用时返回 None"""
+    cache = _active_cache
+    if isinstance(cache, MemoryParseStore):
+        cache = cache.fallback
+    return cache.path if isinstance(cache, ParseCache) else None
+
+
+def init_worker(path):
+    """进程池 initializer：在子进程中按主进程的设置启用解析缓存
+
+    用法：ProcessPoolExecutor(initializer=parse_cache.init_worker, initargs=(parse_cache.active_path(),))。
+    fork 启动的子进程已继承主进程的设置，此时不做任何事。
+    """
+    if path is not None:
+        enable(path)
+
+
+def get_active():
+    """返回已启用的解析缓存，未启用时返回 None"""
+    return _active_cache
+
+
+def flush_active():
+    """进程池任务结束前调用：子进程退出时不会执行 atexit，需要显式写入"""
+    if _active_cache is not None:
+        _active_cache.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MDX 解析缓存（check_links.py、check_html_tags.py 与 check_all.py 共享）')
+    parser.add_argument('--db', default=DEFAULT_CACHE_PATH, help='缓存数据库路径（默认 parse_cache.sqlite）')
+    sub = parser.add_subparsers(dest='command', required=True)
+    sub.add_parser('stats', help='输出缓存统计信息')
+    sub.add_parser('clear', help='清空缓存')
+    args = parser.parse_args()
+
+    cache = ParseCache(args.db)
+    if args.command == 'clear':
+        cache.clear()
+        print('解析缓存已清空')
+        return 0
+
+    stats = cache.stats()
+    print(f'文件数: {stats["files"]}')
+    print(f'解析结果数: {stats["parsed"]}')
+    print(f'数据库大小: {stats["size_mb"]} MB')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())